@@ -1,3 +1,5 @@
+import logging
+
 import numpy as np
 from typing import Tuple, List, Union, Any
 import bittensor
@@ -7,6 +9,11 @@ U32_MAX = 4294967295
 U16_MAX = 65535
 
 
+def _debug_enabled() -> bool:
+    """Whether debug logs are emitted; guards formatting full weight arrays on every set_weights."""
+    return bittensor.logging.get_level() <= logging.DEBUG
+
+
 def normalize_max_weight(x: np.ndarray, limit: float = 0.1) -> np.ndarray:
     r"""Normalizes the numpy array x so that sum(x) = 1 and the max value is not greater than the limit.
     Args:
@@ -35,8 +42,9 @@ def normalize_max_weight(x: np.ndarray, limit: float = 0.1) -> np.ndarray:
         cumsum = np.cumsum(estimation, 0)
 
         # Determine the index of cutoff
-        estimation_sum = np.array(
-            [(len(values) - i - 1) * estimation[i] for i in range(len(values))]
+        # (number of larger values) * value, in the dtype of the estimation
+        estimation_sum = (
+            np.arange(len(values) - 1, -1, -1, dtype=estimation.dtype) * estimation
         )
         n_values = (
             estimation / (estimation_sum + cumsum + epsilon) < limit
@@ -80,10 +88,12 @@ def convert_weights_and_uids_for_emit(
     non_zero_weight_uids = uids[weights > 0]
 
     # Debugging information
-    bittensor.logging.debug(f"weights: {weights}")
-    bittensor.logging.debug(f"non_zero_weights: {non_zero_weights}")
-    bittensor.logging.debug(f"uids: {uids}")
-    bittensor.logging.debug(f"non_zero_weight_uids: {non_zero_weight_uids}")
+    debug = _debug_enabled()
+    if debug:
+        bittensor.logging.debug(f"weights: {weights}")
+        bittensor.logging.debug(f"non_zero_weights: {non_zero_weights}")
+        bittensor.logging.debug(f"uids: {uids}")
+        bittensor.logging.debug(f"non_zero_weight_uids: {non_zero_weight_uids}")
 
     if np.min(weights) < 0:
         raise ValueError(
@@ -106,25 +116,29 @@ def convert_weights_and_uids_for_emit(
         return [], []  # Nothing to set on chain.
     else:
         max_weight = float(np.max(weights))
-        weights = [
-            float(value) / max_weight for value in weights
-        ]  # max-upscale values (max_weight = 1).
-        bittensor.logging.debug(
-            f"setting on chain max: {max_weight} and weights: {weights}"
-        )
+        with np.errstate(invalid="ignore"):
+            weights = (
+                weights.astype(np.float64) / max_weight
+            )  # max-upscale values (max_weight = 1).
+        if debug:
+            bittensor.logging.debug(
+                f"setting on chain max: {max_weight} and weights: {weights}"
+            )
 
-    weight_vals = []
-    weight_uids = []
-    for i, (weight_i, uid_i) in enumerate(list(zip(weights, uids))):
-        uint16_val = round(
-            float(weight_i) * int(U16_MAX)
-        )  # convert to int representation.
-
-        # Filter zeros
-        if uint16_val != 0:  # Filter zeros
-            weight_vals.append(uint16_val)
-            weight_uids.append(uid_i)
-    bittensor.logging.debug(f"final params: {weight_uids} : {weight_vals}")
+    # Convert to int representation; np.rint rounds half to even like round().
+    uint16_vals = np.rint(weights * int(U16_MAX))
+    if not np.isfinite(uint16_vals).all():
+        raise ValueError(
+            "Passed weights must be finite to be set on chain {}".format(weights)
+        )
+    uint16_vals = uint16_vals.astype(np.int64)
+
+    # Filter zeros
+    keep = uint16_vals != 0
+    weight_vals = uint16_vals[keep].tolist()
+    weight_uids = list(uids[keep])
+    if debug:
+        bittensor.logging.debug(f"final params: {weight_uids} : {weight_vals}")
     return weight_uids, weight_vals
 
 
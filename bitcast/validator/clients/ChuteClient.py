@@ -26,7 +26,7 @@ class ChuteClient(BaseLLMClient):
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10), before_sleep=before_sleep_log(logging.getLogger("bittensor"), logging.WARNING))
     def _make_request(self, model: str, **kwargs) -> Dict[str, Any]:
         """Make Chutes API request with retry logic."""
-        self.request_count += 1
+        self._count_request()
         
         try:
             headers = {
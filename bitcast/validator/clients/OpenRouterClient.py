@@ -24,7 +24,7 @@ class OpenRouterClient(BaseLLMClient):
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
     def _make_request(self, model: str, **kwargs) -> Dict[str, Any]:
         """Make OpenRouter API request with retry logic."""
-        self.request_count += 1
+        self._count_request()
         
         try:
             headers = {
@@ -8,19 +8,81 @@ enabling easy switching between providers via configuration.
 import os
 import re
 import secrets
+import time
 import bittensor as bt
 from abc import ABC, abstractmethod
 from threading import Lock
-from diskcache import Cache
-from typing import Optional, Dict, Any, Tuple
+from diskcache import Cache, FanoutCache
+from diskcache.core import DBNAME
+from typing import Optional, Dict, Any, List, Tuple, Union
 
 from bitcast.validator.utils.config import (
     DISABLE_LLM_CACHING,
     CACHE_DIRS,
+    LLM_CACHE_SHARDS,
+    LLM_CACHE_TIMEOUT,
+    LLM_CACHE_MIGRATE,
     TRANSCRIPT_MAX_LENGTH,
+    TRANSCRIPT_CHUNK_OVERLAP,
+    TRANSCRIPT_MAX_CHUNKS,
     OPENAI_CACHE_EXPIRY
 )
+from bitcast.validator.clients.llm_telemetry import note_request_attempt
 from bitcast.validator.clients.prompts import get_latest_prompt_version
+from bitcast.validator.utils.brief_model import Brief
+from bitcast.validator.utils.singleflight import SingleFlight
+
+
+def _empty_cache_stats() -> Dict[str, float]:
+    return {
+        "writes": 0,
+        "failed_writes": 0,
+        "write_latency_s": 0.0,
+        "max_write_latency_s": 0.0,
+    }
+
+
+def migrate_legacy_cache(directory: str, cache: FanoutCache) -> int:
+    """
+    Move entries of a single-file diskcache.Cache in `directory` into a FanoutCache.
+    
+    Runs once: the legacy database is removed after a successful copy. Remaining
+    expiry times are preserved and already-expired entries are dropped. Only runs
+    on startup when LLM_CACHE_MIGRATE is set.
+    
+    Returns:
+        int: Number of entries migrated
+    """
+    legacy_db = os.path.join(directory, DBNAME)
+    if not os.path.exists(legacy_db):
+        return 0
+
+    migrated = 0
+    legacy = Cache(directory=directory)
+    try:
+        now = time.time()
+        for key in legacy.iterkeys():
+            value, expire_time = legacy.get(key, default=None, expire_time=True)
+            if value is None:
+                continue
+            if expire_time is None:
+                remaining = None
+            else:
+                remaining = expire_time - now
+                if remaining <= 0:
+                    continue
+            if cache.set(key, value, expire=remaining, retry=True):
+                migrated += 1
+        legacy.clear()
+    finally:
+        legacy.close()
+
+    for suffix in ("", "-wal", "-shm"):
+        path = legacy_db + suffix
+        if os.path.exists(path):
+            os.remove(path)
+    bt.logging.info(f"Migrated {migrated} LLM cache entries in {directory} to the sharded cache")
+    return migrated
 
 
 class BaseLLMClient(ABC):
@@ -30,12 +92,20 @@ class BaseLLMClient(ABC):
     
     Subclasses must define BRIEF_EVALUATION_MODEL and PROMPT_INJECTION_MODEL
     as class attributes.
+    
+    Identical evaluations requested concurrently (e.g. the same video submitted by
+    several accounts) are coalesced through the shared `_inflight` singleflight.
     """
     _instance = None
     _lock = Lock()
     _cache = None
     _cache_dir = CACHE_DIRS["openai"]
     _cache_lock = Lock()
+    _cache_shards = LLM_CACHE_SHARDS
+    _cache_migrate = LLM_CACHE_MIGRATE
+    _cache_stats_lock = Lock()
+    _cache_stats = _empty_cache_stats()
+    _inflight = SingleFlight("llm")
 
     def __new__(cls):
         if cls._instance is None:
@@ -43,23 +113,62 @@ class BaseLLMClient(ABC):
                 if cls._instance is None:
                     instance = super().__new__(cls)
                     instance.request_count = 0
+                    instance.calls_saved = 0
+                    instance.cycle_calls_saved = 0
+                    instance._stats_lock = Lock()
                     cls._instance = instance
         return cls._instance
 
+    def _count_request(self) -> None:
+        """Count one provider request attempt; called by the clients on every send, including retries."""
+        with self._stats_lock:
+            self.request_count += 1
+        note_request_attempt()
+
     def reset_request_count(self):
-        self.request_count = 0
+        with self._stats_lock:
+            self.request_count = 0
+            self.calls_saved = 0
+
+    def record_calls_saved(self, count: int) -> None:
+        """Record provider calls avoided by the validation strategy."""
+        if count:
+            with self._stats_lock:
+                self.calls_saved += count
+                self.cycle_calls_saved += count
+
+    def reset_cycle_stats(self) -> None:
+        with self._stats_lock:
+            self.cycle_calls_saved = 0
 
     @classmethod
     def initialize_cache(cls) -> None:
         """Initialize the cache if it hasn't been initialized yet."""
         if cls._cache is None:
             os.makedirs(cls._cache_dir, exist_ok=True)
-            cls._cache = Cache(
-                directory=cls._cache_dir,
-                size_limit=1e9,  # 1GB
-                disk_min_file_size=0,
-                disk_pickle_protocol=4,
-            )
+            if cls._cache_shards > 1:
+                cls._cache = FanoutCache(
+                    directory=cls._cache_dir,
+                    shards=cls._cache_shards,
+                    timeout=LLM_CACHE_TIMEOUT,
+                    size_limit=1e9,  # 1GB across all shards
+                    disk_min_file_size=0,
+                    disk_pickle_protocol=4,
+                )
+                if cls._cache_migrate:
+                    migrate_legacy_cache(cls._cache_dir, cls._cache)
+                elif os.path.exists(os.path.join(cls._cache_dir, DBNAME)):
+                    bt.logging.warning(
+                        f"Legacy LLM cache in {cls._cache_dir} is not used by the sharded cache; "
+                        f"set LLM_CACHE_MIGRATE=True to migrate it"
+                    )
+            else:
+                cls._cache = Cache(
+                    directory=cls._cache_dir,
+                    size_limit=1e9,  # 1GB
+                    disk_min_file_size=0,
+                    disk_pickle_protocol=4,
+                )
 
     @classmethod
     def cleanup(cls) -> None:
@@ -71,12 +180,54 @@ class BaseLLMClient(ABC):
                     cls._cache = None
 
     @classmethod
-    def get_cache(cls) -> Optional[Cache]:
+    def get_cache(cls) -> Optional[Union[Cache, FanoutCache]]:
         """Thread-safe cache access."""
         if cls._cache is None:
             cls.initialize_cache()
         return cls._cache
 
+    @classmethod
+    def cache_set(cls, key: str, value: Any, expire: float = OPENAI_CACHE_EXPIRY) -> bool:
+        """Store a value in the LLM cache, recording the write latency."""
+        return cls._timed_cache_write(lambda cache: cache.set(key, value, expire=expire))
+
+    @classmethod
+    def cache_touch(cls, key: str, expire: float = OPENAI_CACHE_EXPIRY) -> bool:
+        """Reset the expiry of a cached entry (sliding expiration) without rewriting its value."""
+        return cls._timed_cache_write(lambda cache: cache.touch(key, expire=expire))
+
+    @classmethod
+    def _timed_cache_write(cls, write) -> bool:
+        """Run a cache write and record its latency, including any wait for the cache or shard lock."""
+        cache = cls.get_cache()
+        start = time.perf_counter()
+        if isinstance(cache, FanoutCache):
+            # Shards lock independently; a write that times out (LLM_CACHE_TIMEOUT) on a busy shard returns False
+            stored = write(cache)
+        else:
+            with cls._cache_lock:
+                stored = write(cache)
+        latency = time.perf_counter() - start
+
+        with cls._cache_stats_lock:
+            stats = cls._cache_stats
+            stats["writes"] += 1
+            stats["failed_writes"] += 0 if stored else 1
+            stats["write_latency_s"] += latency
+            stats["max_write_latency_s"] = max(stats["max_write_latency_s"], latency)
+        return stored
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, float]:
+        """Return cache write metrics (counts and write latency) since the last reset."""
+        with cls._cache_stats_lock:
+            return dict(cls._cache_stats)
+
+    @classmethod
+    def reset_cache_stats(cls) -> None:
+        with cls._cache_stats_lock:
+            cls._cache_stats.update(_empty_cache_stats())
+
     def __del__(self):
         """Ensure cleanup on object destruction."""
         self.cleanup()
@@ -108,8 +259,41 @@ def crop_transcript(transcript: str) -> str:
     return transcript
 
 
+def split_transcript(
+    transcript: str,
+    window_length: int = TRANSCRIPT_MAX_LENGTH,
+    overlap: int = TRANSCRIPT_CHUNK_OVERLAP,
+    max_windows: int = TRANSCRIPT_MAX_CHUNKS
+) -> List[str]:
+    """
+    Split a transcript into overlapping windows of at most window_length characters.
+    
+    The first window is identical to crop_transcript() output, so verdicts cached
+    for cropped prompts stay valid. Consecutive windows share `overlap` characters
+    so a sentence cut at a boundary is still seen whole by one of them.
+    """
+    if len(transcript) <= window_length:
+        return [transcript]
+    
+    step = max(window_length - overlap, 1)
+    windows = []
+    for start in range(0, len(transcript), step):
+        windows.append(transcript[start:start + window_length])
+        if start + window_length >= len(transcript):
+            break
+        if len(windows) >= max_windows:
+            bt.logging.warning(
+                f"Transcript of {len(transcript)} chars exceeds {max_windows} windows, "
+                f"ignoring content after {start + window_length} chars"
+            )
+            break
+    return windows
+
+
 def get_prompt_version(brief: Dict) -> int:
     """Get the prompt version for a brief, defaulting to the latest available version."""
+    if isinstance(brief, Brief):
+        return brief.prompt_version
     version = brief.get('prompt_version')
     return version if version is not None else get_latest_prompt_version()
 
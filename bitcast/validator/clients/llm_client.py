@@ -11,30 +11,51 @@ Usage:
         check_for_prompt_injection,
         get_llm_client,
         get_llm_request_count,
-        reset_llm_request_count
+        reset_llm_request_count,
+        get_llm_coalesced_count,
+        get_llm_calls_saved,
+        get_llm_cache_stats,
+        get_llm_usage
     )
 """
 
 import time
 import bittensor as bt
 import requests
-from typing import Dict, Any, Tuple
-from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
+from concurrent.futures import as_completed, ThreadPoolExecutor
 
 from bitcast.validator.utils.config import (
     LLM_PROVIDER,
     DISABLE_LLM_CACHING,
-    OPENAI_CACHE_EXPIRY
+    OPENAI_CACHE_EXPIRY,
+    TRANSCRIPT_CHUNKED_EVALUATION,
+    LLM_VALIDATION_STRATEGY
 )
 from bitcast.validator.clients.base_client import (
     BaseLLMClient,
     crop_transcript,
+    split_transcript,
     get_prompt_version,
     parse_llm_response,
     build_injection_prompt
 )
+from bitcast.validator.clients.llm_telemetry import (
+    INJECTION_LABEL,
+    begin_request_attempts,
+    bind_request_meter,
+    get_llm_usage,
+    get_request_attempts,
+    record_llm_cache_hit,
+    record_llm_request,
+    reset_llm_usage,
+)
 from bitcast.validator.clients.prompts import generate_brief_evaluation_prompt
+from bitcast.validator.utils.singleflight import request_digest
+
 
+# Number of independent samples per brief evaluation (pass if any sample passes)
+VALIDATION_SAMPLES = 3
 
 _PROVIDERS: Dict[str, type] = {}
 _cached_client: BaseLLMClient = None
@@ -87,21 +108,77 @@ def reset_llm_request_count() -> None:
     get_llm_client().reset_request_count()
 
 
+def get_llm_coalesced_count() -> int:
+    """Get the number of LLM evaluations served by an identical in-flight request in the current cycle."""
+    return BaseLLMClient._inflight.stats()["coalesced"]
+
+
+def get_llm_calls_saved() -> int:
+    """Get the number of LLM calls avoided by the validation strategy since the last request count reset."""
+    return get_llm_client().calls_saved
+
+
+def get_llm_cycle_calls_saved() -> int:
+    """Get the number of LLM calls avoided by the validation strategy in the current validation cycle."""
+    return get_llm_client().cycle_calls_saved
+
+
+def reset_llm_cycle_stats() -> None:
+    """Reset the per-cycle LLM statistics."""
+    client = get_llm_client()
+    client.reset_cycle_stats()
+    client.reset_cache_stats()
+    client._inflight.reset_stats()
+    reset_llm_usage("cycle")
+
+
 def get_llm_cache():
     """Get the LLM cache from the active client."""
     client = get_llm_client()
     return client.get_cache()
 
 
-def _make_single_brief_evaluation(client: BaseLLMClient, prompt_content: str) -> Dict[str, Any]:
-    """Make a single LLM evaluation call for brief matching."""
-    response = client._make_request(
-        model=client.BRIEF_EVALUATION_MODEL,
-        messages=[{"role": "user", "content": prompt_content}],
-        temperature=0
-    )
+def get_llm_cache_stats() -> Dict[str, float]:
+    """Get LLM cache write metrics for the current cycle: write counts and write latency."""
+    return get_llm_client().get_cache_stats()
+
+
+def _send_prompt(client: BaseLLMClient, model: str, prompt_content: str, labels: Tuple = (None, None)) -> str:
+    """
+    Send a prompt to the provider and record its usage telemetry.
+    
+    Args:
+        labels: (brief_id, prompt_version) the request is attributed to
     
-    content = response["choices"][0]["message"]["content"]
+    Returns:
+        The completion text
+    """
+    begin_request_attempts()
+    start = time.perf_counter()
+    try:
+        response = client._make_request(
+            model=model,
+            messages=[{"role": "user", "content": prompt_content}],
+            temperature=0
+        )
+        content = response["choices"][0]["message"]["content"]
+    except Exception:
+        record_llm_request(
+            client.get_provider_name(), *labels, None, prompt_content, None,
+            time.perf_counter() - start, max(0, get_request_attempts() - 1)
+        )
+        raise
+    
+    record_llm_request(
+        client.get_provider_name(), *labels, response, prompt_content, content,
+        time.perf_counter() - start, max(0, get_request_attempts() - 1)
+    )
+    return content
+
+
+def _make_single_brief_evaluation(client: BaseLLMClient, prompt_content: str, labels: Tuple = (None, None)) -> Dict[str, Any]:
+    """Make a single LLM evaluation call for brief matching."""
+    content = _send_prompt(client, client.BRIEF_EVALUATION_MODEL, prompt_content, labels)
     parsed_result = parse_llm_response(content, "brief_evaluation")
     
     return {
@@ -110,54 +187,136 @@ def _make_single_brief_evaluation(client: BaseLLMClient, prompt_content: str) ->
     }
 
 
+def _run_validation_samples(client: BaseLLMClient, prompt_content: str, labels: Tuple = (None, None)) -> List[Dict[str, Any]]:
+    """
+    Collect evaluation samples according to LLM_VALIDATION_STRATEGY.
+    
+    Since a single YES is decisive, "early_exit" sends all samples at once and
+    returns at the first YES without waiting for the rest, and "speculative" sends
+    one sample and only sends the remaining ones (concurrently) after a NO.
+    Only samples that were never sent are recorded as saved calls.
+    
+    Returns:
+        The samples collected, in completion order for early exit
+    """
+    if LLM_VALIDATION_STRATEGY == "early_exit":
+        return _run_concurrent_samples(client, prompt_content, VALIDATION_SAMPLES, labels, early_exit=True)
+    
+    if LLM_VALIDATION_STRATEGY == "speculative":
+        first = _make_single_brief_evaluation(client, prompt_content, labels)
+        if first["meets_brief"]:
+            client.record_calls_saved(VALIDATION_SAMPLES - 1)
+            return [first]
+        return [first] + _run_concurrent_samples(client, prompt_content, VALIDATION_SAMPLES - 1, labels)
+    
+    return _run_concurrent_samples(client, prompt_content, VALIDATION_SAMPLES, labels)
+
+
+def _run_concurrent_samples(client: BaseLLMClient, prompt_content: str, count: int,
+                            labels: Tuple = (None, None), early_exit: bool = False) -> List[Dict[str, Any]]:
+    """
+    Run `count` samples concurrently.
+    
+    Without early_exit all samples are awaited. With early_exit the first YES is
+    returned immediately: samples not yet started are cancelled (and counted as
+    saved), and requests already on the wire finish in the background, unawaited.
+    """
+    executor = ThreadPoolExecutor(max_workers=count)
+    try:
+        futures = [
+            executor.submit(bind_request_meter(_make_single_brief_evaluation), client, prompt_content, labels)
+            for _ in range(count)
+        ]
+        if not early_exit:
+            return [future.result() for future in futures]
+        
+        results = []
+        for future in as_completed(futures):
+            results.append(future.result())
+            if results[-1]["meets_brief"]:
+                client.record_calls_saved(sum(1 for pending in futures if pending.cancel()))
+                break
+        return results
+    finally:
+        executor.shutdown(wait=not early_exit, cancel_futures=early_exit)
+
+
+def _evaluate_brief_prompt(client: BaseLLMClient, brief: Dict, prompt_content: str, prompt_version: int, label: str = "") -> Tuple[bool, str]:
+    """
+    Resolve the verdict for a single brief evaluation prompt.
+    
+    Concurrent requests for the same prompt share one resolution (one set of
+    provider calls and one cache write).
+    """
+    key = request_digest("brief", client.get_provider_name(), client.BRIEF_EVALUATION_MODEL, prompt_content)
+    return client._inflight.do(key, _resolve_brief_prompt, client, brief, prompt_content, prompt_version, label)
+
+
+def _resolve_brief_prompt(client: BaseLLMClient, brief: Dict, prompt_content: str, prompt_version: int, label: str = "") -> Tuple[bool, str]:
+    """
+    Resolve the verdict for a single brief evaluation prompt, from cache or via triple validation.
+    
+    Collects up to three evaluation samples and applies optimistic logic (pass if any
+    passes) to reduce false negatives from LLM non-determinism.
+    """
+    cache = None if DISABLE_LLM_CACHING else client.get_cache()
+    cached_result = cache.get(prompt_content) if cache is not None else None
+    if cached_result is not None:
+        meets_brief = cached_result["meets_brief"]
+        reasoning = cached_result["reasoning"]
+        
+        # Sliding expiration - reset the timer on access
+        client.cache_touch(prompt_content, expire=OPENAI_CACHE_EXPIRY)
+        record_llm_cache_hit(client.get_provider_name(), brief["id"], prompt_version)
+        
+        emoji = "✅" if meets_brief else "❌"
+        bt.logging.info(f"Meets brief '{brief['id']}' (v{prompt_version}){label}: {meets_brief} {emoji} (cache)")
+        return meets_brief, reasoning
+
+    triple_start = time.time()
+    results = _run_validation_samples(client, prompt_content, (brief["id"], prompt_version))
+    triple_elapsed = time.time() - triple_start
+    bt.logging.info(f"Triple validation for brief '{brief['id']}'{label} completed in {triple_elapsed:.1f}s")
+    
+    # Optimistic: pass if either passes
+    meets_brief = any(r["meets_brief"] for r in results)
+    reasoning = next((r["reasoning"] for r in results if r["meets_brief"]), results[0]["reasoning"])
+    
+    bt.logging.debug(f"Triple validation for '{brief['id']}': {', '.join(str(r['meets_brief']) for r in results)}")
+
+    if cache is not None:
+        client.cache_set(prompt_content, {"meets_brief": meets_brief, "reasoning": reasoning}, expire=OPENAI_CACHE_EXPIRY)
+
+    emoji = "✅" if meets_brief else "❌"
+    bt.logging.info(f"Brief {brief['id']} (v{prompt_version}){label}: {meets_brief} {emoji}")
+    return meets_brief, reasoning
+
+
 def evaluate_content_against_brief(brief: Dict, duration: str, description: str, transcript: str) -> Tuple[bool, str]:
     """
     Evaluate the transcript against the brief using the configured LLM provider.
     
     Returns a tuple of (bool, str) where bool indicates if content meets brief, str is reasoning.
     
-    Runs three concurrent evaluations and applies optimistic logic (pass if any passes)
-    to reduce false negatives from LLM non-determinism.
+    Transcripts longer than TRANSCRIPT_MAX_LENGTH are cropped, unless
+    TRANSCRIPT_CHUNKED_EVALUATION is enabled: the transcript is then split into
+    overlapping windows that are evaluated in order, stopping at the first window
+    that meets the brief. Each window's verdict is cached under its own prompt.
     """
     client = get_llm_client()
-    transcript = crop_transcript(transcript)
+    if TRANSCRIPT_CHUNKED_EVALUATION:
+        windows = split_transcript(transcript)
+    else:
+        windows = [crop_transcript(transcript)]
     prompt_version = get_prompt_version(brief)
-    prompt_content = generate_brief_evaluation_prompt(brief, duration, description, transcript, prompt_version)
 
     try:
-        cache = None if DISABLE_LLM_CACHING else client.get_cache()
-        if cache is not None and prompt_content in cache:
-            cached_result = cache[prompt_content]
-            meets_brief = cached_result["meets_brief"]
-            reasoning = cached_result["reasoning"]
-            
-            with client._cache_lock:
-                cache.set(prompt_content, cached_result, expire=OPENAI_CACHE_EXPIRY)
-            
-            emoji = "✅" if meets_brief else "❌"
-            bt.logging.info(f"Meets brief '{brief['id']}' (v{prompt_version}): {meets_brief} {emoji} (cache)")
-            return meets_brief, reasoning
-
-        # Run three concurrent evaluations
-        triple_start = time.time()
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = [executor.submit(_make_single_brief_evaluation, client, prompt_content) for _ in range(3)]
-            results = [future.result() for future in futures]
-        triple_elapsed = time.time() - triple_start
-        bt.logging.info(f"Triple validation for brief '{brief['id']}' completed in {triple_elapsed:.1f}s")
-        
-        # Optimistic: pass if either passes
-        meets_brief = any(r["meets_brief"] for r in results)
-        reasoning = next((r["reasoning"] for r in results if r["meets_brief"]), results[0]["reasoning"])
-        
-        bt.logging.debug(f"Triple validation for '{brief['id']}': {results[0]['meets_brief']}, {results[1]['meets_brief']}, {results[2]['meets_brief']}")
-
-        if cache is not None:
-            with client._cache_lock:
-                cache.set(prompt_content, {"meets_brief": meets_brief, "reasoning": reasoning}, expire=OPENAI_CACHE_EXPIRY)
-
-        emoji = "✅" if meets_brief else "❌"
-        bt.logging.info(f"Brief {brief['id']} (v{prompt_version}): {meets_brief} {emoji}")
+        for index, window in enumerate(windows):
+            label = f" [window {index + 1}/{len(windows)}]" if len(windows) > 1 else ""
+            prompt_content = generate_brief_evaluation_prompt(brief, duration, description, window, prompt_version)
+            meets_brief, reasoning = _evaluate_brief_prompt(client, brief, prompt_content, prompt_version, label)
+            if meets_brief:
+                break
         return meets_brief, reasoning
 
     except requests.exceptions.RequestException as e:
@@ -179,35 +338,8 @@ def check_for_prompt_injection(description: str, transcript: str) -> bool:
     injection_prompt, injection_prompt_template = build_injection_prompt(description, transcript)
 
     try:
-        cache = None if DISABLE_LLM_CACHING else client.get_cache()
-        if cache is not None and injection_prompt_template in cache:
-            injection_detected = cache[injection_prompt_template]
-            
-            # Implement sliding expiration - reset the 24-hour timer on access
-            with client._cache_lock:
-                cache.set(injection_prompt_template, injection_detected, expire=OPENAI_CACHE_EXPIRY)
-            
-            bt.logging.info(f"Prompt Injection: {injection_detected} (cache)")
-            return injection_detected
-
-        # Make request to LLM
-        response = client._make_request(
-            model=client.PROMPT_INJECTION_MODEL,
-            messages=[{"role": "user", "content": injection_prompt}],
-            temperature=0
-        )
-        
-        # Parse text response
-        content = response["choices"][0]["message"]["content"]
-        parsed_result = parse_llm_response(content, "prompt_injection")
-        injection_detected = parsed_result["injection_detected"]
-
-        if cache is not None:
-            with client._cache_lock:
-                cache.set(injection_prompt_template, injection_detected, expire=OPENAI_CACHE_EXPIRY)
-
-        bt.logging.info(f"Prompt Injection Check: {'Failed' if injection_detected else 'Passed'}")
-        return injection_detected
+        key = request_digest("injection", client.get_provider_name(), client.PROMPT_INJECTION_MODEL, injection_prompt_template)
+        return client._inflight.do(key, _resolve_prompt_injection, client, injection_prompt, injection_prompt_template)
 
     except requests.exceptions.RequestException as e:
         bt.logging.error(f"{client.get_provider_name()} API error during prompt injection check: {e}")
@@ -215,3 +347,29 @@ def check_for_prompt_injection(description: str, transcript: str) -> bool:
     except Exception as e:
         bt.logging.error(f"Unexpected error during prompt injection check: {e}")
         return False
+
+
+def _resolve_prompt_injection(client: BaseLLMClient, injection_prompt: str, injection_prompt_template: str) -> bool:
+    """Resolve the prompt injection verdict from cache or via the LLM."""
+    cache = None if DISABLE_LLM_CACHING else client.get_cache()
+    injection_detected = cache.get(injection_prompt_template) if cache is not None else None
+    if injection_detected is not None:
+        # Implement sliding expiration - reset the timer on access
+        client.cache_touch(injection_prompt_template, expire=OPENAI_CACHE_EXPIRY)
+        record_llm_cache_hit(client.get_provider_name(), INJECTION_LABEL, None)
+        
+        bt.logging.info(f"Prompt Injection: {injection_detected} (cache)")
+        return injection_detected
+
+    # Make request to LLM
+    content = _send_prompt(client, client.PROMPT_INJECTION_MODEL, injection_prompt, (INJECTION_LABEL, None))
+    
+    # Parse text response
+    parsed_result = parse_llm_response(content, "prompt_injection")
+    injection_detected = parsed_result["injection_detected"]
+
+    if cache is not None:
+        client.cache_set(injection_prompt_template, injection_detected, expire=OPENAI_CACHE_EXPIRY)
+
+    bt.logging.info(f"Prompt Injection Check: {'Failed' if injection_detected else 'Passed'}")
+    return injection_detected
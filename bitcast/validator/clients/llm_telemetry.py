@@ -0,0 +1,230 @@
+"""
+Thread-safe LLM usage telemetry.
+
+Records requests, cache hits, prompt/completion tokens, latency and retries for
+every LLM call, broken down by provider, brief and prompt version. Token counts
+come from the provider's `usage` field; when a provider omits it they are
+estimated locally from the text length and the request is flagged as estimated.
+
+Two scopes are kept: "account" (reset for every evaluated token, exported in
+performance_stats) and "cycle" (reset at the start of each validation cycle,
+exported with the published run data).
+
+A RequestMeter counts the provider requests made on behalf of one piece of work
+(e.g. one video's brief evaluations), unlike the process-wide request counter
+which also sees concurrent injection checks. The meter is bound to the calling
+thread with metered() and carried into worker threads with bind_request_meter().
+"""
+
+from contextlib import contextmanager
+from threading import Lock, local
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# Upper bounds (seconds) of the latency histogram buckets; slower requests go to "inf"
+LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, 20, 30, 60, 90)
+
+# Rough characters-per-token ratio used when the provider reports no usage
+CHARS_PER_TOKEN = 4
+
+INJECTION_LABEL = "prompt_injection"
+
+SCOPES = ("account", "cycle")
+
+_attempts = local()
+_meters = local()
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Estimate the token count of a text."""
+    if not text:
+        return 0
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def begin_request_attempts() -> None:
+    """Start counting provider attempts (including retries) for a request in this thread."""
+    _attempts.count = 0
+
+
+def note_request_attempt() -> None:
+    """Count one provider attempt in this thread; called by the clients on every send."""
+    _attempts.count = getattr(_attempts, "count", 0) + 1
+    meter = get_request_meter()
+    if meter is not None:
+        meter.add(1)
+
+
+def get_request_attempts() -> int:
+    return getattr(_attempts, "count", 0)
+
+
+class RequestMeter:
+    """Thread-safe count of the provider requests (including retries) made for one piece of work."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.requests = 0
+
+    def add(self, count: int) -> None:
+        with self._lock:
+            self.requests += count
+
+
+def get_request_meter() -> Optional[RequestMeter]:
+    """Return the meter bound to this thread, if any."""
+    return getattr(_meters, "current", None)
+
+
+@contextmanager
+def metered(meter: Optional[RequestMeter]) -> Iterator[Optional[RequestMeter]]:
+    """Charge provider requests made in this thread to meter while the block runs."""
+    previous = get_request_meter()
+    _meters.current = meter
+    try:
+        yield meter
+    finally:
+        _meters.current = previous
+
+
+def bind_request_meter(fn: Callable) -> Callable:
+    """Wrap fn so it charges the calling thread's meter when run in another thread."""
+    meter = get_request_meter()
+    if meter is None:
+        return fn
+
+    def run(*args, **kwargs):
+        with metered(meter):
+            return fn(*args, **kwargs)
+    return run
+
+
+def _latency_bucket(latency_s: float) -> str:
+    for bound in LATENCY_BUCKETS:
+        if latency_s <= bound:
+            return f"le_{bound}s"
+    return "inf"
+
+
+def _empty_counters() -> Dict[str, Any]:
+    return {
+        "requests": 0,
+        "failed_requests": 0,
+        "cache_hits": 0,
+        "retries": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "estimated_token_requests": 0,
+        "latency_s": 0.0,
+        "max_latency_s": 0.0,
+        "latency_histogram": {},
+    }
+
+
+class LLMUsageStats:
+    """Usage counters for one scope, in total and per provider, brief and prompt version."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals = _empty_counters()
+            self._breakdowns = {"provider": {}, "brief": {}, "prompt_version": {}}
+
+    def _targets(self, provider, brief_id, prompt_version):
+        targets = [self._totals]
+        for dimension, label in (("provider", provider), ("brief", brief_id), ("prompt_version", prompt_version)):
+            if label is not None:
+                targets.append(self._breakdowns[dimension].setdefault(str(label), _empty_counters()))
+        return targets
+
+    def record_request(self, provider: str, brief_id: Optional[str], prompt_version: Optional[int],
+                       prompt_tokens: int, completion_tokens: int, estimated: bool,
+                       latency_s: float, retries: int, failed: bool) -> None:
+        bucket = _latency_bucket(latency_s)
+        with self._lock:
+            for counters in self._targets(provider, brief_id, prompt_version):
+                counters["requests"] += 1
+                counters["failed_requests"] += int(failed)
+                counters["retries"] += retries
+                counters["prompt_tokens"] += prompt_tokens
+                counters["completion_tokens"] += completion_tokens
+                counters["estimated_token_requests"] += int(estimated)
+                counters["latency_s"] += latency_s
+                counters["max_latency_s"] = max(counters["max_latency_s"], latency_s)
+                counters["latency_histogram"][bucket] = counters["latency_histogram"].get(bucket, 0) + 1
+
+    def record_cache_hit(self, provider: str, brief_id: Optional[str], prompt_version: Optional[int]) -> None:
+        with self._lock:
+            for counters in self._targets(provider, brief_id, prompt_version):
+                counters["cache_hits"] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a JSON-serializable copy of the counters."""
+        with self._lock:
+            return {
+                "totals": _copy_counters(self._totals),
+                **{
+                    f"by_{dimension}": {label: _copy_counters(c) for label, c in breakdown.items()}
+                    for dimension, breakdown in self._breakdowns.items()
+                },
+            }
+
+
+def _copy_counters(counters: Dict[str, Any]) -> Dict[str, Any]:
+    copy = dict(counters)
+    copy["latency_histogram"] = dict(counters["latency_histogram"])
+    copy["latency_s"] = round(counters["latency_s"], 3)
+    copy["max_latency_s"] = round(counters["max_latency_s"], 3)
+    return copy
+
+
+_scopes = {scope: LLMUsageStats() for scope in SCOPES}
+
+
+def record_llm_request(provider: str, brief_id: Optional[str], prompt_version: Optional[int],
+                       response: Optional[Dict[str, Any]], prompt: str, completion: Optional[str],
+                       latency_s: float, retries: int = 0) -> None:
+    """
+    Record a completed (or failed, when response is None) LLM request in every scope.
+
+    Args:
+        provider: Provider name
+        brief_id: Brief the request evaluated, INJECTION_LABEL for injection checks
+        prompt_version: Prompt version, None when not applicable
+        response: Provider response, None if the request failed
+        prompt: Prompt text, used for the token estimate
+        completion: Completion text, used for the token estimate
+        latency_s: Wall time including retries
+        retries: Attempts beyond the first
+    """
+    usage = (response or {}).get("usage") or {}
+    prompt_tokens = usage.get("prompt_tokens")
+    completion_tokens = usage.get("completion_tokens")
+    estimated = response is not None and (prompt_tokens is None or completion_tokens is None)
+    if prompt_tokens is None:
+        prompt_tokens = estimate_tokens(prompt) if response is not None else 0
+    if completion_tokens is None:
+        completion_tokens = estimate_tokens(completion)
+    for stats in _scopes.values():
+        stats.record_request(
+            provider, brief_id, prompt_version, int(prompt_tokens), int(completion_tokens),
+            estimated, latency_s, retries, failed=response is None
+        )
+
+
+def record_llm_cache_hit(provider: str, brief_id: Optional[str], prompt_version: Optional[int]) -> None:
+    """Record a verdict served from the LLM cache in every scope."""
+    for stats in _scopes.values():
+        stats.record_cache_hit(provider, brief_id, prompt_version)
+
+
+def get_llm_usage(scope: str = "cycle") -> Dict[str, Any]:
+    """Get a snapshot of LLM usage for the "account" or "cycle" scope."""
+    return _scopes[scope].snapshot()
+
+
+def reset_llm_usage(scope: str) -> None:
+    """Reset LLM usage for the "account" or "cycle" scope."""
+    _scopes[scope].reset()
@@ -3,6 +3,7 @@ import bittensor as bt
 
 # New reward system imports
 from bitcast.validator.reward_engine.orchestrator import RewardOrchestrator
+from bitcast.validator.reward_engine.models.stats_list import set_stats_value
 from bitcast.validator.platforms.youtube.youtube_evaluator import YouTubeEvaluator
 
 from bitcast.utils.uids import get_all_uids
@@ -59,7 +60,7 @@ async def forward(self):
         bt.logging.info("UID Rewards:")
         for i, (uid, reward) in enumerate(zip(miner_uids, rewards)):
             bt.logging.info(f"UID {uid}: {reward}")
-            yt_stats_list[i]["reward"] = float(reward)
+            set_stats_value(yt_stats_list, i, "reward", float(reward))
 
         # Update the scores based on the rewards
         self.update_scores(rewards, miner_uids)
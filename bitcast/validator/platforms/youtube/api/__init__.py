@@ -6,7 +6,12 @@ from .channel import (
     get_channel_data,
 )
 from .clients import initialize_youtube_clients
-from .transcript import _fetch_transcript, get_video_transcript
+from .transcript import (
+    _fetch_transcript,
+    get_transcript_coalesced_count,
+    get_video_transcript,
+    reset_transcript_coalesced_count,
+)
 from .video import (
     _fallback_via_search,
     _get_uploads_playlist_id,
@@ -29,5 +34,7 @@ __all__ = [
     '_get_uploads_playlist_id',
     '_fallback_via_search',
     'get_video_transcript',
+    'get_transcript_coalesced_count',
+    'reset_transcript_coalesced_count',
     '_fetch_transcript'
 ] 
\ No newline at end of file
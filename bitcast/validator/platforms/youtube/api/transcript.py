@@ -3,6 +3,10 @@ import requests
 from tenacity import retry, RetryError, stop_after_attempt, wait_fixed
 
 from bitcast.validator.utils.config import TRANSCRIPT_MAX_RETRY
+from bitcast.validator.utils.singleflight import SingleFlight
+
+# Concurrent fetches of the same video's transcript share one request
+_transcript_flight = SingleFlight("transcript")
 
 # ============================================================================
 # Transcript API Functions
@@ -31,6 +35,16 @@ def _fetch_transcript(video_id, rapid_api_key):
 def get_video_transcript(video_id, rapid_api_key):
     """Get video transcript with error handling."""
     try:
-        return _fetch_transcript(video_id, rapid_api_key)
+        return _transcript_flight.do(video_id, _fetch_transcript, video_id, rapid_api_key)
     except RetryError:
-        return None 
\ No newline at end of file
+        return None
+
+
+def get_transcript_coalesced_count():
+    """Get the number of transcript fetches that were served by an identical in-flight request."""
+    return _transcript_flight.stats()["coalesced"]
+
+
+def reset_transcript_coalesced_count():
+    """Reset the transcript coalescing counters (once per validation cycle)."""
+    _transcript_flight.reset_stats()
@@ -12,11 +12,14 @@ from .channel import calculate_channel_age, check_channel_criteria, vet_channel
 from .score_cap import (
     calculate_median_from_analytics,
     get_cap_period_dates,
+    get_median_cache_stats,
+    median_cache_channel,
     pad_missing_days_with_zeros,
+    reset_median_cache,
 )
 
 # Scoring functions
-from .scoring import calculate_video_score
+from .scoring import calculate_video_score, calculate_video_scores_batch
 
 # Video evaluation functions  
 from .video import (
@@ -54,6 +57,7 @@ __all__ = [
     
     # Scoring
     'calculate_video_score',
+    'calculate_video_scores_batch',
     
     # Note: Dual scoring utilities removed - replaced with curve-based scoring
     
@@ -61,4 +65,7 @@ __all__ = [
     'get_cap_period_dates',
     'pad_missing_days_with_zeros',
     'calculate_median_from_analytics',
+    'get_median_cache_stats',
+    'median_cache_channel',
+    'reset_median_cache',
 ] 
\ No newline at end of file
@@ -17,6 +17,7 @@ from bitcast.validator.utils.config import (
     YT_MIN_MINS_WATCHED,
     YT_MIN_SUBS,
 )
+from bitcast.validator.utils.cycle_context import get_active_cycle
 
 
 def vet_channel(channel_data, channel_analytics, min_stake=False):
@@ -63,7 +64,9 @@ def calculate_channel_age(channel_data):
     except ValueError:
         channel_start_date = datetime.strptime(channel_data["channel_start"], '%Y-%m-%dT%H:%M:%SZ')
 
-    return (datetime.now() - channel_start_date).days
+    cycle = get_active_cycle()
+    now = cycle.now if cycle is not None else datetime.now()
+    return (now - channel_start_date).days
 
 
 def check_channel_criteria(channel_data, channel_analytics, channel_age_days, min_stake=False):
@@ -3,20 +3,29 @@ Curve-based scoring implementation for YouTube video evaluation.
 
 This module implements the core curve-based scoring algorithm that replaces
 the simple average-based scoring with a diminishing returns curve approach.
+
+calculate_curve_based_scores_batch scores all matched videos of an account in one
+pass over a shared videos x days matrix, with results identical to calling
+calculate_curve_based_score for each video.
 """
 
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 import bittensor as bt
+import numpy as np
 
+from bitcast.validator.utils.cycle_context import get_active_cycle
 from bitcast.validator.utils.config import (
     YT_ROLLING_WINDOW,
     YT_REWARD_DELAY,
     YT_NON_YPP_REVENUE_MULTIPLIER
 )
-from .curve_scoring import calculate_curve_difference
-from .data_processing import get_period_averages
+from .curve_scoring import calculate_curve_difference, calculate_curve_values
+from .data_processing import _daily_metric_column, get_period_averages, get_period_averages_batch
+
+REVENUE_METRIC = "estimatedRedPartnerRevenue"
+MINUTES_METRIC = "estimatedMinutesWatched"
 
 
 def _has_zero_total_revenue(daily_analytics: List[Dict[str, Any]]) -> tuple[bool, float]:
@@ -47,6 +56,29 @@ def _has_zero_total_revenue(daily_analytics: List[Dict[str, Any]]) -> tuple[bool
     return total_revenue == 0.0, total_revenue
 
 
+def _get_scoring_periods() -> tuple[str, str, str, str]:
+    """Return (day1_start, day1_end, day2_start, day2_end) for scoring as of today."""
+    cycle = get_active_cycle()
+    if cycle is not None:
+        return cycle.scoring_periods
+    
+    today = datetime.now()
+    
+    # Day 1 period (earlier period): 7 days ending (YT_REWARD_DELAY + 1) days ago
+    day1_start_offset = YT_REWARD_DELAY + 1 + YT_ROLLING_WINDOW - 1  # T - 4 - 7 + 1 = T - 10
+    day1_end_offset = YT_REWARD_DELAY + 1  # T - 4
+    day1_start = (today - timedelta(days=day1_start_offset)).strftime('%Y-%m-%d')
+    day1_end = (today - timedelta(days=day1_end_offset)).strftime('%Y-%m-%d')
+    
+    # Day 2 period (later period): 7 days ending YT_REWARD_DELAY days ago  
+    day2_start_offset = YT_REWARD_DELAY + YT_ROLLING_WINDOW - 1  # T - 3 - 7 + 1 = T - 9
+    day2_end_offset = YT_REWARD_DELAY  # T - 3
+    day2_start = (today - timedelta(days=day2_start_offset)).strftime('%Y-%m-%d')
+    day2_end = (today - timedelta(days=day2_end_offset)).strftime('%Y-%m-%d')
+    
+    return day1_start, day1_end, day2_start, day2_end
+
+
 def calculate_curve_based_score(
     daily_analytics: List[Dict[str, Any]], 
     start_date: str, 
@@ -91,19 +123,7 @@ def calculate_curve_based_score(
     
     try:
         # Calculate the two periods needed for curve scoring
-        today = datetime.now()
-        
-        # Day 1 period (earlier period): 7 days ending (YT_REWARD_DELAY + 1) days ago
-        day1_start_offset = YT_REWARD_DELAY + 1 + YT_ROLLING_WINDOW - 1  # T - 4 - 7 + 1 = T - 10
-        day1_end_offset = YT_REWARD_DELAY + 1  # T - 4
-        day1_start = (today - timedelta(days=day1_start_offset)).strftime('%Y-%m-%d')
-        day1_end = (today - timedelta(days=day1_end_offset)).strftime('%Y-%m-%d')
-        
-        # Day 2 period (later period): 7 days ending YT_REWARD_DELAY days ago  
-        day2_start_offset = YT_REWARD_DELAY + YT_ROLLING_WINDOW - 1  # T - 3 - 7 + 1 = T - 9
-        day2_end_offset = YT_REWARD_DELAY  # T - 3
-        day2_start = (today - timedelta(days=day2_start_offset)).strftime('%Y-%m-%d')
-        day2_end = (today - timedelta(days=day2_end_offset)).strftime('%Y-%m-%d')
+        day1_start, day1_end, day2_start, day2_end = _get_scoring_periods()
         
         # Route to appropriate scoring method
         if is_ypp_account:
@@ -120,15 +140,7 @@ def calculate_curve_based_score(
                     result["scoring_method"] = "ypp_zero_revenue"
                 else:
                     bt.logging.info(f"YPP zero revenue with min_stake=False - score=0")
-                    return {
-                        "score": 0.0,
-                        "scoring_method": "ypp_zero_revenue_no_stake",
-                        "daily_analytics": daily_analytics,
-                        "curve_input_day1": 0.0,
-                        "curve_input_day2": 0.0,
-                        "zero_revenue_detected": True,
-                        "min_stake_met": False
-                    }
+                    return _zero_revenue_no_stake_result(daily_analytics)
             else:
                 result = _calculate_ypp_curve_score(
                     daily_analytics, day1_start, day1_end, day2_start, day2_end,
@@ -145,14 +157,30 @@ def calculate_curve_based_score(
             
     except Exception as e:
         bt.logging.error(f"=== CURVE-BASED SCORING ERROR{video_info}: {e} ===")
-        return {
-            "score": 0.0,
-            "daily_analytics": daily_analytics,
-            "scoring_method": "curve_error_fallback",
-            "curve_input_day1": 0.0,
-            "curve_input_day2": 0.0,
-            "error": str(e)
-        }
+        return _curve_error_result(daily_analytics, e)
+
+
+def _zero_revenue_no_stake_result(daily_analytics: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "score": 0.0,
+        "scoring_method": "ypp_zero_revenue_no_stake",
+        "daily_analytics": daily_analytics,
+        "curve_input_day1": 0.0,
+        "curve_input_day2": 0.0,
+        "zero_revenue_detected": True,
+        "min_stake_met": False
+    }
+
+
+def _curve_error_result(daily_analytics: List[Dict[str, Any]], error: Exception) -> Dict[str, Any]:
+    return {
+        "score": 0.0,
+        "daily_analytics": daily_analytics,
+        "scoring_method": "curve_error_fallback",
+        "curve_input_day1": 0.0,
+        "curve_input_day2": 0.0,
+        "error": str(error)
+    }
 
 
 def _calculate_ypp_curve_score(
@@ -181,7 +209,7 @@ def _calculate_ypp_curve_score(
         # Get period averages with median capping applied
         day1_avg, day2_avg = get_period_averages(
             daily_analytics,
-            "estimatedRedPartnerRevenue",
+            REVENUE_METRIC,
             day1_start, day1_end,
             day2_start, day2_end,
             YT_ROLLING_WINDOW,
@@ -192,20 +220,10 @@ def _calculate_ypp_curve_score(
         # Calculate curve difference (this is the score)
         score = calculate_curve_difference(day1_avg, day2_avg)
         
-        return {
-            "score": score,
-            "daily_analytics": daily_analytics,
-            "scoring_method": "ypp_curve_based",
-            "day1_average": day1_avg,
-            "day2_average": day2_avg,
-            "curve_input_day1": day1_avg,
-            "curve_input_day2": day2_avg,
-            "median_capping_applied": channel_analytics is not None,
-            "periods": {
-                "day1": f"{day1_start} to {day1_end}",
-                "day2": f"{day2_start} to {day2_end}"
-            }
-        }
+        return _ypp_curve_result(
+            daily_analytics, score, day1_avg, day2_avg,
+            (day1_start, day1_end, day2_start, day2_end), channel_analytics
+        )
         
     except Exception as e:
         bt.logging.error(f"YPP Curve Scoring Error: {e}")
@@ -248,7 +266,7 @@ def _calculate_non_ypp_curve_score(
         # Get period averages for minutes watched with median capping applied
         day1_minutes_avg, day2_minutes_avg = get_period_averages(
             daily_analytics,
-            "estimatedMinutesWatched",
+            MINUTES_METRIC,
             day1_start, day1_end,
             day2_start, day2_end,
             YT_ROLLING_WINDOW,
@@ -263,23 +281,11 @@ def _calculate_non_ypp_curve_score(
         # Calculate curve difference (this is the score)
         score = calculate_curve_difference(day1_revenue_avg, day2_revenue_avg)
         
-        return {
-            "score": score,
-            "daily_analytics": daily_analytics,
-            "scoring_method": "non_ypp_curve_based",
-            "day1_minutes_average": day1_minutes_avg,
-            "day2_minutes_average": day2_minutes_avg,
-            "day1_revenue_estimate": day1_revenue_avg,
-            "day2_revenue_estimate": day2_revenue_avg,
-            "curve_input_day1": day1_revenue_avg,
-            "curve_input_day2": day2_revenue_avg,
-            "revenue_multiplier": YT_NON_YPP_REVENUE_MULTIPLIER,
-            "median_capping_applied": channel_analytics is not None,
-            "periods": {
-                "day1": f"{day1_start} to {day1_end}",
-                "day2": f"{day2_start} to {day2_end}"
-            }
-        }
+        return _non_ypp_curve_result(
+            daily_analytics, score, day1_minutes_avg, day2_minutes_avg,
+            day1_revenue_avg, day2_revenue_avg,
+            (day1_start, day1_end, day2_start, day2_end), channel_analytics
+        )
         
     except Exception as e:
         bt.logging.error(f"Non-YPP Curve Scoring Error: {e}")
@@ -293,3 +299,186 @@ def _calculate_non_ypp_curve_score(
         }
 
 
+def _format_periods(periods: tuple[str, str, str, str]) -> Dict[str, str]:
+    day1_start, day1_end, day2_start, day2_end = periods
+    return {
+        "day1": f"{day1_start} to {day1_end}",
+        "day2": f"{day2_start} to {day2_end}"
+    }
+
+
+def _ypp_curve_result(
+    daily_analytics: List[Dict[str, Any]],
+    score: float,
+    day1_avg: float,
+    day2_avg: float,
+    periods: tuple[str, str, str, str],
+    channel_analytics: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    return {
+        "score": score,
+        "daily_analytics": daily_analytics,
+        "scoring_method": "ypp_curve_based",
+        "day1_average": day1_avg,
+        "day2_average": day2_avg,
+        "curve_input_day1": day1_avg,
+        "curve_input_day2": day2_avg,
+        "median_capping_applied": channel_analytics is not None,
+        "periods": _format_periods(periods)
+    }
+
+
+def _non_ypp_curve_result(
+    daily_analytics: List[Dict[str, Any]],
+    score: float,
+    day1_minutes_avg: float,
+    day2_minutes_avg: float,
+    day1_revenue_avg: float,
+    day2_revenue_avg: float,
+    periods: tuple[str, str, str, str],
+    channel_analytics: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    return {
+        "score": score,
+        "daily_analytics": daily_analytics,
+        "scoring_method": "non_ypp_curve_based",
+        "day1_minutes_average": day1_minutes_avg,
+        "day2_minutes_average": day2_minutes_avg,
+        "day1_revenue_estimate": day1_revenue_avg,
+        "day2_revenue_estimate": day2_revenue_avg,
+        "curve_input_day1": day1_revenue_avg,
+        "curve_input_day2": day2_revenue_avg,
+        "revenue_multiplier": YT_NON_YPP_REVENUE_MULTIPLIER,
+        "median_capping_applied": channel_analytics is not None,
+        "periods": _format_periods(periods)
+    }
+
+
+def calculate_curve_based_scores_batch(
+    daily_analytics_list: List[List[Dict[str, Any]]],
+    is_ypp_account: bool,
+    channel_analytics: Optional[Dict[str, Any]] = None,
+    video_ids: Optional[List[Optional[str]]] = None,
+    min_stake: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Calculate curve-based scores for all videos of an account in one pass.
+    
+    Scoring periods are computed once. Videos are routed exactly as in
+    calculate_curve_based_score, then grouped by scored metric; each group's
+    period averages, proportional scaling and curve values are computed on a
+    shared videos x days matrix. Videos whose rows the columnar path cannot
+    handle are scored individually.
+    
+    Args:
+        daily_analytics_list: Daily analytics data per video
+        is_ypp_account: Whether this is a YPP account
+        channel_analytics: Optional channel analytics for median capping
+        video_ids: Optional video IDs for logging, aligned with daily_analytics_list
+        min_stake: Whether the miner meets minimum stake requirements
+        
+    Returns:
+        List of result dicts, identical to calculate_curve_based_score per video
+    """
+    if video_ids is None:
+        video_ids = [None] * len(daily_analytics_list)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(daily_analytics_list)
+    groups = {REVENUE_METRIC: [], MINUTES_METRIC: []}
+    zero_revenue = set()
+    
+    try:
+        periods = _get_scoring_periods()
+    except Exception as e:
+        bt.logging.error(f"=== BATCH CURVE-BASED SCORING ERROR: {e} ===")
+        return [_curve_error_result(daily_analytics, e) for daily_analytics in daily_analytics_list]
+    
+    # Route each video to its scoring metric
+    for i, (daily_analytics, video_id) in enumerate(zip(daily_analytics_list, video_ids)):
+        video_info = f" [Video: {video_id}]" if video_id else ""
+        bt.logging.info(f"=== CURVE-BASED SCORING START{video_info}: YPP={is_ypp_account} ===")
+        if not is_ypp_account:
+            groups[MINUTES_METRIC].append(i)
+            continue
+        try:
+            is_zero_revenue, _ = _has_zero_total_revenue(daily_analytics)
+        except Exception as e:
+            bt.logging.error(f"=== CURVE-BASED SCORING ERROR{video_info}: {e} ===")
+            results[i] = _curve_error_result(daily_analytics, e)
+            continue
+        if not is_zero_revenue:
+            groups[REVENUE_METRIC].append(i)
+        elif min_stake:
+            bt.logging.info(f"YPP zero revenue with min_stake=True - using Non-YPP scoring")
+            groups[MINUTES_METRIC].append(i)
+            zero_revenue.add(i)
+        else:
+            bt.logging.info(f"YPP zero revenue with min_stake=False - score=0")
+            results[i] = _zero_revenue_no_stake_result(daily_analytics)
+    
+    for metric_key, indices in groups.items():
+        if indices:
+            _score_metric_group(daily_analytics_list, indices, metric_key, periods, channel_analytics, results)
+    
+    for i, video_id in enumerate(video_ids):
+        if i in zero_revenue:
+            results[i]["scoring_method"] = "ypp_zero_revenue"
+        if results[i]["scoring_method"] not in ("ypp_zero_revenue_no_stake", "curve_error_fallback"):
+            video_info = f" [Video: {video_id}]" if video_id else ""
+            bt.logging.info(f"=== CURVE-BASED SCORING COMPLETE{video_info}: Final score={results[i].get('score', 0):.6f} ===")
+    
+    return results
+
+
+def _score_metric_group(
+    daily_analytics_list: List[List[Dict[str, Any]]],
+    indices: List[int],
+    metric_key: str,
+    periods: tuple[str, str, str, str],
+    channel_analytics: Optional[Dict[str, Any]],
+    results: List[Optional[Dict[str, Any]]]
+) -> None:
+    """Score the videos at indices on metric_key, writing their results in place."""
+    day1_start, day1_end, day2_start, day2_end = periods
+    scalar_scorer = _calculate_ypp_curve_score if metric_key == REVENUE_METRIC else _calculate_non_ypp_curve_score
+    
+    batch_indices = []
+    columns = []
+    for i in indices:
+        column = _daily_metric_column(daily_analytics_list[i], metric_key)
+        if column is None:
+            results[i] = scalar_scorer(daily_analytics_list[i], *periods, channel_analytics)
+        else:
+            batch_indices.append(i)
+            columns.append(column)
+    if not batch_indices:
+        return
+    
+    try:
+        day1_avgs, day2_avgs = get_period_averages_batch(
+            columns, metric_key, day1_start, day1_end, day2_start, day2_end,
+            YT_ROLLING_WINDOW, channel_analytics=channel_analytics,
+            is_ypp_account=metric_key == REVENUE_METRIC
+        )
+        if metric_key == REVENUE_METRIC:
+            day1_inputs, day2_inputs = np.asarray(day1_avgs), np.asarray(day2_avgs)
+        else:
+            day1_inputs = np.asarray(day1_avgs) * YT_NON_YPP_REVENUE_MULTIPLIER
+            day2_inputs = np.asarray(day2_avgs) * YT_NON_YPP_REVENUE_MULTIPLIER
+        scores = (calculate_curve_values(day2_inputs) - calculate_curve_values(day1_inputs)).tolist()
+    except Exception as e:
+        bt.logging.warning(f"Batch curve scoring failed for {metric_key}, scoring videos individually: {e}")
+        for i in batch_indices:
+            results[i] = scalar_scorer(daily_analytics_list[i], *periods, channel_analytics)
+        return
+    
+    day1_inputs, day2_inputs = day1_inputs.tolist(), day2_inputs.tolist()
+    for k, i in enumerate(batch_indices):
+        if metric_key == REVENUE_METRIC:
+            results[i] = _ypp_curve_result(
+                daily_analytics_list[i], scores[k], day1_avgs[k], day2_avgs[k], periods, channel_analytics
+            )
+        else:
+            results[i] = _non_ypp_curve_result(
+                daily_analytics_list[i], scores[k], day1_avgs[k], day2_avgs[k],
+                day1_inputs[k], day2_inputs[k], periods, channel_analytics
+            )
@@ -3,11 +3,16 @@ Curve-based scoring calculation functions for YouTube video evaluation.
 
 This module provides functions for calculating video scores using a diminishing 
 returns curve to prevent linear scaling exploitation while fairly rewarding growth.
+
+The *_values / *_differences variants apply the same formulas element-wise to
+NumPy arrays for batch scoring; they perform the same floating point operations
+in the same order, so results are identical to the scalar functions.
 """
 
 import math
 
 import bittensor as bt
+import numpy as np
 
 from bitcast.validator.utils.config import YT_CURVE_DAMPENING_FACTOR
 
@@ -125,3 +130,48 @@ def calculate_adjusted_curve_difference(
     return max(day2_curve - threshold, 0) - max(day1_curve - threshold, 0)
 
 
+def calculate_curve_values(values) -> np.ndarray:
+    """
+    Vectorized calculate_curve_value: non-positive or non-finite inputs map to 0.0.
+    
+    Args:
+        values: Array-like of input values
+        
+    Returns:
+        np.ndarray: Curve value per input
+    """
+    values = np.asarray(values, dtype=np.float64)
+    valid = (values > 0) & np.isfinite(values)
+    sqrt_values = np.sqrt(np.where(valid, values, 0.0))
+    curve_values = np.where(valid, sqrt_values / (1 + YT_CURVE_DAMPENING_FACTOR * sqrt_values), 0.0)
+    return np.where(np.isfinite(curve_values), curve_values, 0.0)
+
+
+def calculate_adjusted_curve_differences(day1_avgs, day2_avgs, scaling_factors, lifetime_deductions) -> np.ndarray:
+    """
+    Vectorized calculate_adjusted_curve_difference over aligned arrays.
+    
+    Elements whose scaling factor or lifetime deduction is not positive get the
+    plain curve difference, as in the scalar function.
+    
+    Args:
+        day1_avgs: Average values for the earlier period
+        day2_avgs: Average values for the later period
+        scaling_factors: Brief-specific scaling factors
+        lifetime_deductions: USD amounts to deduct from lifetime totals
+        
+    Returns:
+        np.ndarray: Adjusted curve difference per element
+    """
+    day1_curves = calculate_curve_values(day1_avgs)
+    day2_curves = calculate_curve_values(day2_avgs)
+    scaling_factors = np.asarray(scaling_factors, dtype=np.float64)
+    lifetime_deductions = np.asarray(lifetime_deductions, dtype=np.float64)
+
+    adjusted = (scaling_factors > 0) & (lifetime_deductions > 0)
+    thresholds = np.divide(
+        lifetime_deductions, scaling_factors,
+        out=np.zeros_like(scaling_factors), where=adjusted
+    )
+    clamped = np.maximum(day2_curves - thresholds, 0.0) - np.maximum(day1_curves - thresholds, 0.0)
+    return np.where(adjusted, clamped, day2_curves - day1_curves)
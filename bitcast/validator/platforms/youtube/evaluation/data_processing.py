@@ -4,12 +4,23 @@ Data processing utilities for curve-based video scoring.
 This module provides functions for processing YouTube analytics data to support
 curve-based scoring calculations, including filling missing dates, calculating
 cumulative totals, and computing rolling averages.
+
+get_period_averages converts a video's daily rows once into a NumPy column over
+an ordinal day index and derives fill, cumulative totals and rolling windows from
+it. Results are identical to the row-wise helpers, which remain in use for input
+the columnar path does not handle (malformed days or non-numeric values).
+get_period_averages_batch applies the same steps to a videos x days matrix.
 """
 
-from datetime import datetime, timedelta
+import re
+from itertools import chain
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Any, Optional
 
 import bittensor as bt
+import numpy as np
+
+_ISO_DAY = re.compile(r"\d{4}-\d{2}-\d{2}")
 
 
 def fill_missing_dates(
@@ -369,6 +380,208 @@ def get_period_averages(
         ...     7, channel_analytics, True
         ... )
     """
+    try:
+        column = _daily_metric_column(daily_analytics, metric_key)
+        if column is None:
+            return _get_period_averages_rowwise(
+                daily_analytics, metric_key, day1_start, day1_end, day2_start, day2_end,
+                window_size, channel_analytics, is_ypp_account
+            )
+        return _get_period_averages_columnar(
+            column, metric_key, day1_start, day1_end, day2_start, day2_end,
+            window_size, channel_analytics, is_ypp_account
+        )
+        
+    except Exception as e:
+        bt.logging.error(f"Error calculating period averages: {e}")
+        return 0.0, 0.0
+
+
+def _daily_metric_column(daily_analytics: List[Dict[str, Any]], metric_key: str) -> Optional[Dict[int, Any]]:
+    """
+    Map each day's ordinal to its metric value, or return None if the input is irregular.
+    
+    Later rows for the same day win, as in fill_missing_dates. Irregular input
+    (days not in YYYY-MM-DD form, or non-numeric values) is left to the row-wise path.
+    """
+    values_by_day = {}
+    for item in daily_analytics:
+        day = item.get("day")
+        if not day:
+            continue
+        value = item.get(metric_key, 0.0)
+        if not isinstance(day, str) or not _ISO_DAY.fullmatch(day) or not isinstance(value, (int, float)):
+            return None
+        values_by_day[day] = value
+    
+    try:
+        return {date.fromisoformat(day).toordinal(): value for day, value in values_by_day.items()}
+    except ValueError:
+        return None
+
+
+def _window_mean(cumulative: np.ndarray, first: int, last: int, window_size: int) -> float:
+    """Last rolling average of a period, i.e. the mean of its final window of cumulative values."""
+    if last < first or window_size <= 0:
+        return 0.0
+    window_values = cumulative[max(first, last - window_size + 1):last + 1].tolist()
+    # Python sum keeps the result identical to calculate_rolling_average
+    return sum(window_values) / len(window_values)
+
+
+def _get_period_averages_columnar(
+    column: Dict[int, Any],
+    metric_key: str,
+    day1_start: str,
+    day1_end: str,
+    day2_start: str,
+    day2_end: str,
+    window_size: int,
+    channel_analytics: Optional[Dict[str, Any]],
+    is_ypp_account: bool
+) -> tuple[float, float]:
+    """Columnar implementation of get_period_averages over an ordinal day index."""
+    day1_first, day1_last, day2_first, day2_last = (
+        datetime.strptime(d, '%Y-%m-%d').toordinal() for d in (day1_start, day1_end, day2_start, day2_end)
+    )
+    start = min(day1_first, day1_last, day2_first, day2_last)
+    end = max(day1_first, day1_last, day2_first, day2_last)
+    if column:
+        start = min(start, min(column))
+    
+    # Fill missing dates with zeros
+    values = np.zeros(end - start + 1, dtype=np.float64)
+    ordinals = np.fromiter(column.keys(), dtype=np.int64, count=len(column))
+    daily_values = np.fromiter((float(v) for v in column.values()), dtype=np.float64, count=len(column))
+    in_range = ordinals <= end
+    values[ordinals[in_range] - start] = daily_values[in_range]
+    
+    # Apply proportional scaling to period 2 values if channel analytics are provided
+    if channel_analytics is not None and day2_first <= day2_last:
+        # Import here to avoid circular dependency
+        from .proportional_scaling import apply_proportional_scaling_to_period
+        
+        period2 = slice(day2_first - start, day2_last - start + 1)
+        period2_rows = [
+            {"day": date.fromordinal(start + offset).isoformat(), metric_key: value}
+            for offset, value in zip(range(period2.start, period2.stop), values[period2].tolist())
+        ]
+        scaled_rows = apply_proportional_scaling_to_period(
+            period2_rows, channel_analytics, metric_key, is_ypp_account
+        )
+        values[period2] = [row.get(metric_key, 0.0) for row in scaled_rows]
+    
+    # Cumulative totals, accumulated left to right from 0.0 like calculate_cumulative_totals
+    cumulative = np.cumsum(np.concatenate(([0.0], values)))[1:]
+    
+    day1_average = _window_mean(cumulative, day1_first - start, day1_last - start, window_size)
+    day2_average = _window_mean(cumulative, day2_first - start, day2_last - start, window_size)
+    return day1_average, day2_average
+
+
+def get_period_averages_batch(
+    columns: List[Dict[int, Any]],
+    metric_key: str,
+    day1_start: str,
+    day1_end: str,
+    day2_start: str,
+    day2_end: str,
+    window_size: int,
+    channel_analytics: Optional[Dict[str, Any]] = None,
+    is_ypp_account: bool = True
+) -> tuple[List[float], List[float]]:
+    """
+    Calculate period averages for many videos at once.
+    
+    Builds one videos x days matrix from per-video ordinal columns (see
+    _daily_metric_column), applies proportional scaling to period 2 with a single
+    median threshold lookup, and accumulates every row with one cumsum. Each
+    video's averages are identical to get_period_averages on its own rows: the
+    shared index only adds leading zero days, which leave the running totals unchanged.
+    
+    Args:
+        columns: Ordinal -> metric value mapping per video
+        metric_key: Metric being averaged
+        day1_start: Start date for period 1
+        day1_end: End date for period 1
+        day2_start: Start date for period 2
+        day2_end: End date for period 2
+        window_size: Rolling window size
+        channel_analytics: Channel analytics for proportional scaling threshold (optional)
+        is_ypp_account: Whether the metric is scored as a YPP account (affects scaling metric)
+        
+    Returns:
+        Tuple of (day1_averages, day2_averages), aligned with columns
+    """
+    if not columns:
+        return [], []
+    
+    day1_first, day1_last, day2_first, day2_last = (
+        datetime.strptime(d, '%Y-%m-%d').toordinal() for d in (day1_start, day1_end, day2_start, day2_end)
+    )
+    start = min(day1_first, day1_last, day2_first, day2_last)
+    end = max(day1_first, day1_last, day2_first, day2_last)
+    first_days = [min(column) for column in columns if column]
+    if first_days:
+        start = min(start, min(first_days))
+    
+    # Fill missing dates with zeros
+    total = sum(len(column) for column in columns)
+    matrix = np.zeros((len(columns), end - start + 1), dtype=np.float64)
+    rows = np.repeat(np.arange(len(columns)), [len(column) for column in columns])
+    ordinals = np.fromiter(chain.from_iterable(columns), dtype=np.int64, count=total)
+    daily_values = np.fromiter(
+        (float(v) for column in columns for v in column.values()), dtype=np.float64, count=total
+    )
+    in_range = ordinals <= end
+    matrix[rows[in_range], ordinals[in_range] - start] = daily_values[in_range]
+    
+    # Apply proportional scaling to period 2 values if channel analytics are provided
+    if channel_analytics is not None and day2_first <= day2_last:
+        # Import here to avoid circular dependency
+        from .proportional_scaling import calculate_scaling_factor, get_median_threshold_for_metric
+        
+        threshold = get_median_threshold_for_metric(channel_analytics, metric_key, is_ypp_account)
+        if threshold is not None:
+            period2 = slice(day2_first - start, day2_last - start + 1)
+            scaled_rows = []
+            factors = []
+            for row, period2_values in enumerate(matrix[:, period2].tolist()):
+                factor = calculate_scaling_factor(sum(period2_values) / len(period2_values), threshold)
+                if factor is not None:
+                    scaled_rows.append(row)
+                    factors.append(factor)
+            if scaled_rows:
+                matrix[scaled_rows, period2] *= np.asarray(factors)[:, None]
+                bt.logging.info(
+                    f"Applied proportional scaling: metric={metric_key}, "
+                    f"videos_scaled={len(scaled_rows)}/{len(columns)}"
+                )
+    
+    # Cumulative totals, accumulated left to right from 0.0 along each row
+    cumulative = np.cumsum(np.hstack((np.zeros((len(columns), 1)), matrix)), axis=1)[:, 1:]
+    
+    day1_averages = [
+        _window_mean(row, day1_first - start, day1_last - start, window_size) for row in cumulative
+    ]
+    day2_averages = [
+        _window_mean(row, day2_first - start, day2_last - start, window_size) for row in cumulative
+    ]
+    return day1_averages, day2_averages
+
+
+def _get_period_averages_rowwise(
+    daily_analytics: List[Dict[str, Any]],
+    metric_key: str,
+    day1_start: str,
+    day1_end: str, 
+    day2_start: str,
+    day2_end: str,
+    window_size: int,
+    channel_analytics: Optional[Dict[str, Any]] = None,
+    is_ypp_account: bool = True
+) -> tuple[float, float]:
+    """Row-wise implementation of get_period_averages, used for irregular input."""
     try:
         # Determine the date range needed from averaging windows
         window_dates = [day1_start, day1_end, day2_start, day2_end]
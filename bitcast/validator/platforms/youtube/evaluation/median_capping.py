@@ -15,6 +15,7 @@ from bitcast.validator.utils.config import (
     YT_SCORE_CAP_START_DAYS,
     YT_SCORE_CAP_END_DAYS,
 )
+from bitcast.validator.utils.cycle_context import get_active_cycle
 from .score_cap import calculate_median_from_analytics
 
 
@@ -44,7 +45,8 @@ def calculate_median_cap_period(
         >>> # Calculates median revenue for T-60 to T-30 period
     """
     try:
-        today = datetime.now().date()
+        cycle = get_active_cycle()
+        today = cycle.now.date() if cycle is not None else datetime.now().date()
         start_date = (today - timedelta(days=start_days)).strftime('%Y-%m-%d')
         end_date = (today - timedelta(days=end_days)).strftime('%Y-%m-%d')
         
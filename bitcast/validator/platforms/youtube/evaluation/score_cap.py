@@ -3,11 +3,19 @@ Score capping.
 
 This module provides functions for calculating median values from account-level
 daily analytics data to implement scoring caps based on T-60 to T-30 day periods.
+
+Medians are memoized per (channel id, metric, cap window): every video of a
+channel shares the same channel analytics, so the median is computed once per
+channel and reused. The channel being scored is bound with median_cache_channel();
+without one nothing is cached. Only the median itself is kept, and the cache is
+cleared whenever a new validation cycle is activated.
 """
 
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 import statistics
-from typing import Any, Dict, Tuple
+from threading import Lock, local
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 import bittensor as bt
 
@@ -15,6 +23,7 @@ from bitcast.validator.utils.config import (
     YT_SCORE_CAP_END_DAYS,
     YT_SCORE_CAP_START_DAYS,
 )
+from bitcast.validator.utils.cycle_context import get_active_cycle
 
 
 def get_cap_period_dates() -> Tuple[str, str]:
@@ -24,6 +33,10 @@ def get_cap_period_dates() -> Tuple[str, str]:
     Returns:
         Tuple of (start_date, end_date) in YYYY-MM-DD format for the score cap period
     """
+    cycle = get_active_cycle()
+    if cycle is not None:
+        return cycle.cap_period
+    
     today = datetime.now().date()
     
     # T-60 to T-30 means 60 days ago to 30 days ago
@@ -65,10 +78,33 @@ def pad_missing_days_with_zeros(daily_analytics: Dict[str, float], start_date: s
     return padded_data
 
 
+_median_cache_lock = Lock()
+# (channel_id, metric_key, start_date, end_date) -> median
+_median_cache: Dict[Tuple[str, str, str, str], float] = {}
+_median_cache_stats = {"hits": 0, "misses": 0}
+# Cycle the cached medians belong to; a different active cycle clears the cache
+_median_cache_cycle = None
+_median_channel = local()
+
+
+@contextmanager
+def median_cache_channel(channel_id: Optional[str]) -> Iterator[None]:
+    """Memoize medians computed in this thread under channel_id while the block runs."""
+    previous = getattr(_median_channel, "id", None)
+    _median_channel.id = channel_id
+    try:
+        yield
+    finally:
+        _median_channel.id = previous
+
+
 def calculate_median_from_analytics(channel_analytics: Dict[str, Any], metric_key: str) -> float:
     """
     Calculate median daily values for a specific metric from channel analytics for the T-60 to T-30 period.
     
+    Results are memoized for the current cycle under the channel bound with
+    median_cache_channel(); without a bound channel the median is always computed.
+    
     Args:
         channel_analytics: Channel analytics dictionary from get_channel_analytics()
         metric_key: The metric key to extract ('estimatedRedPartnerRevenue', 'views', etc.)
@@ -76,32 +112,73 @@ def calculate_median_from_analytics(channel_analytics: Dict[str, Any], metric_ke
     Returns:
         Median daily value for the specified metric over the score cap period
     """
+    global _median_cache_cycle
     try:
         # Get the score cap period dates
         start_date, end_date = get_cap_period_dates()
         
         # Extract daily metric data
-        daily_data = channel_analytics.get(metric_key, {})
-        
-        # Pad missing days with zeros as per BA guidance
-        padded_data = pad_missing_days_with_zeros(daily_data, start_date, end_date)
+        daily_data = channel_analytics.get(metric_key)
         
-        # Calculate median (include all values including zeros)
-        values = list(padded_data.values())
+        channel_id = getattr(_median_channel, "id", None)
+        if channel_id is None:
+            return _calculate_median(daily_data, metric_key, start_date, end_date)
         
-        if not values:
-            bt.logging.warning(f"No {metric_key} data found for median calculation, returning 0")
-            return 0.0
+        key = (channel_id, metric_key, start_date, end_date)
+        cycle = get_active_cycle()
+        with _median_cache_lock:
+            if cycle is not _median_cache_cycle:
+                _clear_median_cache()
+                _median_cache_cycle = cycle
+            median_value = _median_cache.get(key)
+            if median_value is not None:
+                _median_cache_stats["hits"] += 1
+                return median_value
         
-        median_value = statistics.median(values)
+        median_value = _calculate_median(daily_data, metric_key, start_date, end_date)
         
-        # Calculated median value for capping
-        
-        return float(median_value)
+        with _median_cache_lock:
+            _median_cache_stats["misses"] += 1
+            if cycle is _median_cache_cycle:
+                _median_cache[key] = median_value
+        return median_value
         
     except Exception as e:
         bt.logging.error(f"Error calculating {metric_key} median: {e}")
         return 0.0
 
 
- 
\ No newline at end of file
+def _calculate_median(daily_data: Dict[str, float], metric_key: str, start_date: str, end_date: str) -> float:
+    # Pad missing days with zeros as per BA guidance
+    padded_data = pad_missing_days_with_zeros(daily_data, start_date, end_date)
+    
+    # Calculate median (include all values including zeros)
+    values = list(padded_data.values())
+    
+    if not values:
+        bt.logging.warning(f"No {metric_key} data found for median calculation, returning 0")
+        return 0.0
+    
+    median_value = statistics.median(values)
+    
+    # Calculated median value for capping
+    
+    return float(median_value)
+
+
+def get_median_cache_stats() -> Dict[str, int]:
+    """Return median cache hits, misses and cached entries for the current cycle."""
+    with _median_cache_lock:
+        return {**_median_cache_stats, "entries": len(_median_cache)}
+
+
+def reset_median_cache() -> None:
+    """Clear memoized medians and counters; called at the start of each validation cycle."""
+    with _median_cache_lock:
+        _clear_median_cache()
+
+
+def _clear_median_cache() -> None:
+    _median_cache.clear()
+    for key in _median_cache_stats:
+        _median_cache_stats[key] = 0
@@ -5,15 +5,16 @@ This module contains functions for calculating video scores based on analytics d
 """
 
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import bittensor as bt
 
 from bitcast.validator.platforms.youtube.api.video import get_video_analytics
 from bitcast.validator.platforms.youtube.config import get_youtube_metrics
 from bitcast.validator.utils.config import ECO_MODE, YT_REWARD_DELAY, YT_ROLLING_WINDOW
+from bitcast.validator.utils.cycle_context import get_active_cycle
 
-from .curve_based_scoring import calculate_curve_based_score
+from .curve_based_scoring import calculate_curve_based_score, calculate_curve_based_scores_batch
 
 
 def calculate_video_score(video_id, youtube_analytics_client, video_publish_date, 
@@ -37,17 +38,78 @@ def calculate_video_score(video_id, youtube_analytics_client, video_publish_date
     Returns:
         dict: Dictionary containing score, daily_analytics, scoring_method, and cap info
     """
+    cycle = get_active_cycle()
+    if cycle is not None:
+        start_date, end_date = cycle.scoring_periods[2:]
+    else:
+        start_date = (datetime.now() - timedelta(days=YT_REWARD_DELAY + YT_ROLLING_WINDOW - 1)).strftime('%Y-%m-%d')
+        end_date = (datetime.now() - timedelta(days=YT_REWARD_DELAY)).strftime('%Y-%m-%d')
+    daily_analytics = _fetch_daily_analytics(video_id, youtube_analytics_client, video_publish_date, is_ypp_account)
+    
+    # Calculate score using curve-based scoring with integrated median capping
+    # Use bitcast video ID for logging, fall back to YouTube video ID if not provided
+    log_video_id = bitcast_video_id if bitcast_video_id is not None else video_id
+    return calculate_curve_based_score(daily_analytics, start_date, end_date, is_ypp_account, channel_analytics, log_video_id, min_stake)
+
+
+def calculate_video_scores_batch(videos: List[Tuple[str, str, Optional[str]]], youtube_analytics_client,
+                                 is_ypp_account: bool = True,
+                                 channel_analytics: Optional[dict] = None,
+                                 min_stake: bool = False):
+    """
+    Calculate scores for all matched videos of an account in one curve scoring pass.
+    
+    Analytics are still fetched per video (the API is per video); the curve scores
+    are then computed together. Results are identical to calling
+    calculate_video_score for each video. A video whose analytics fetch fails
+    gets None and does not affect the others.
+    
+    Args:
+        videos (list): (video_id, video_publish_date, bitcast_video_id) per video
+        youtube_analytics_client: YouTube Analytics API client
+        is_ypp_account (bool): Whether this is a YPP account
+        channel_analytics (Optional[dict]): Channel analytics for median cap calculation
+        min_stake (bool): Whether the miner meets minimum stake requirements
+        
+    Returns:
+        list: Score result dict (None if its analytics could not be fetched) per video, aligned with videos
+    """
+    fetched = []
+    for index, (video_id, video_publish_date, bitcast_video_id) in enumerate(videos):
+        try:
+            daily_analytics = _fetch_daily_analytics(
+                video_id, youtube_analytics_client, video_publish_date, is_ypp_account
+            )
+        except Exception as e:
+            bt.logging.error(f"Failed to fetch analytics for video {video_id}, skipping its score: {e}")
+            continue
+        log_video_id = bitcast_video_id if bitcast_video_id is not None else video_id
+        fetched.append((index, daily_analytics, log_video_id))
+    
+    score_results = [None] * len(videos)
+    batch_results = calculate_curve_based_scores_batch(
+        [daily_analytics for _, daily_analytics, _ in fetched], is_ypp_account, channel_analytics,
+        [log_video_id for _, _, log_video_id in fetched], min_stake
+    )
+    for (index, _, _), score_result in zip(fetched, batch_results):
+        score_results[index] = score_result
+    return score_results
+
+
+def _fetch_daily_analytics(video_id, youtube_analytics_client, video_publish_date, is_ypp_account):
+    """Fetch a video's daily analytics from its publish date to today, sorted by day."""
+    cycle = get_active_cycle()
+    now = cycle.now if cycle is not None else datetime.now()
+    
     # Use video publish date as query start date if provided, otherwise use default
     try:
         publish_datetime = datetime.strptime(video_publish_date, '%Y-%m-%dT%H:%M:%SZ')
         query_start_date = publish_datetime.strftime('%Y-%m-%d')
     except (ValueError, TypeError):
         bt.logging.warning(f"Failed to parse video publish date: {video_publish_date}, using default")
-        query_start_date = (datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d')
+        query_start_date = (now - timedelta(days=90)).strftime('%Y-%m-%d')
     
-    start_date = (datetime.now() - timedelta(days=YT_REWARD_DELAY + YT_ROLLING_WINDOW - 1)).strftime('%Y-%m-%d')
-    end_date = (datetime.now() - timedelta(days=YT_REWARD_DELAY)).strftime('%Y-%m-%d')
-    today = datetime.now().strftime('%Y-%m-%d')
+    today = now.strftime('%Y-%m-%d')
 
     # Get daily metrics from config, excluding revenue metrics for Non-YPP accounts
     metric_dims = get_youtube_metrics(eco_mode=ECO_MODE, for_daily=True, is_ypp_account=is_ypp_account)    
@@ -59,9 +121,4 @@ def calculate_video_score(video_id, youtube_analytics_client, video_publish_date
         metric_dims=metric_dims
     )
     
-    daily_analytics = sorted(analytics_result.get("day_metrics", {}).values(), key=lambda x: x.get("day", ""))
-    
-    # Calculate score using curve-based scoring with integrated median capping
-    # Use bitcast video ID for logging, fall back to YouTube video ID if not provided
-    log_video_id = bitcast_video_id if bitcast_video_id is not None else video_id
-    return calculate_curve_based_score(daily_analytics, start_date, end_date, is_ypp_account, channel_analytics, log_video_id, min_stake) 
\ No newline at end of file
+    return sorted(analytics_result.get("day_metrics", {}).values(), key=lambda x: x.get("day", ""))
@@ -7,8 +7,11 @@ specialized components for better maintainability and clarity.
 Modules:
 - validation: Basic video validation checks (privacy, etc.)
 - transcript: Transcript fetching and prompt injection detection
+- injection_prefilter: Local heuristic screening before the LLM injection check
 - brief_matching: Brief evaluation, prescreening, and priority selection
+- llm_budget: Value-aware per-cycle LLM budget for brief evaluations
 - orchestration: Main workflow coordination and batch processing
+- video_record: Compact per-video record stored in evaluation results
 """
 
 # Main orchestration functions
@@ -43,6 +46,9 @@ from .brief_matching import (
     select_highest_priority_brief,
 )
 
+# Per-video evaluation record
+from .video_record import VideoRecord
+
 # Import functions that tests may need to patch
 from bitcast.validator.clients.llm_client import evaluate_content_against_brief, check_for_prompt_injection
 from bitcast.validator.platforms.youtube.utils import state
@@ -72,4 +78,7 @@ __all__ = [
     "evaluate_content_against_briefs",
     "select_highest_priority_brief",
     "map_brief_results_to_original_order",
+    
+    # Video record
+    "VideoRecord",
 ] 
\ No newline at end of file
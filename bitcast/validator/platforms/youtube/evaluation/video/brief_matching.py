@@ -12,7 +12,10 @@ from concurrent.futures import as_completed, ThreadPoolExecutor
 import bittensor as bt
 
 from bitcast.validator.clients.llm_client import evaluate_content_against_brief
+from bitcast.validator.clients.llm_telemetry import bind_request_meter
+from bitcast.validator.utils.brief_model import Brief
 from bitcast.validator.utils.error_handling import log_and_raise_processing_error
+from .identifier_index import get_brief_identifier_index
 from .validation import check_brief_publish_date_range
 
 
@@ -27,13 +30,16 @@ def check_brief_unique_identifier(brief, video_description):
     Returns:
         bool: True if unique identifier found or not required, False otherwise
     """
+    # Compiled briefs carry the normalized identifier (None when not required)
+    if isinstance(brief, Brief):
+        unique_identifier = brief.identifier
     # Check if unique_identifier field exists or is None - if so, pass the check
-    if "unique_identifier" not in brief or brief["unique_identifier"] is None:
+    elif "unique_identifier" not in brief or brief["unique_identifier"] is None:
         return True
+    else:
+        unique_identifier = brief["unique_identifier"].strip()
     
-    unique_identifier = brief["unique_identifier"].strip()
-    
-    # Check if unique_identifier field is empty - if so, pass the check
+    # Check if unique_identifier field is missing or empty - if so, pass the check
     if not unique_identifier:
         return True
     
@@ -64,13 +70,16 @@ def prescreen_briefs_for_video(briefs, video_description, video_data):
     prescreening_results = []
     filtered_brief_ids = []
     
-    for brief in briefs:
+    # Match every brief's unique identifier against the description in one pass
+    identifier_matches = get_brief_identifier_index(briefs).match(video_description)
+    
+    for position, brief in enumerate(briefs):
         passes_prescreen = False
         reason = ""
         
         try:
             # Check unique identifier first
-            passes_unique_id = check_brief_unique_identifier(brief, video_description)
+            passes_unique_id = position in identifier_matches
             if not passes_unique_id:
                 reason = "unique identifier"
             else:
@@ -167,10 +176,11 @@ def select_highest_priority_brief(matching_briefs, brief_results):
             # Product placement briefs: keep all matches
             pp_briefs.append((i, brief))
         else:
-            # Regular briefs: select highest weight*boost
-            weight = brief.get("weight", 0)
-            boost = brief.get("boost", 1.0)
-            priority = weight * boost
+            # Regular briefs: select highest weight*boost (precomputed on compiled briefs)
+            if isinstance(brief, Brief):
+                priority = brief.priority
+            else:
+                priority = brief.get("weight", 0) * brief.get("boost", 1.0)
             
             if priority > best_priority:
                 best_priority = priority
@@ -210,7 +220,7 @@ def evaluate_content_against_briefs(briefs, video_data, transcript, decision_det
         # Submit all brief evaluation tasks
         future_to_brief = {
             executor.submit(
-                evaluate_content_against_brief, 
+                bind_request_meter(evaluate_content_against_brief), 
                 brief, 
                 video_data['duration'], 
                 video_data['description'], 
@@ -274,8 +284,10 @@ def evaluate_content_against_briefs(briefs, video_data, transcript, decision_det
     if selected_index is None and not pp_briefs:
         bt.logging.info(f"No briefs matched for video: {video_data.get('bitcastVideoId')}")
     
-    # Update decision_details with final results
+    # Update decision_details with final results, keeping the raw per-brief verdicts
+    # (before priority selection) for callers that need them
     decision_details["contentAgainstBriefCheck"].extend(final_brief_results)
+    decision_details["briefMatchResults"] = brief_results
     reasonings = brief_reasonings
             
     return final_met_brief_ids, reasonings 
\ No newline at end of file
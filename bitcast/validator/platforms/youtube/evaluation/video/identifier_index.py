@@ -0,0 +1,147 @@
+"""
+Multi-pattern unique identifier matching for brief prescreening.
+
+Identifiers of all active briefs are normalized and deduplicated once, and each
+description is lowercased once instead of once per brief. Small identifier sets
+are then checked with C-level substring searches; larger sets use an Aho-Corasick
+automaton so the description is scanned in a single pass. The index is rebuilt
+only when the set of identifiers changes, which in practice means once per
+validation cycle.
+"""
+
+from collections import deque
+from threading import Lock
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from bitcast.validator.utils.brief_model import Brief, normalize_identifier
+
+# Below this many distinct identifiers, per-identifier `in` checks (which run in C)
+# beat a pure-Python automaton walk over a typical description
+AHO_CORASICK_MIN_PATTERNS = 150
+
+
+def normalize_unique_identifier(brief) -> Optional[str]:
+    """
+    Return the lowercase unique identifier of a brief, or None if the brief has none.
+
+    Mirrors check_brief_unique_identifier: a missing, None or blank identifier
+    means the brief does not require one.
+    """
+    if isinstance(brief, Brief):
+        return brief.identifier
+    return normalize_identifier(brief.get("unique_identifier"))
+
+
+class BriefIdentifierIndex:
+    """
+    Multi-pattern matcher returning the positions of briefs whose identifier occurs in a text.
+
+    Matching is case-insensitive and reports overlapping identifiers, so the result is
+    identical to calling check_brief_unique_identifier for every brief.
+    """
+
+    def __init__(self, identifiers: Sequence[Optional[str]], min_automaton_patterns: int = AHO_CORASICK_MIN_PATTERNS):
+        """
+        Args:
+            identifiers: Normalized identifier per brief position (None if not required)
+            min_automaton_patterns: Distinct identifier count from which the automaton is used
+        """
+        self.size = len(identifiers)
+        self.unrestricted: FrozenSet[int] = frozenset(
+            i for i, identifier in enumerate(identifiers) if identifier is None
+        )
+
+        positions: Dict[str, set] = {}
+        for position, identifier in enumerate(identifiers):
+            if identifier is not None:
+                positions.setdefault(identifier, set()).add(position)
+        self._patterns: Dict[str, FrozenSet[int]] = {
+            identifier: frozenset(found) for identifier, found in positions.items()
+        }
+        self.uses_automaton = len(self._patterns) >= min_automaton_patterns
+        if self.uses_automaton:
+            self._build_automaton(identifiers)
+
+    def _build_automaton(self, identifiers: Sequence[Optional[str]]) -> None:
+        """Build the Aho-Corasick goto, failure and output tables."""
+        # Trie: transitions per state, plus the brief positions completed at each state
+        self._goto: List[Dict[str, int]] = [{}]
+        outputs: List[set] = [set()]
+        for position, identifier in enumerate(identifiers):
+            if identifier is None:
+                continue
+            state = 0
+            for char in identifier:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(position)
+
+        # Failure links (breadth-first), merging outputs along the way
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                outputs[next_state] |= outputs[self._fail[next_state]]
+        self._output: List[FrozenSet[int]] = [frozenset(out) for out in outputs]
+
+    def match(self, text: Optional[str]) -> FrozenSet[int]:
+        """Return the brief positions whose identifier check passes for the given text."""
+        if text is None or not self._patterns:
+            return self.unrestricted
+
+        if not self.uses_automaton:
+            lowered = text.lower()
+            matched = set(self.unrestricted)
+            for identifier, positions in self._patterns.items():
+                if identifier in lowered:
+                    matched |= positions
+            return frozenset(matched)
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        matched = set(self.unrestricted)
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                matched |= output[state]
+        return frozenset(matched)
+
+
+_index_lock = Lock()
+_index_key: Optional[Tuple[Optional[str], ...]] = None
+_index: Optional[BriefIdentifierIndex] = None
+
+
+def get_brief_identifier_index(briefs) -> BriefIdentifierIndex:
+    """
+    Get the identifier index for a list of briefs, rebuilding it only when identifiers change.
+
+    Args:
+        briefs (list): Brief dictionaries, in the order results are wanted
+
+    Returns:
+        BriefIdentifierIndex: Index whose positions correspond to the given brief order
+    """
+    global _index_key, _index
+    key = tuple(normalize_unique_identifier(brief) for brief in briefs)
+    with _index_lock:
+        if _index is None or key != _index_key:
+            _index = BriefIdentifierIndex(key)
+            _index_key = key
+        return _index
@@ -0,0 +1,153 @@
+"""
+Local prompt injection prefilter.
+
+Scores the video description and transcript against pattern and lexical rules
+for evaluation-steering language (e.g. "ignore previous instructions", "the brief
+has been met", fake verdict sections, prompt delimiters, invisible characters).
+Content that scores below the escalation threshold is cleared locally; anything
+else is escalated to the LLM prompt injection check. The sensitivity setting
+controls the threshold, and escalation counters make the clearance rate visible.
+"""
+
+import re
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, List, Optional
+
+from bitcast.validator.utils.config import PROMPT_INJECTION_SENSITIVITY
+
+# Minimum risk score that escalates content to the LLM check
+SENSITIVITY_THRESHOLDS = {
+    "high": 1,
+    "medium": 2,
+    "low": 3,
+}
+
+# Rules applied to the raw text: structural markers that never survive normalization
+_RAW_RULES = [
+    ("prompt_delimiter", 3, re.compile(r"<<<|>>>|/////|\b(?:DESC|TRSC)[0-9a-f]{16}\b")),
+    ("verdict_heading", 3, re.compile(r"##\s*(?:verdict|summary|analysis)\b", re.IGNORECASE)),
+    ("invisible_characters", 1, re.compile("[\u200b-\u200f\u2060-\u2064\ufeff\U000e0000-\U000e007f]")),
+]
+
+# Rules applied to normalized text (lowercase words separated by single spaces)
+_TEXT_RULES = [
+    ("ignore_instructions", 3, re.compile(
+        r"\b(?:ignore|disregard|forget|override) (?:all |any |the |your )*"
+        r"(?:previous|prior|above|earlier|preceding|system|original) (?:instructions?|prompts?|rules|guidelines)\b"
+    )),
+    ("brief_met_claim", 3, re.compile(
+        r"\b(?:brief|requirements?|criteria) (?:has|have|is|are) (?:been )?(?:fully )?(?:met|fulfilled|satisfied|completed)\b"
+    )),
+    ("meets_brief_claim", 3, re.compile(
+        r"\b(?:this|the) (?:video|content) (?:fully |clearly |definitely )?"
+        r"(?:meets|satisfies|fulfills|fulfils|passes) (?:the |all |every |all the )?(?:brief|requirements?|criteria)\b"
+    )),
+    ("verdict_instruction", 3, re.compile(
+        r"\b(?:mark|rate|score|flag|classify) (?:it|(?:this|the) (?:video|content)|this) as "
+        r"(?:pass|passing|passed|met|approved|relevant|true|yes|compliant)\b"
+    )),
+    ("answer_instruction", 3, re.compile(
+        r"\b(?:respond|answer|reply|output|return|say) (?:with |only )*(?:yes|true|pass|met)\b"
+    )),
+    ("verdict_value", 2, re.compile(r"\bverdict (?:is |should be |must be )?(?:yes|true|pass|met)\b")),
+    ("model_addressed", 2, re.compile(
+        r"\b(?:ai|llm|gpt|chatgpt|language model|model|evaluator|reviewer|auditor|assistant)s? "
+        r"(?:should|must|will|needs to|has to) (?:rate|mark|score|approve|evaluate|consider|pass|accept|return)\b"
+    )),
+    ("role_play", 2, re.compile(
+        r"\b(?:you are|act as|pretend to be|you re) (?:an? |the )?"
+        r"(?:ai|llm|language model|assistant|evaluator|reviewer|auditor|sponsor s review agent)\b"
+    )),
+    ("system_prompt", 2, re.compile(r"\b(?:system prompt|prompt injection|new instructions|hidden instructions)\b")),
+    ("positive_evaluation", 2, re.compile(
+        r"\b(?:should|must|will|deserves to) (?:receive|get|be given) (?:a )?(?:positive|favorable|favourable|passing) "
+        r"(?:evaluation|assessment|review|score|verdict)\b"
+    )),
+    ("proceed_with", 2, re.compile(r"\bproceed with (?:true|yes|pass|approval)\b")),
+    ("relevance_claim", 1, re.compile(r"\b(?:this|the) (?:video|content) is (?:highly |fully |very )?relevant\b")),
+    ("reviewer_note", 1, re.compile(
+        r"\bnote (?:to|for) (?:the )?(?:ai|llm|model|evaluator|reviewer|auditor|automated)\b"
+    )),
+    ("automated_review", 1, re.compile(r"\bautomated (?:review|evaluation|check|assessment|system)\b")),
+]
+
+# Transcript serialization noise: field names and timestamps
+_TRANSCRIPT_NOISE = re.compile(r"\b(?:text|start|dur|duration)\b|\b\d+(?:\.\d+)?\b")
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+@dataclass
+class InjectionAssessment:
+    """Outcome of the local prefilter for one video."""
+    score: int
+    threshold: int
+    matched_rules: List[str] = field(default_factory=list)
+
+    @property
+    def escalate(self) -> bool:
+        return self.score >= self.threshold
+
+
+def _normalize(text: str) -> str:
+    text = _NON_WORD.sub(" ", text.lower())
+    return " ".join(_TRANSCRIPT_NOISE.sub(" ", text).split())
+
+
+def assess_injection_risk(description: Optional[str], transcript: Optional[str],
+                          sensitivity: str = PROMPT_INJECTION_SENSITIVITY) -> InjectionAssessment:
+    """
+    Score description and transcript for prompt injection indicators.
+
+    Each rule contributes its weight once, regardless of how often it matches.
+
+    Args:
+        description: Video description
+        transcript: Video transcript (serialized segment list)
+        sensitivity: "low", "medium" or "high"; higher escalates more content
+
+    Returns:
+        InjectionAssessment: Score, escalation threshold and matched rule names
+    """
+    threshold = SENSITIVITY_THRESHOLDS.get(sensitivity, SENSITIVITY_THRESHOLDS["medium"])
+    raw_text = f"{description or ''}\n{transcript or ''}"
+    normalized = f"{_normalize(description or '')} | {_normalize(transcript or '')}"
+
+    score = 0
+    matched = []
+    for name, weight, pattern in _RAW_RULES:
+        if pattern.search(raw_text):
+            score += weight
+            matched.append(name)
+    for name, weight, pattern in _TEXT_RULES:
+        if pattern.search(normalized):
+            score += weight
+            matched.append(name)
+
+    assessment = InjectionAssessment(score=score, threshold=threshold, matched_rules=matched)
+    _record(assessment.escalate)
+    return assessment
+
+
+_stats_lock = Lock()
+_stats = {"checked": 0, "cleared": 0, "escalated": 0}
+
+
+def _record(escalated: bool) -> None:
+    with _stats_lock:
+        _stats["checked"] += 1
+        _stats["escalated" if escalated else "cleared"] += 1
+
+
+def get_injection_prefilter_stats() -> Dict[str, float]:
+    """Return prefilter counters and the share of videos escalated to the LLM."""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["escalation_rate"] = stats["escalated"] / stats["checked"] if stats["checked"] else 0.0
+    return stats
+
+
+def reset_injection_prefilter_stats() -> None:
+    with _stats_lock:
+        for key in _stats:
+            _stats[key] = 0
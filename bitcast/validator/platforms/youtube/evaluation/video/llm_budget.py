@@ -0,0 +1,159 @@
+"""
+Value-aware LLM budget for brief evaluations.
+
+Caps the number of LLM requests spent on brief evaluation per validation cycle
+(LLM_CYCLE_BUDGET, 0 = unlimited). Each video×brief evaluation is valued as the
+channel's watch minutes over the lookback window times the brief's weight*boost.
+
+Miners are evaluated one after another, so evaluations cannot be ranked across
+the whole cycle up front. Instead admission is tiered:
+- while more than LLM_BUDGET_RESERVE_FRACTION of the budget remains, every
+  evaluation is admitted;
+- inside the reserve, only evaluations whose value is at or above the
+  LLM_BUDGET_PRIORITY_PERCENTILE of values seen so far this cycle are admitted;
+- once the budget is spent, everything is deferred.
+
+Deferred evaluations count as not met for this cycle and are evaluated again in
+the next one. Within a video, briefs are admitted in descending value order.
+Cost is charged after each video from the provider requests its brief
+evaluations actually made (a RequestMeter, so concurrent injection checks are
+not included), so cache hits are free and a cycle can overshoot the budget by
+at most one video.
+"""
+
+from bisect import insort
+from threading import Lock
+from typing import Dict, List, Optional
+
+import bittensor as bt
+
+from bitcast.validator.utils.config import (
+    LLM_BUDGET_PRIORITY_PERCENTILE,
+    LLM_BUDGET_RESERVE_FRACTION,
+    LLM_CYCLE_BUDGET,
+)
+
+DEFERRED_REASONING = "Deferred to next cycle: LLM budget exhausted"
+
+
+def get_channel_value(channel_analytics) -> float:
+    """Channel value used for budget admission: total minutes watched over the lookback window."""
+    if not channel_analytics:
+        return 0.0
+    minutes = channel_analytics.get("estimatedMinutesWatched", 0)
+    if isinstance(minutes, dict):
+        return float(sum(minutes.values()))
+    try:
+        return float(minutes)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def get_evaluation_value(brief, channel_value: float) -> float:
+    """Expected value of evaluating a video of this channel against a brief."""
+    return channel_value * brief.get("weight", 0) * brief.get("boost", 1.0)
+
+
+class LLMBudgetScheduler:
+    """Per-cycle admission control for brief evaluations."""
+
+    def __init__(self, budget: int = LLM_CYCLE_BUDGET,
+                 reserve_fraction: float = LLM_BUDGET_RESERVE_FRACTION,
+                 priority_percentile: float = LLM_BUDGET_PRIORITY_PERCENTILE):
+        self.budget = max(0, int(budget))
+        self.reserve = self.budget * reserve_fraction
+        self.priority_percentile = priority_percentile
+        self._lock = Lock()
+        self._seen_values: List[float] = []
+        self.spent = 0
+        self.admitted = 0
+        self.deferred = 0
+        self.account_deferred = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.budget > 0
+
+    def _priority_cutoff(self) -> float:
+        index = min(int(len(self._seen_values) * self.priority_percentile), len(self._seen_values) - 1)
+        return self._seen_values[index]
+
+    def admit(self, briefs, channel_value: Optional[float]) -> List[bool]:
+        """
+        Decide which briefs of one video may be evaluated with the LLM.
+
+        Args:
+            briefs (list): Briefs awaiting LLM evaluation
+            channel_value (float): Channel value, None when unknown (treated as 0)
+
+        Returns:
+            list: Admission flag per brief, aligned with briefs
+        """
+        if not self.enabled:
+            return [True] * len(briefs)
+
+        values = [get_evaluation_value(brief, channel_value or 0.0) for brief in briefs]
+        admitted = [False] * len(briefs)
+        with self._lock:
+            for value in values:
+                insort(self._seen_values, value)
+            remaining = self.budget - self.spent
+            cutoff = self._priority_cutoff() if values else 0.0
+            for i in sorted(range(len(briefs)), key=lambda i: values[i], reverse=True):
+                if remaining > self.reserve or (remaining > 0 and values[i] >= cutoff):
+                    admitted[i] = True
+            admitted_count = sum(admitted)
+            self.admitted += admitted_count
+            self.deferred += len(briefs) - admitted_count
+            self.account_deferred += len(briefs) - admitted_count
+        return admitted
+
+    def charge(self, calls: int) -> None:
+        """Charge LLM requests made by admitted evaluations."""
+        if self.enabled and calls > 0:
+            with self._lock:
+                self.spent += calls
+
+    def reset_account_stats(self) -> None:
+        with self._lock:
+            self.account_deferred = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "budget": self.budget,
+                "spent": self.spent,
+                "admitted": self.admitted,
+                "deferred": self.deferred,
+            }
+
+
+_scheduler = LLMBudgetScheduler()
+
+
+def get_llm_budget_scheduler() -> LLMBudgetScheduler:
+    """Get the scheduler for the current validation cycle."""
+    return _scheduler
+
+
+def reset_llm_budget(budget: int = LLM_CYCLE_BUDGET) -> None:
+    """Start a new cycle with a fresh budget."""
+    global _scheduler
+    _scheduler = LLMBudgetScheduler(budget)
+    if _scheduler.enabled:
+        bt.logging.info(f"LLM cycle budget: {budget} requests")
+
+
+def get_llm_budget_stats() -> Dict[str, int]:
+    """Get budget, spent requests and admitted/deferred evaluation counts for the current cycle."""
+    return _scheduler.stats()
+
+
+def get_llm_budget_account_deferred() -> int:
+    """Get the number of evaluations deferred for the current account."""
+    return _scheduler.account_deferred
+
+
+def reset_llm_budget_account_stats() -> None:
+    """Reset the per-account deferred counter."""
+    _scheduler.reset_account_stats()
@@ -6,9 +6,11 @@ including batch processing, workflow coordination, and helper functions.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import bittensor as bt
 
+from bitcast.validator.clients.llm_telemetry import RequestMeter, metered
 from bitcast.validator.platforms.youtube.api.video import (
     get_video_analytics,
     get_video_data_batch,
@@ -17,7 +19,12 @@ from bitcast.validator.platforms.youtube.config import (
     get_youtube_metrics,
 )
 from bitcast.validator.platforms.youtube.utils import _format_error, state
-from bitcast.validator.utils.config import DISCRETE_MODE, ECO_MODE, DISABLE_PROMPT_INJECTION
+from bitcast.validator.utils.config import (
+    DISABLE_PROMPT_INJECTION,
+    DISCRETE_MODE,
+    ECO_MODE,
+    PROMPT_INJECTION_CONCURRENT,
+)
 from bitcast.validator.utils.error_handling import log_and_raise_api_error
 
 from .brief_matching import (
@@ -25,6 +32,8 @@ from .brief_matching import (
     map_brief_results_to_original_order,
     prescreen_briefs_for_video,
 )
+from .llm_budget import DEFERRED_REASONING, get_llm_budget_scheduler
+from .relevance import log_shadow_verdicts, prefilter_briefs_by_relevance
 from .transcript import check_prompt_injection, get_video_transcript
 from .validation import (
     check_manual_captions,
@@ -132,7 +141,7 @@ def _run_video_validation_checks(video_id, video_data, video_analytics, briefs,
     return all_checks_passed
 
 
-def _process_video_transcript_and_briefs(video_id, video_data, briefs, decision_details):
+def _process_video_transcript_and_briefs(video_id, video_data, briefs, decision_details, channel_value=None):
     """
     Process video transcript and evaluate against briefs.
     
@@ -141,13 +150,11 @@ def _process_video_transcript_and_briefs(video_id, video_data, briefs, decision_
         video_data (dict): Video metadata
         briefs (list): List of brief dictionaries
         decision_details (dict): Decision details to update
+        channel_value (float, optional): Channel value used by the LLM budget scheduler
         
     Returns:
         tuple: (met_brief_ids, brief_reasonings)
     """
-    met_brief_ids = []
-    brief_reasonings = []
-    
     # Pre-screen briefs FIRST based on unique_identifier and publish date before expensive operations
     eligible_briefs, prescreening_results, filtered_brief_ids = prescreen_briefs_for_video(
         briefs, video_data.get("description", ""), video_data
@@ -186,38 +193,159 @@ def _process_video_transcript_and_briefs(video_id, video_data, briefs, decision_
     if DISABLE_PROMPT_INJECTION:
         decision_details["promptInjectionCheck"] = True
         bt.logging.info(f"Prompt injection check disabled via config, skipping for video {video_id}")
+    elif PROMPT_INJECTION_CONCURRENT:
+        return _evaluate_briefs_with_concurrent_injection_check(
+            video_id, video_data, briefs, eligible_briefs, prescreening_results, transcript, decision_details,
+            channel_value
+        )
     else:
         if not check_prompt_injection(video_id, video_data, transcript, decision_details):
-            decision_details["video_vet_result"] = False
-            decision_details["contentAgainstBriefCheck"] = [False] * len(briefs)
-            return [], ["Video failed prompt injection check"] * len(briefs)
+            return _reject_for_prompt_injection(briefs, decision_details)
     
     # Evaluate eligible briefs against content (all pre-screening and safety checks passed)
-    if eligible_briefs:
+    try:
+        met_brief_ids, brief_reasonings, decision_details["contentAgainstBriefCheck"] = _evaluate_eligible_briefs(
+            video_id, video_data, briefs, eligible_briefs, prescreening_results, transcript, channel_value
+        )
+    except RuntimeError as e:
+        return _reject_for_brief_system_error(e, briefs, decision_details)
+    
+    return met_brief_ids, brief_reasonings
+
+
+def _evaluate_briefs_with_concurrent_injection_check(video_id, video_data, briefs, eligible_briefs,
+                                                     prescreening_results, transcript, decision_details,
+                                                     channel_value=None):
+    """
+    Run the prompt injection check in the background while briefs are evaluated.
+    
+    The injection check writes into its own dictionary and only this thread touches
+    decision_details, so the outcome is identical to the serial path: if injection is
+    detected the brief results are discarded. Brief LLM calls are still spent on
+    videos that turn out to be injected, in exchange for hiding the check's latency.
+    
+    Returns:
+        tuple: (met_brief_ids, brief_reasonings)
+    """
+    injection_details = {}
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        injection_future = executor.submit(
+            check_prompt_injection, video_id, video_data, transcript, injection_details
+        )
+        brief_error = None
         try:
-            # Create a temporary decision_details for eligible briefs only
-            temp_decision_details = {"contentAgainstBriefCheck": []}
-            met_brief_ids, eligible_brief_reasonings = evaluate_content_against_briefs(
-                eligible_briefs, video_data, transcript, temp_decision_details
-            )
-            eligible_brief_results = temp_decision_details["contentAgainstBriefCheck"]
-            
-            # Map results back to original brief order
-            brief_reasonings, content_against_brief_results = map_brief_results_to_original_order(
-                eligible_brief_reasonings, eligible_brief_results, prescreening_results
+            brief_outcome = _evaluate_eligible_briefs(
+                video_id, video_data, briefs, eligible_briefs, prescreening_results, transcript, channel_value
             )
-            
-            decision_details["contentAgainstBriefCheck"] = content_against_brief_results
-                    
         except RuntimeError as e:
-            bt.logging.error(f"System error during brief evaluation: {e}")
-            decision_details["video_vet_result"] = False
-            decision_details["contentAgainstBriefCheck"] = [False] * len(briefs)
-            return [], ["Brief evaluation system error"] * len(briefs)
+            brief_error = e
+        injection_passed = injection_future.result()
+    
+    decision_details["promptInjectionCheck"] = injection_details.get("promptInjectionCheck", injection_passed)
+    if not injection_passed:
+        bt.logging.info(f"Discarding brief results for video {video_id} after failed prompt injection check")
+        return _reject_for_prompt_injection(briefs, decision_details)
+    if brief_error is not None:
+        return _reject_for_brief_system_error(brief_error, briefs, decision_details)
     
+    met_brief_ids, brief_reasonings, decision_details["contentAgainstBriefCheck"] = brief_outcome
     return met_brief_ids, brief_reasonings
 
 
+def _evaluate_eligible_briefs(video_id, video_data, briefs, eligible_briefs, prescreening_results, transcript,
+                              channel_value=None):
+    """
+    Evaluate the pre-screened briefs against the video content.
+    
+    Writes nothing to the video's decision details, so it can run alongside the
+    prompt injection check.
+    
+    Returns:
+        tuple: (met_brief_ids, brief_reasonings, content_against_brief_results) in original brief order
+    
+    Raises:
+        RuntimeError: On brief evaluation system errors
+    """
+    met_brief_ids = []
+    
+    # Optionally drop briefs with too little lexical overlap before calling the LLM
+    keep_flags, relevance_scores = prefilter_briefs_by_relevance(
+        video_id, eligible_briefs, briefs, video_data.get("description", ""), transcript
+    )
+    skip_reasons = [
+        None if keep else f"Skipped by lexical relevance prefilter (score {score:.3f})"
+        for keep, score in zip(keep_flags, relevance_scores or [0.0] * len(eligible_briefs))
+    ]
+    
+    # Defer the lowest-value evaluations once the cycle's LLM budget runs low
+    scheduler = get_llm_budget_scheduler()
+    pending = [i for i, reason in enumerate(skip_reasons) if reason is None]
+    admitted = scheduler.admit([eligible_briefs[i] for i in pending], channel_value)
+    for i, admit in zip(pending, admitted):
+        if not admit:
+            skip_reasons[i] = DEFERRED_REASONING
+    if not all(admitted):
+        bt.logging.info(f"Deferred {admitted.count(False)} brief evaluation(s) for video {video_id}: LLM budget exhausted")
+    
+    llm_indices = [i for i, reason in enumerate(skip_reasons) if reason is None]
+    llm_briefs = [eligible_briefs[i] for i in llm_indices]
+    
+    # Create a temporary decision_details for eligible briefs only
+    temp_decision_details = {"contentAgainstBriefCheck": []}
+    if llm_briefs:
+        # Charge only the requests made for these briefs, not concurrent injection checks
+        meter = RequestMeter()
+        try:
+            with metered(meter):
+                met_brief_ids, llm_brief_reasonings = evaluate_content_against_briefs(
+                    llm_briefs, video_data, transcript, temp_decision_details
+                )
+        finally:
+            if scheduler.enabled:
+                scheduler.charge(meter.requests)
+    else:
+        llm_brief_reasonings = []
+    log_shadow_verdicts(
+        video_id, llm_briefs,
+        [relevance_scores[i] for i in llm_indices] if relevance_scores is not None else None,
+        temp_decision_details.get("briefMatchResults", temp_decision_details["contentAgainstBriefCheck"])
+    )
+    
+    eligible_brief_results = temp_decision_details["contentAgainstBriefCheck"]
+    eligible_brief_reasonings = llm_brief_reasonings
+    if len(llm_briefs) < len(eligible_briefs):
+        # Re-insert the briefs skipped by the prefilter or deferred by the budget as not met
+        llm_results = iter(zip(eligible_brief_results, eligible_brief_reasonings))
+        eligible_brief_results = []
+        eligible_brief_reasonings = []
+        for reason in skip_reasons:
+            if reason is None:
+                result, reasoning = next(llm_results, (False, "Evaluation result missing"))
+            else:
+                result, reasoning = False, reason
+            eligible_brief_results.append(result)
+            eligible_brief_reasonings.append(reasoning)
+    
+    # Map results back to original brief order
+    brief_reasonings, content_against_brief_results = map_brief_results_to_original_order(
+        eligible_brief_reasonings, eligible_brief_results, prescreening_results
+    )
+    return met_brief_ids, brief_reasonings, content_against_brief_results
+
+
+def _reject_for_prompt_injection(briefs, decision_details):
+    decision_details["video_vet_result"] = False
+    decision_details["contentAgainstBriefCheck"] = [False] * len(briefs)
+    return [], ["Video failed prompt injection check"] * len(briefs)
+
+
+def _reject_for_brief_system_error(error, briefs, decision_details):
+    bt.logging.error(f"System error during brief evaluation: {error}")
+    decision_details["video_vet_result"] = False
+    decision_details["contentAgainstBriefCheck"] = [False] * len(briefs)
+    return [], ["Brief evaluation system error"] * len(briefs)
+
+
 def _compile_evaluation_results(met_brief_ids, decision_details, brief_reasonings):
     """
     Compile final evaluation results.
@@ -241,7 +369,7 @@ def _compile_evaluation_results(met_brief_ids, decision_details, brief_reasoning
     }
 
 
-def vet_video(video_id, briefs, video_data, video_analytics):
+def vet_video(video_id, briefs, video_data, video_analytics, channel_value=None):
     """
     Vet a single video against all criteria and briefs.
     
@@ -250,6 +378,7 @@ def vet_video(video_id, briefs, video_data, video_analytics):
         briefs (list): List of brief dictionaries to evaluate against
         video_data (dict): Video metadata
         video_analytics (dict): Video analytics data
+        channel_value (float, optional): Channel value used by the LLM budget scheduler
         
     Returns:
         dict: Dictionary containing met_brief_ids, decision_details, and brief_reasonings
@@ -267,7 +396,7 @@ def vet_video(video_id, briefs, video_data, video_analytics):
     brief_reasonings = []
     if all_checks_passed:
         met_brief_ids, brief_reasonings = _process_video_transcript_and_briefs(
-            video_id, video_data, briefs, decision_details
+            video_id, video_data, briefs, decision_details, channel_value
         )
     else:
         # If any check failed, set all briefs to false and prompt injection to false
@@ -290,7 +419,7 @@ def vet_video(video_id, briefs, video_data, video_analytics):
 
 
 def process_video_vetting(video_id, briefs, youtube_data_client, youtube_analytics_client, 
-                         results, video_data, video_analytics, video_decision_details):
+                         results, video_data, video_analytics, video_decision_details, channel_value=None):
     """
     Process vetting for a single video and update results.
     
@@ -303,6 +432,7 @@ def process_video_vetting(video_id, briefs, youtube_data_client, youtube_analyti
         video_data (dict): Video metadata
         video_analytics (dict): Video analytics data
         video_decision_details (dict): Video decision details to update
+        channel_value (float, optional): Channel value used by the LLM budget scheduler
     """
     if video_data is None:
         bt.logging.warning(f"No video data for {video_id}, skipping")
@@ -316,7 +446,7 @@ def process_video_vetting(video_id, briefs, youtube_data_client, youtube_analyti
     
     try:
         # Vet the video against all briefs
-        video_result = vet_video(video_id, briefs, video_data, video_analytics)
+        video_result = vet_video(video_id, briefs, video_data, video_analytics, channel_value)
         
         # Extract the boolean results for each brief
         brief_results = video_result["decision_details"]["contentAgainstBriefCheck"]
@@ -330,7 +460,8 @@ def process_video_vetting(video_id, briefs, youtube_data_client, youtube_analyti
         results[video_id] = [False] * len(briefs)
 
 
-def vet_videos(video_ids, briefs, youtube_data_client, youtube_analytics_client, is_ypp_account=True):
+def vet_videos(video_ids, briefs, youtube_data_client, youtube_analytics_client, is_ypp_account=True,
+               channel_value=None):
     """
     Vet multiple videos against briefs and return results.
     
@@ -340,6 +471,7 @@ def vet_videos(video_ids, briefs, youtube_data_client, youtube_analytics_client,
         youtube_data_client: YouTube Data API client
         youtube_analytics_client: YouTube Analytics API client
         is_ypp_account (bool): Whether this is a YPP account (affects revenue metrics)
+        channel_value (float, optional): Channel value used by the LLM budget scheduler
         
     Returns:
         tuple: (results, video_data_dict, video_analytics_dict, video_decision_details)
@@ -385,7 +517,8 @@ def vet_videos(video_ids, briefs, youtube_data_client, youtube_analytics_client,
                 results, 
                 video_data,
                 video_analytics,
-                video_decision_details
+                video_decision_details,
+                channel_value
             )
             
             # Only mark the video as scored if processing was successful
@@ -0,0 +1,171 @@
+"""
+Local lexical relevance prefilter for brief evaluation.
+
+Scores how well a video's description and transcript cover the vocabulary of
+each candidate brief before the (expensive) LLM brief check runs. Scoring is
+BM25-style: brief terms are weighted by their inverse document frequency across
+all active briefs, and their frequency in the video text is saturated. The
+result is normalized to [0, 1). Everything runs locally with no model downloads.
+
+Modes (LEXICAL_PREFILTER_MODE):
+- off:     no scoring (default)
+- shadow:  score every pair and log it together with the LLM verdict, never skip
+- enforce: skip the LLM check for pairs scoring below LEXICAL_PREFILTER_THRESHOLD
+"""
+
+import json
+import math
+import os
+import re
+import time
+from collections import Counter
+from threading import Lock
+from typing import Dict, List, Optional
+
+import bittensor as bt
+
+from bitcast.validator.utils.config import (
+    CACHE_DIRS,
+    LEXICAL_PREFILTER_MODE,
+    LEXICAL_PREFILTER_THRESHOLD
+)
+
+# BM25 term-frequency saturation
+BM25_K1 = 1.2
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Common English words plus the field names of the serialized transcript
+_STOPWORDS = frozenset("""
+    about above after again against all also and any are because been before being below between both
+    but can could did does doing down during each few for from further had has have having her here
+    hers him his how into its itself just more most must not now off once only other our ours out over
+    own same she should some such than that the their theirs them then there these they this those
+    through too under until very was were what when where which while who whom why will with would you
+    your yours video videos content creator brief include including make sure start dur duration text
+""".split())
+
+_log_lock = Lock()
+PREFILTER_LOG_FILE = os.path.join(CACHE_DIRS["lexical_prefilter"], "prefilter_pairs.jsonl")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase word tokens, without stopwords, short tokens or pure numbers."""
+    if not text:
+        return []
+    return [
+        token for token in _TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 2 and not token.isdigit() and token not in _STOPWORDS
+    ]
+
+
+def _brief_text(brief) -> str:
+    return f"{brief.get('title', '')} {brief.get('brief', '')}"
+
+
+def compute_idf(briefs) -> Dict[str, float]:
+    """Inverse document frequency of each term, using the active briefs as the corpus."""
+    document_frequency = Counter()
+    for brief in briefs:
+        document_frequency.update(set(tokenize(_brief_text(brief))))
+    corpus_size = len(briefs)
+    return {
+        term: math.log(1 + (corpus_size - df + 0.5) / (df + 0.5))
+        for term, df in document_frequency.items()
+    }
+
+
+def score_brief_relevance(brief, video_terms: Counter, idf: Dict[str, float]) -> float:
+    """
+    Score a brief against the term counts of a video's description and transcript.
+
+    Returns:
+        float: Normalized score in [0, 1); 1.0 when the brief has no scorable terms
+    """
+    brief_terms = set(tokenize(_brief_text(brief)))
+    if not brief_terms:
+        return 1.0
+
+    total_weight = 0.0
+    matched_weight = 0.0
+    for term in brief_terms:
+        weight = idf.get(term, math.log(2))
+        total_weight += weight
+        frequency = video_terms.get(term, 0)
+        if frequency:
+            matched_weight += weight * frequency / (frequency + BM25_K1)
+    return matched_weight / total_weight
+
+
+def _record_pairs(records: List[dict]) -> None:
+    """Append prefilter decisions to the JSONL log used for offline precision/recall analysis."""
+    if not records:
+        return
+    try:
+        with _log_lock:
+            os.makedirs(CACHE_DIRS["lexical_prefilter"], exist_ok=True)
+            with open(PREFILTER_LOG_FILE, "a") as log_file:
+                for record in records:
+                    log_file.write(json.dumps(record) + "\n")
+    except OSError as e:
+        bt.logging.warning(f"Failed to write lexical prefilter log: {e}")
+
+
+def prefilter_briefs_by_relevance(video_id, candidate_briefs, all_briefs, description, transcript):
+    """
+    Decide which candidate briefs still need an LLM evaluation.
+
+    Args:
+        video_id (str): Video ID, used for logging
+        candidate_briefs (list): Briefs that passed the identifier/date prescreen
+        all_briefs (list): All active briefs, used as the IDF corpus
+        description (str): Video description
+        transcript (str): Video transcript
+
+    Returns:
+        tuple: (keep_flags, scores) aligned with candidate_briefs; scores is None when the prefilter is off
+    """
+    if LEXICAL_PREFILTER_MODE not in ("shadow", "enforce") or not candidate_briefs:
+        return [True] * len(candidate_briefs), None
+
+    idf = compute_idf(all_briefs)
+    video_terms = Counter(tokenize(description))
+    video_terms.update(tokenize(transcript))
+    scores = [score_brief_relevance(brief, video_terms, idf) for brief in candidate_briefs]
+
+    if LEXICAL_PREFILTER_MODE == "shadow":
+        return [True] * len(candidate_briefs), scores
+
+    keep_flags = [score >= LEXICAL_PREFILTER_THRESHOLD for score in scores]
+    records = []
+    for brief, score, keep in zip(candidate_briefs, scores, keep_flags):
+        if not keep:
+            bt.logging.info(
+                f"Meets brief '{brief['id']}': False ❌ (lexical prefilter: {score:.3f} < {LEXICAL_PREFILTER_THRESHOLD})"
+            )
+            records.append(_pair_record(video_id, brief, score, "skipped"))
+    _record_pairs(records)
+    return keep_flags, scores
+
+
+def log_shadow_verdicts(video_id, candidate_briefs, scores, verdicts) -> None:
+    """In shadow mode, log every scored pair with the LLM verdict for threshold calibration."""
+    if LEXICAL_PREFILTER_MODE != "shadow" or scores is None:
+        return
+    records = []
+    for brief, score, verdict in zip(candidate_briefs, scores, verdicts):
+        decision = "would_skip" if score < LEXICAL_PREFILTER_THRESHOLD else "keep"
+        records.append(_pair_record(video_id, brief, score, decision, verdict))
+    _record_pairs(records)
+
+
+def _pair_record(video_id, brief, score, decision, llm_verdict=None) -> dict:
+    return {
+        "timestamp": time.time(),
+        "video_id": video_id,
+        "brief_id": brief["id"],
+        "score": round(score, 6),
+        "threshold": LEXICAL_PREFILTER_THRESHOLD,
+        "decision": decision,
+        "llm_verdict": llm_verdict,
+    }
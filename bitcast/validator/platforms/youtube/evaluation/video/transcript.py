@@ -12,8 +12,9 @@ from bitcast.validator.platforms.youtube.api.transcript import (
     get_video_transcript as fetch_video_transcript_api,
 )
 from bitcast.validator.platforms.youtube.utils import _format_error
-from bitcast.validator.utils.config import RAPID_API_KEY
+from bitcast.validator.utils.config import PROMPT_INJECTION_PREFILTER, RAPID_API_KEY
 from bitcast.validator.utils.error_handling import log_and_raise_api_error
+from .injection_prefilter import assess_injection_risk
 
 
 def get_video_transcript(video_id, video_data):
@@ -65,6 +66,17 @@ def check_prompt_injection(video_id, video_data, transcript, decision_details):
         bool: True if no prompt injection detected, False otherwise
     """
     try:
+        if PROMPT_INJECTION_PREFILTER:
+            assessment = assess_injection_risk(video_data.get("description", ""), transcript)
+            if not assessment.escalate:
+                bt.logging.info(f"Prompt injection prefilter cleared video {video_id} (score {assessment.score})")
+                decision_details["promptInjectionCheck"] = True
+                return True
+            bt.logging.info(
+                f"Prompt injection prefilter escalating video {video_id} to LLM check "
+                f"(score {assessment.score}, rules: {', '.join(assessment.matched_rules)})"
+            )
+        
         has_prompt_injection = check_for_prompt_injection(video_data.get("description", ""), transcript)
         
         if has_prompt_injection:
@@ -14,6 +14,8 @@ from bitcast.validator.utils.config import (
     YT_SCORING_WINDOW,
     YT_REWARD_DELAY,
 )
+from bitcast.validator.utils.brief_model import get_brief_date_range
+from bitcast.validator.utils.cycle_context import get_active_cycle
 
 
 def initialize_decision_details():
@@ -54,6 +56,15 @@ def check_video_privacy(video_data, decision_details):
         return True
 
 
+def _get_known_publish_range(brief):
+    """Pre-parsed range of a compiled brief or the one precomputed for the active cycle, else None."""
+    date_range = getattr(brief, "publish_date_range", None)
+    if date_range is None:
+        cycle = get_active_cycle()
+        date_range = cycle.brief_date_range(brief) if cycle is not None else None
+    return date_range
+
+
 def check_brief_publish_date_range(video_data, brief):
     """
     Check if video publish date falls within brief's allowed date range.
@@ -75,12 +86,8 @@ def check_brief_publish_date_range(video_data, brief):
             published_at.replace('Z', '+00:00')
         ).replace(tzinfo=None)
         
-        # Parse brief dates and apply buffer to start date only
-        brief_start = datetime.fromisoformat(brief["start_date"])
-        brief_end = datetime.fromisoformat(brief["end_date"])
-        
-        allowed_start = brief_start - timedelta(days=YT_VIDEO_RELEASE_BUFFER)
-        allowed_end = brief_end.replace(hour=23, minute=59, second=59, microsecond=999999)
+        # Brief dates with buffer applied to start date only
+        allowed_start, allowed_end = _get_known_publish_range(brief) or get_brief_date_range(brief)
         
         # Check if video is within allowed range
         return allowed_start <= video_publish_date <= allowed_end
@@ -117,8 +124,12 @@ def check_video_publish_date(video_data, briefs, decision_details):
         # Find earliest allowed date among all briefs
         earliest_allowed_date = None
         for brief in briefs:
-            brief_start = datetime.fromisoformat(brief["start_date"])
-            allowed_start = brief_start - timedelta(days=YT_VIDEO_RELEASE_BUFFER)
+            date_range = _get_known_publish_range(brief)
+            if date_range is not None:
+                allowed_start = date_range[0]
+            else:
+                brief_start = datetime.fromisoformat(brief["start_date"])
+                allowed_start = brief_start - timedelta(days=YT_VIDEO_RELEASE_BUFFER)
             if earliest_allowed_date is None or allowed_start < earliest_allowed_date:
                 earliest_allowed_date = allowed_start
         
@@ -159,9 +170,13 @@ def check_video_age_limit(video_data, decision_details):
         
         # Calculate the cutoff date (start of day that is YT_SCORING_WINDOW + YT_REWARD_DELAY days ago)
         # This ensures videos published any time on the cutoff day are still considered valid
-        cutoff_date = (datetime.now() - timedelta(days=YT_SCORING_WINDOW + YT_REWARD_DELAY)).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
+        cycle = get_active_cycle()
+        if cycle is not None:
+            cutoff_date = cycle.age_cutoff
+        else:
+            cutoff_date = (datetime.now() - timedelta(days=YT_SCORING_WINDOW + YT_REWARD_DELAY)).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
         
         if video_publish_date < cutoff_date:
             bt.logging.warning(f"Video is too old: published {video_publish_date}, cutoff {cutoff_date}")
@@ -0,0 +1,144 @@
+"""
+Compact per-video record stored in result["videos"].
+
+process_single_video creates one VideoRecord per evaluated video instead of a
+dict. Its fields are slots, so a record is a fraction of the size of the
+equivalent dict, and code that holds a record can read fields as attributes.
+A VideoRecord is also a MutableMapping over the fields that have been set, so
+existing `video["score"] = ...`, `"brief_metrics" in video` and `.get(...)`
+access keeps working and a record compares equal to the dict it replaces.
+
+Publishing and serialization use to_dict() (or dict(record)), which returns a
+plain dict with the same keys.
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional
+
+# Field order is the key order of the dicts records replace
+VIDEO_RECORD_FIELDS = (
+    "details",
+    "analytics",
+    "matches_brief",
+    "matching_brief_ids",
+    "url",
+    "vet_outcomes",
+    "decision_details",
+    "base_score",
+    "daily_analytics",
+    "scoring_method",
+    "cap_info",
+    "brief_metrics",
+    "usd_targets",
+    "score",
+    "score_limited",
+)
+_FIELDS = frozenset(VIDEO_RECORD_FIELDS)
+
+
+class VideoRecord(MutableMapping):
+    """
+    Evaluation state of one video.
+
+    Fields:
+        details: Video metadata from the Data API (bitcastVideoId, publishedAt, ...)
+        analytics: Video analytics returned for the configured metric set
+        matches_brief / matching_brief_ids / vet_outcomes / decision_details: Vetting outcome
+        url: Watch URL
+        base_score / daily_analytics / scoring_method / cap_info: Curve scoring output
+        brief_metrics / usd_targets / score: Per-brief metrics, USD targets and headline score
+        score_limited: Per-brief max_count limiting details
+
+    Fields that have not been set are absent from the mapping view. Keys outside
+    these fields are accepted and kept in a small overflow dict.
+    """
+
+    __slots__ = VIDEO_RECORD_FIELDS + ("_extra",)
+
+    def __init__(
+        self,
+        details: Dict[str, Any],
+        analytics: Dict[str, Any],
+        matches_brief: bool,
+        matching_brief_ids: List[str],
+        url: str,
+        vet_outcomes: List[bool],
+        decision_details: Dict[str, Any],
+        **fields: Any
+    ):
+        self.details = details
+        self.analytics = analytics
+        self.matches_brief = matches_brief
+        self.matching_brief_ids = matching_brief_ids
+        self.url = url
+        self.vet_outcomes = vet_outcomes
+        self.decision_details = decision_details
+        self._extra: Optional[Dict[str, Any]] = None
+        for key, value in fields.items():
+            self[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _FIELDS:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in _FIELDS:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in _FIELDS:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for key in VIDEO_RECORD_FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"VideoRecord({self.to_dict()!r})"
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._extra = None
+        for key, value in state.items():
+            self[key] = value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _FIELDS:
+            return getattr(self, key, default)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the fields that have been set, for publishing and serialization."""
+        return {key: self[key] for key in self}
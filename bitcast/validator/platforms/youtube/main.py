@@ -2,8 +2,15 @@ from datetime import datetime, timedelta
 import time
 
 import bittensor as bt
+import numpy as np
 
-from bitcast.validator.clients.llm_client import get_llm_request_count, reset_llm_request_count
+from bitcast.validator.clients.llm_client import (
+    get_llm_calls_saved,
+    get_llm_request_count,
+    get_llm_usage,
+    reset_llm_request_count,
+    reset_llm_usage,
+)
 from bitcast.validator.platforms.youtube.api import (
     get_channel_analytics,
     get_channel_data,
@@ -12,24 +19,37 @@ from bitcast.validator.platforms.youtube.api import (
 from bitcast.validator.platforms.youtube.api.video import get_all_uploads
 from bitcast.validator.platforms.youtube.evaluation import (
     calculate_video_score,
+    calculate_video_scores_batch,
+    median_cache_channel,
     vet_channel,
     vet_videos,
 )
+from bitcast.validator.platforms.youtube.evaluation.video.video_record import VideoRecord
+from bitcast.validator.platforms.youtube.evaluation.video.llm_budget import (
+    get_channel_value,
+    get_llm_budget_account_deferred,
+    reset_llm_budget_account_stats,
+)
 from bitcast.validator.platforms.youtube.utils import _format_error, state
 from bitcast.validator.platforms.youtube.utils.historical_videos import (
     add_historical_videos_to_list,
     record_matching_video,
 )
+from bitcast.validator.utils.cycle_context import get_active_cycle
 from bitcast.validator.utils.config import (
     DISCRETE_MODE,
     ECO_MODE,
+    YT_BATCH_SCORING,
     YT_LOOKBACK,
     YT_SCALING_FACTOR_DEDICATED,
     YT_SCALING_FACTOR_AD_READ,
     YT_LIFETIME_DEDUCTION,
     YT_LIFETIME_DEDUCTION_AD_READ,
 )
-from bitcast.validator.platforms.youtube.evaluation.curve_scoring import calculate_adjusted_curve_difference
+from bitcast.validator.platforms.youtube.evaluation.curve_scoring import (
+    calculate_adjusted_curve_difference,
+    calculate_adjusted_curve_differences,
+)
 from bitcast.validator.utils.token_pricing import get_bitcast_alpha_price, get_total_miner_emissions
 
 
@@ -41,19 +61,15 @@ def eval_youtube(creds, briefs, min_stake=False):
     # Reset API call counters for this token evaluation
     state.reset_api_call_counts()
     reset_llm_request_count()
+    reset_llm_usage("account")
+    reset_llm_budget_account_stats()
     start = time.perf_counter()
     
     # Get and process channel information
     channel_data, channel_analytics = get_channel_information(youtube_data_client, youtube_analytics_client)
     if channel_data is None or channel_analytics is None:
         # Attach API call counts on early exit
-        elapsed = time.perf_counter() - start
-        result["performance_stats"] = {
-            "data_api_calls": state.data_api_call_count,
-            "analytics_api_calls": state.analytics_api_call_count,
-            "llm_requests": get_llm_request_count(),
-            "evaluation_time_s": elapsed
-        }
+        result["performance_stats"] = _build_performance_stats(start)
         return result
     
     # Store channel details in the result
@@ -67,27 +83,28 @@ def eval_youtube(creds, briefs, min_stake=False):
     if not channel_vet_result and ECO_MODE:
         bt.logging.info("Channel vetting failed and ECO_MODE is enabled - exiting early")
         # Attach API call counts on early exit
-        elapsed = time.perf_counter() - start
-        result["performance_stats"] = {
-            "data_api_calls": state.data_api_call_count,
-            "analytics_api_calls": state.analytics_api_call_count,
-            "llm_requests": get_llm_request_count(),
-            "evaluation_time_s": elapsed
-        }
+        result["performance_stats"] = _build_performance_stats(start)
         return result
 
-    # Process videos and update the result
-    result = process_videos(youtube_data_client, youtube_analytics_client, briefs, result, min_stake)
+    # Process videos and update the result; cap medians are shared across the channel's videos
+    with median_cache_channel(channel_data.get("id")):
+        result = process_videos(youtube_data_client, youtube_analytics_client, briefs, result, min_stake)
     # Attach performance stats to result after full evaluation
-    elapsed = time.perf_counter() - start
-    result["performance_stats"] = {
+    result["performance_stats"] = _build_performance_stats(start)
+    
+    return result
+
+def _build_performance_stats(start):
+    """Collect API usage counters and elapsed time for the current token evaluation."""
+    return {
         "data_api_calls": state.data_api_call_count,
         "analytics_api_calls": state.analytics_api_call_count,
         "llm_requests": get_llm_request_count(),
-        "evaluation_time_s": elapsed
+        "llm_calls_saved": get_llm_calls_saved(),
+        "llm_budget_deferred": get_llm_budget_account_deferred(),
+        "llm_usage": get_llm_usage("account"),
+        "evaluation_time_s": time.perf_counter() - start
     }
-    
-    return result
 
 def initialize_youtube_evaluation(creds, briefs):
     """Initialize the result structure and YouTube API clients."""
@@ -114,8 +131,12 @@ def get_channel_information(youtube_data_client, youtube_analytics_client):
         channel_data = get_channel_data(youtube_data_client, DISCRETE_MODE)
         
         # Calculate date range for the last YT_LOOKBACK days
-        end_date = datetime.now().strftime('%Y-%m-%d')
-        start_date = (datetime.now() - timedelta(days=YT_LOOKBACK)).strftime('%Y-%m-%d')
+        cycle = get_active_cycle()
+        if cycle is not None:
+            start_date, end_date = cycle.lookback_period
+        else:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+            start_date = (datetime.now() - timedelta(days=YT_LOOKBACK)).strftime('%Y-%m-%d')
         
         channel_analytics = get_channel_analytics(youtube_analytics_client, start_date=start_date, end_date=end_date)
         return channel_data, channel_analytics
@@ -179,15 +200,16 @@ def apply_video_limits(briefs, result):
         
         for video_info in videos_to_limit:
             video_id = video_info["video_id"]
+            video = result["videos"][video_id]
             original_score = video_info["score"]
             
             # Update USD target for this brief to 0
-            if "usd_targets" in result["videos"][video_id]:
-                result["videos"][video_id]["usd_targets"][brief_id] = 0
+            if "usd_targets" in video:
+                video["usd_targets"][brief_id] = 0
                 
             # Update per-video metrics to reflect limitation
-            if "brief_metrics" in result["videos"][video_id] and brief_id in result["videos"][video_id]["brief_metrics"]:
-                metrics = result["videos"][video_id]["brief_metrics"][brief_id]
+            if "brief_metrics" in video and brief_id in video["brief_metrics"]:
+                metrics = video["brief_metrics"][brief_id]
                 metrics["limitation_status"] = "limited_fifo"
                 # Reset all metrics for limited videos
                 metrics["usd_target"] = 0
@@ -195,13 +217,13 @@ def apply_video_limits(briefs, result):
                 metrics["weight"] = 0
             
             # Update backward-compatible "score" field (highest remaining USD target)
-            remaining_scores = [s for s in result["videos"][video_id].get("usd_targets", {}).values() if s > 0]
-            result["videos"][video_id]["score"] = max(remaining_scores) if remaining_scores else 0
+            remaining_scores = [s for s in video.get("usd_targets", {}).values() if s > 0]
+            video["score"] = max(remaining_scores) if remaining_scores else 0
             
             # Add metadata to track this was limited
-            if "score_limited" not in result["videos"][video_id]:
-                result["videos"][video_id]["score_limited"] = {}
-            result["videos"][video_id]["score_limited"][brief_id] = {
+            if "score_limited" not in video:
+                video["score_limited"] = {}
+            video["score_limited"][brief_id] = {
                 "original_score": original_score,
                 "reason": f"exceeded_{brief_format}_brief_limit_fifo"
             }
@@ -236,13 +258,15 @@ def process_videos(youtube_data_client, youtube_analytics_client, briefs, result
         
         # Vet videos and store the results (includes both recent and historical videos)
         video_matches, video_data_dict, video_analytics_dict, video_decision_details = vet_videos(
-            all_video_ids, briefs, youtube_data_client, youtube_analytics_client, is_ypp_account
+            all_video_ids, briefs, youtube_data_client, youtube_analytics_client, is_ypp_account,
+            channel_value=get_channel_value(result["yt_account"]["analytics"])
         )
         
         # Get channel analytics for median cap calculation
         channel_analytics = result["yt_account"]["analytics"]
         
         # Process each video and update the result (includes both recent and historical)
+        pending_scores = [] if YT_BATCH_SCORING else None
         for video_id in all_video_ids:
             if video_id in video_data_dict and video_id in video_analytics_dict:
                 process_single_video(
@@ -256,9 +280,17 @@ def process_videos(youtube_data_client, youtube_analytics_client, briefs, result
                     result,
                     is_ypp_account,
                     channel_analytics,
-                    min_stake
+                    min_stake,
+                    pending_scores=pending_scores
                 )
         
+        # Score all matched videos together, in processing order
+        if pending_scores:
+            update_video_scores_batch(
+                pending_scores, youtube_analytics_client, video_matches, briefs, result,
+                is_ypp_account, channel_analytics, min_stake
+            )
+        
         # Apply video scoring limits for dedicated briefs
         apply_video_limits(briefs, result)
         
@@ -273,8 +305,11 @@ def process_videos(youtube_data_client, youtube_analytics_client, briefs, result
 
 def process_single_video(video_id, video_data_dict, video_analytics_dict, video_matches, 
                          video_decision_details, briefs, youtube_analytics_client, result,
-                         is_ypp_account, channel_analytics=None, min_stake=False):
-    """Process a single video and update the result structure."""
+                         is_ypp_account, channel_analytics=None, min_stake=False, pending_scores=None):
+    """Process a single video and update the result structure.
+    
+    When pending_scores is a list, a matching video is appended to it for
+    update_video_scores_batch instead of being scored immediately."""
     video_data = video_data_dict[video_id]
     video_analytics = video_analytics_dict[video_id]
     
@@ -286,15 +321,15 @@ def process_single_video(video_id, video_data_dict, video_analytics_dict, video_
     decision_details["evaluated_brief_ids"] = [brief["id"] for brief in briefs]
 
     # Store video details in the result
-    result["videos"][video_id] = {
-        "details": video_data,
-        "analytics": video_analytics,
-        "matches_brief": matches_any_brief,
-        "matching_brief_ids": matching_brief_ids,
-        "url": f"https://www.youtube.com/watch?v={video_id}",
-        "vet_outcomes": video_matches.get(video_id, []),
-        "decision_details": decision_details
-    }
+    result["videos"][video_id] = VideoRecord(
+        details=video_data,
+        analytics=video_analytics,
+        matches_brief=matches_any_brief,
+        matching_brief_ids=matching_brief_ids,
+        url=f"https://www.youtube.com/watch?v={video_id}",
+        vet_outcomes=video_matches.get(video_id, []),
+        decision_details=decision_details
+    )
     
     # Check the overall vetting result
     video_vet_result = video_decision_details.get(video_id, {}).get("video_vet_result", False)
@@ -302,7 +337,10 @@ def process_single_video(video_id, video_data_dict, video_analytics_dict, video_
     # Calculate and store the score if the video passes vetting and matches a brief
     if video_vet_result and matches_any_brief:
         record_matching_video(video_id, video_data, matching_brief_ids, result)
-        update_video_score(video_id, youtube_analytics_client, video_matches, briefs, result, is_ypp_account, channel_analytics, min_stake)
+        if pending_scores is not None:
+            pending_scores.append(video_id)
+        else:
+            update_video_score(video_id, youtube_analytics_client, video_matches, briefs, result, is_ypp_account, channel_analytics, min_stake)
     else:
         result["videos"][video_id]["score"] = 0
 
@@ -348,6 +386,14 @@ def _get_lifetime_deduction(brief_format: str) -> float:
     return deductions.get(brief_format, YT_LIFETIME_DEDUCTION)
 
 
+def _get_pricing():
+    """Alpha price (USD) and total daily miner alpha: the cycle snapshot when active, else fetched."""
+    cycle = get_active_cycle()
+    if cycle is not None and cycle.pricing is not None:
+        return cycle.pricing.alpha_price_usd, cycle.pricing.total_daily_alpha
+    return get_bitcast_alpha_price(), get_total_miner_emissions()
+
+
 def _calculate_per_video_metrics(
     base_score: float,
     scaling_factor: float,
@@ -381,8 +427,7 @@ def _calculate_per_video_metrics(
         usd_target = adjusted_score * scaling_factor * boost_factor
         
         # Get pricing information for weight normalization
-        alpha_price_usd = get_bitcast_alpha_price()
-        total_daily_alpha = get_total_miner_emissions()
+        alpha_price_usd, total_daily_alpha = _get_pricing()
         total_daily_usd = alpha_price_usd * total_daily_alpha
         
         # Calculate alpha target and normalized weight
@@ -421,19 +466,131 @@ def _calculate_per_video_metrics(
         }
 
 
+def _calculate_per_video_metrics_batch(metric_inputs) -> list:
+    """Vectorized _calculate_per_video_metrics over many (video, brief) pairs.
+    
+    Args:
+        metric_inputs: (base_score, scaling_factor, boost_factor, curve_input_day1,
+            curve_input_day2, lifetime_deduction) per pair
+        
+    Returns:
+        list: Per-video metrics dict per pair, identical to _calculate_per_video_metrics
+    """
+    if not metric_inputs:
+        return []
+    
+    try:
+        base_scores, scaling_factors, boost_factors, day1_inputs, day2_inputs, deductions = zip(*metric_inputs)
+        if not all(isinstance(value, (int, float)) for value in day1_inputs + day2_inputs):
+            raise TypeError("missing or non-numeric curve inputs")
+        adjusted_scores = calculate_adjusted_curve_differences(day1_inputs, day2_inputs, scaling_factors, deductions)
+        usd_targets = adjusted_scores * np.asarray(scaling_factors, dtype=np.float64) * np.asarray(boost_factors, dtype=np.float64)
+        
+        # Get pricing information for weight normalization, once for all pairs
+        alpha_price_usd, total_daily_alpha = _get_pricing()
+        total_daily_usd = alpha_price_usd * total_daily_alpha
+        
+        alpha_targets = usd_targets / alpha_price_usd if alpha_price_usd > 0 else np.zeros_like(usd_targets)
+        weights = usd_targets / total_daily_usd if total_daily_usd > 0 else np.zeros_like(usd_targets)
+    except Exception as e:
+        bt.logging.warning(f"Batch per-video metrics failed, calculating per pair: {e}")
+        return [_calculate_per_video_metrics(*inputs) for inputs in metric_inputs]
+    
+    metrics_list = []
+    for base_score, scaling_factor, boost_factor, usd_target, alpha_target, weight in zip(
+        base_scores, scaling_factors, boost_factors, usd_targets.tolist(), alpha_targets.tolist(), weights.tolist()
+    ):
+        if boost_factor < 0.1 or boost_factor > 10.0:
+            bt.logging.warning(f"Unusual boost_factor value: {boost_factor} (expected 0.1-10.0)")
+        metrics_list.append({
+            "base_score": base_score,
+            "scaling_factor": scaling_factor,
+            "brief_boost": boost_factor,
+            "usd_target": usd_target,
+            "alpha_target": alpha_target,
+            "weight": weight,
+            "limitation_status": "active"
+        })
+    return metrics_list
+
+
 def update_video_score(video_id, youtube_analytics_client, video_matches, briefs, result, is_ypp_account, channel_analytics=None, min_stake=False):
-    """Calculate and update the score for a video that matches a brief using curve-based scoring mechanism."""
+    """Calculate and update the score for a video that matches a brief using curve-based scoring mechanism.
+    
+    A video whose analytics could not be fetched scores 0, as in update_video_scores_batch."""
     video_publish_date = result["videos"][video_id]["details"].get("publishedAt")
     existing_analytics = result["videos"][video_id]["analytics"]
     
     # Get bitcast video ID for logging (falls back to YouTube ID if not available)
     bitcast_video_id = result["videos"][video_id]["details"].get("bitcastVideoId", video_id)
     
-    video_score_result = calculate_video_score(
-        video_id, youtube_analytics_client, video_publish_date, existing_analytics,
-        is_ypp_account=is_ypp_account, channel_analytics=channel_analytics, 
-        bitcast_video_id=bitcast_video_id, min_stake=min_stake
+    try:
+        video_score_result = calculate_video_score(
+            video_id, youtube_analytics_client, video_publish_date, existing_analytics,
+            is_ypp_account=is_ypp_account, channel_analytics=channel_analytics, 
+            bitcast_video_id=bitcast_video_id, min_stake=min_stake
+        )
+    except Exception as e:
+        bt.logging.error(f"Failed to fetch analytics for video {video_id}, skipping its score: {e}")
+        result["videos"][video_id]["score"] = 0
+        return
+    _apply_video_score_result(video_id, video_score_result, video_matches, briefs, result)
+
+
+def update_video_scores_batch(video_ids, youtube_analytics_client, video_matches, briefs, result, is_ypp_account, channel_analytics=None, min_stake=False):
+    """Calculate and update the scores of all matching videos of an account in one batch.
+    
+    Curve scores come from calculate_video_scores_batch and per-brief metrics from
+    _calculate_per_video_metrics_batch. Results are applied in video order, then
+    brief order, so brief totals accumulate exactly as with update_video_score.
+    A video whose analytics could not be fetched scores 0; the others are unaffected."""
+    videos = [
+        (
+            video_id,
+            result["videos"][video_id]["details"].get("publishedAt"),
+            result["videos"][video_id]["details"].get("bitcastVideoId", video_id),
+        )
+        for video_id in video_ids
+    ]
+    score_results = calculate_video_scores_batch(
+        videos, youtube_analytics_client, is_ypp_account=is_ypp_account,
+        channel_analytics=channel_analytics, min_stake=min_stake
     )
+    
+    # Per-brief metric inputs for every (video, matching brief) pair
+    pairs = []
+    for video_id, video_score_result in zip(video_ids, score_results):
+        if video_score_result is None:
+            continue
+        for i, match in enumerate(video_matches.get(video_id, [])):
+            if match:
+                brief_format = briefs[i].get("format", "dedicated")
+                pairs.append((
+                    video_id, briefs[i]["id"], video_score_result["score"],
+                    _get_youtube_scaling_factor(brief_format), briefs[i].get("boost", 1.0),
+                    video_score_result.get("curve_input_day1"), video_score_result.get("curve_input_day2"),
+                    _get_lifetime_deduction(brief_format),
+                ))
+    metrics_list = _calculate_per_video_metrics_batch([pair[2:] for pair in pairs])
+    
+    brief_metrics = {video_id: {} for video_id in video_ids}
+    for pair, video_metrics in zip(pairs, metrics_list):
+        brief_metrics[pair[0]][pair[1]] = video_metrics
+    
+    for video_id, video_score_result in zip(video_ids, score_results):
+        if video_score_result is None:
+            result["videos"][video_id]["score"] = 0
+            continue
+        _apply_video_score_result(
+            video_id, video_score_result, video_matches, briefs, result, brief_metrics[video_id]
+        )
+
+
+def _apply_video_score_result(video_id, video_score_result, video_matches, briefs, result, brief_metrics=None):
+    """Store a video's score result and add its per-brief USD targets to the brief scores.
+    
+    brief_metrics optionally maps brief ID to precomputed per-video metrics."""
+    video = result["videos"][video_id]
     base_video_score = video_score_result["score"]
     scoring_method = video_score_result["scoring_method"]
     
@@ -454,9 +611,9 @@ def update_video_score(video_id, youtube_analytics_client, video_matches, briefs
     bt.logging.info(f"Curve-based base_score: {base_video_score} (method: {scoring_method}){curve_info}")
     
     # Store base score and analytics (before scaling)
-    result["videos"][video_id]["base_score"] = base_video_score
-    result["videos"][video_id]["daily_analytics"] = video_score_result["daily_analytics"]
-    result["videos"][video_id]["scoring_method"] = scoring_method
+    video["base_score"] = base_video_score
+    video["daily_analytics"] = video_score_result["daily_analytics"]
+    video["scoring_method"] = scoring_method
     
     # Store cap debugging information
     if "applied_cap" in video_score_result:
@@ -469,7 +626,7 @@ def update_video_score(video_id, youtube_analytics_client, video_matches, briefs
         fields = ypp_fields if scoring_method == "ypp" else non_ypp_fields
         cap_info_dict.update({field: video_score_result.get(field) for field in fields})
         
-        result["videos"][video_id]["cap_info"] = cap_info_dict
+        video["cap_info"] = cap_info_dict
     
     # Extract curve inputs for lifetime deduction calculation
     curve_input_day1 = video_score_result.get("curve_input_day1")
@@ -491,10 +648,13 @@ def update_video_score(video_id, youtube_analytics_client, video_matches, briefs
             lifetime_deduction = _get_lifetime_deduction(brief_format)
             
             # Calculate comprehensive per-video metrics with ALL scaling factors applied
-            video_metrics = _calculate_per_video_metrics(
-                base_video_score, scaling_factor, boost_factor,
-                curve_input_day1, curve_input_day2, lifetime_deduction
-            )
+            if brief_metrics is not None and brief_id in brief_metrics:
+                video_metrics = brief_metrics[brief_id]
+            else:
+                video_metrics = _calculate_per_video_metrics(
+                    base_video_score, scaling_factor, boost_factor,
+                    curve_input_day1, curve_input_day2, lifetime_deduction
+                )
             
             # Extract the USD target (this is now the actual meaningful USD value)
             usd_target = video_metrics["usd_target"]
@@ -506,16 +666,16 @@ def update_video_score(video_id, youtube_analytics_client, video_matches, briefs
             # Update the brief score with USD target value
             result["scores"][brief_id] += usd_target
             
-            bt.logging.info(f"Brief: {brief_id}, Video: {result['videos'][video_id]['details']['bitcastVideoId']}, "
+            bt.logging.info(f"Brief: {brief_id}, Video: {video['details']['bitcastVideoId']}, "
                           f"Base Score: {base_video_score:.6f}, Scaling: {scaling_factor}, "
                           f"Boost: {boost_factor}, USD Target: ${usd_target:.6f}")
     
     # Store per-video metrics for streaming publisher
-    result["videos"][video_id]["brief_metrics"] = per_video_metrics_by_brief
-    result["videos"][video_id]["usd_targets"] = usd_targets_by_brief
+    video["brief_metrics"] = per_video_metrics_by_brief
+    video["usd_targets"] = usd_targets_by_brief
     
     # Maintain backward compatibility: store the highest USD target as "score"
     if usd_targets_by_brief:
-        result["videos"][video_id]["score"] = max(usd_targets_by_brief.values())
+        video["score"] = max(usd_targets_by_brief.values())
     else:
-        result["videos"][video_id]["score"] = base_video_score 
\ No newline at end of file
+        video["score"] = base_video_score 
\ No newline at end of file
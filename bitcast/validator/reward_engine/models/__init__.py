@@ -1,7 +1,8 @@
 """Data models for the reward calculation system."""
 
 from .evaluation_result import EvaluationResult, AccountResult, EvaluationResultCollection
-from .score_matrix import ScoreMatrix
+from .stats_list import StatsList, set_stats_value
+from .score_matrix import ScoreMatrix, column_sums
 from .emission_target import EmissionTarget
 from .miner_response import MinerResponse
 
@@ -9,7 +10,10 @@ __all__ = [
     "EvaluationResult",
     "AccountResult", 
     "EvaluationResultCollection",
+    "StatsList",
+    "set_stats_value",
     "ScoreMatrix",
+    "column_sums",
     "EmissionTarget",
     "MinerResponse",
 ] 
\ No newline at end of file
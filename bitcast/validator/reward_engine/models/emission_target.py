@@ -3,6 +3,8 @@
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 
+import numpy as np
+
 
 @dataclass
 class EmissionTarget:
@@ -12,6 +14,9 @@ class EmissionTarget:
     Note: scaling_factors is now optional since platform-specific transformations
     (scaling factors, boost multipliers) are applied at the platform level before
     reaching emission calculation.
+    
+    allocation_details["per_miner_weights"] is a NumPy view into the raw weights
+    matrix while the reward pipeline runs; to_dict converts it to a list.
     """
     brief_id: str
     usd_target: float
@@ -23,7 +28,10 @@ class EmissionTarget:
         return {
             "brief_id": self.brief_id,
             "usd_target": self.usd_target,
-            "allocation_details": self.allocation_details,
+            "allocation_details": {
+                key: value.tolist() if isinstance(value, np.ndarray) else value
+                for key, value in self.allocation_details.items()
+            },
             "scaling_factors": self.scaling_factors
         }
     
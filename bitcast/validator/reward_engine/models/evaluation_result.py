@@ -1,8 +1,7 @@
 """Data models for evaluation results."""
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional
 from dataclasses import dataclass, field
-import copy
 
 
 @dataclass
@@ -33,38 +32,27 @@ class AccountResult:
         Returns:
             Dict containing formatted payload for per-account posting
         """
-        # Strip brief_reasonings from decision_details before deep copy
-        # to avoid copying paragraphs of LLM text per brief per video.
-        stripped = []
-        for video_data in self.videos.values():
-            if isinstance(video_data, dict):
-                dd = video_data.get("decision_details")
-                if isinstance(dd, dict) and "brief_reasonings" in dd:
-                    stripped.append((dd, dd.pop("brief_reasonings")))
-
-        # Deep copy videos (nested structure requires deepcopy) and clean
-        cleaned_videos = copy.deepcopy(self.videos)
-
-        # Restore brief_reasonings on originals AND inject into cleaned copy
-        for dd, reasonings in stripped:
-            dd["brief_reasonings"] = reasonings
-        for video_id in cleaned_videos:
-            orig = self.videos.get(video_id)
-            if isinstance(orig, dict):
-                orig_dd = orig.get("decision_details")
-                if isinstance(orig_dd, dict) and "brief_reasonings" in orig_dd:
-                    cleaned_dd = cleaned_videos[video_id].get("decision_details")
-                    if isinstance(cleaned_dd, dict):
-                        cleaned_dd["brief_reasonings"] = orig_dd["brief_reasonings"]
-
-        for video_id, video_data in cleaned_videos.items():
-            if isinstance(video_data, dict) and "details" in video_data:
-                if isinstance(video_data["details"], dict):
-                    video_data["details"].pop("description", None)
-                    video_data["details"].pop("transcript", None)
-
-            if isinstance(video_data, dict) and "brief_metrics" in video_data:
-                video_data["per_video_metrics"] = video_data["brief_metrics"]
+        # Only the containers that change are rebuilt; everything else is shared with
+        # self.videos and serialized directly by the publisher, so the originals are
+        # never mutated and the nested video data is never copied. Video records
+        # (any Mapping) are exported to plain dicts here.
+        cleaned_videos = {}
+        for video_id, video_data in self.videos.items():
+            if not isinstance(video_data, Mapping):
+                cleaned_videos[video_id] = video_data
+                continue
+            
+            cleaned_video = dict(video_data)
+            details = video_data.get("details")
+            if isinstance(details, dict):
+                cleaned_video["details"] = {
+                    key: value for key, value in details.items()
+                    if key not in ("description", "transcript")
+                }
+            
+            if "brief_metrics" in video_data:
+                cleaned_video["per_video_metrics"] = video_data["brief_metrics"]
+            cleaned_videos[video_id] = cleaned_video
 
         return {
             "account_data": {
@@ -77,6 +65,18 @@ class AccountResult:
             }
         }
     
+    def summary(self) -> 'AccountResult':
+        """Copy with only scores and status, kept in memory once the details are spilled to disk."""
+        return AccountResult(
+            account_id=self.account_id,
+            platform_data={},
+            videos={},
+            scores=self.scores,
+            performance_stats={},
+            success=self.success,
+            error_message=self.error_message
+        )
+    
     @classmethod
     def create_error_result(
         cls, 
@@ -124,12 +124,19 @@ class EvaluationResult:
 class EvaluationResultCollection:
     """Collection of evaluation results for all miners."""
     
-    def __init__(self):
+    def __init__(self, store=None):
+        """
+        Args:
+            store: Optional ResultStore that spill() moves account details to
+        """
         self.results: Dict[int, EvaluationResult] = {}
+        self.store = store
+        self._spilled = set()
     
     def add_result(self, uid: int, result: EvaluationResult):
         """Add an evaluation result for a UID."""
         self.results[uid] = result
+        self._spilled.discard(uid)
     
     def add_empty_result(self, uid: int, reason: str):
         """Add an empty result for a failed evaluation."""
@@ -138,7 +145,40 @@ class EvaluationResultCollection:
             platform="unknown",
             aggregated_scores={},
         )
+        self._spilled.discard(uid)
     
     def get_result(self, uid: int) -> EvaluationResult:
         """Get result for a specific UID."""
-        return self.results.get(uid) 
\ No newline at end of file
+        return self.results.get(uid)
+    
+    def spill(self, uid: int) -> bool:
+        """
+        Move the account details of a UID to the store, keeping only account scores in memory.
+        
+        Returns:
+            bool: True if the details were spilled, False without a store or accounts
+            
+        Raises:
+            OSError, pickle.PicklingError: If the store could not write the details
+        """
+        result = self.results.get(uid)
+        if self.store is None or result is None or not result.account_results:
+            return False
+        self.store.save(uid, result.account_results)
+        result.account_results = {
+            account_id: account_result.summary()
+            for account_id, account_result in result.account_results.items()
+        }
+        self._spilled.add(uid)
+        return True
+    
+    def is_spilled(self, uid: int) -> bool:
+        """Whether the account details of a UID live in the store."""
+        return uid in self._spilled
+    
+    def get_account_results(self, uid: int) -> Dict[str, AccountResult]:
+        """Full account results for a UID, read back from the store if they were spilled."""
+        if uid in self._spilled:
+            return self.store.load(uid)
+        result = self.results.get(uid)
+        return result.account_results if result else {}
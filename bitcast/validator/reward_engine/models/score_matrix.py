@@ -1,7 +1,17 @@
 """Data model for score matrix operations."""
 
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Sequence
+
+
+def column_sums(matrix: np.ndarray) -> np.ndarray:
+    """
+    Per-column totals of a 2D matrix, bit-identical to matrix[:, j].sum() for every j.
+    
+    matrix.sum(axis=0) accumulates row by row and can differ in the last bits from
+    NumPy's pairwise 1D sum, so columns are summed as contiguous rows instead.
+    """
+    return np.ascontiguousarray(matrix.T).sum(axis=1)
 
 
 class ScoreMatrix:
@@ -18,6 +28,30 @@ class ScoreMatrix:
         matrix = np.zeros((num_miners, num_briefs), dtype=np.float64)
         return cls(matrix)
     
+    @classmethod
+    def from_triplets(
+        cls,
+        miner_indices: Sequence[int],
+        brief_indices: Sequence[int],
+        scores: Sequence[float],
+        num_miners: int,
+        num_briefs: int
+    ) -> 'ScoreMatrix':
+        """
+        Build a matrix from (miner index, brief index, score) triplets, summing duplicates.
+        
+        Duplicates are accumulated in triplet order, so each cell equals the sequential
+        Python sum of its scores.
+        """
+        matrix = np.zeros((num_miners, num_briefs), dtype=np.float64)
+        if len(scores):
+            np.add.at(
+                matrix,
+                (np.asarray(miner_indices, dtype=np.intp), np.asarray(brief_indices, dtype=np.intp)),
+                np.asarray(scores, dtype=np.float64)
+            )
+        return cls(matrix)
+    
     def set_score(self, miner_idx: int, brief_idx: int, score: float):
         """Set a score for a specific miner and brief."""
         if 0 <= miner_idx < self.num_miners and 0 <= brief_idx < self.num_briefs:
@@ -0,0 +1,100 @@
+"""Lazily built per-miner stats returned with the rewards of a validation cycle."""
+
+from typing import Any, Dict, Iterable, Iterator, Optional
+from collections.abc import Sequence
+
+from .evaluation_result import EvaluationResultCollection
+
+
+class _StatsEntry(dict):
+    """Stats entry whose item assignments are recorded on the owning StatsList."""
+    
+    __slots__ = ("_owner", "_index")
+    
+    def __init__(self, stats: Dict[str, Any], owner: "StatsList", index: int):
+        super().__init__(stats)
+        self._owner = owner
+        self._index = index
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._owner.set_extra(self._index, key, value)
+
+
+class StatsList(Sequence):
+    """
+    Per-miner stats built when an entry is read instead of all at once.
+    
+    Each entry has the layout of the former eagerly built list: "scores", "uid",
+    one key per account (yt_account, videos, scores, performance_stats) and
+    "metagraph". Spilled account details are read back from the result store
+    for the entry being built only; in-memory account details are read from the
+    collection, so they are gone once the orchestrator releases them. Keys
+    assigned on an entry or through set_extra (e.g. "reward", "llm_usage") are
+    kept and included every time the entry is read again.
+    """
+    
+    def __init__(
+        self,
+        uids: Iterable[int],
+        evaluation_results: EvaluationResultCollection,
+        first_entry_extras: Optional[Dict[str, Any]] = None
+    ):
+        self._uids = list(uids)
+        self._evaluation_results = evaluation_results
+        self._results = {uid: evaluation_results.get_result(uid) for uid in self._uids}
+        self._extras: Dict[int, Dict[str, Any]] = {}
+        if first_entry_extras and self._uids:
+            self._extras[0] = dict(first_entry_extras)
+    
+    def __len__(self) -> int:
+        return len(self._uids)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        index = range(len(self))[index]
+        return _StatsEntry(self._build(index), self, index)
+    
+    def __iter__(self) -> Iterator[dict]:
+        for index in range(len(self)):
+            yield self[index]
+    
+    def set_extra(self, index: int, key: str, value: Any) -> None:
+        """Add a key to an entry without building it."""
+        index = range(len(self))[index]
+        self._extras.setdefault(index, {})[key] = value
+    
+    def _build(self, index: int) -> Dict[str, Any]:
+        uid = self._uids[index]
+        eval_result = self._results[uid]
+        
+        if eval_result:
+            stats = {
+                "scores": eval_result.aggregated_scores,
+                "uid": uid
+            }
+            
+            for account_id, account_result in self._evaluation_results.get_account_results(uid).items():
+                stats[account_id] = {
+                    "yt_account": account_result.platform_data,
+                    "videos": account_result.videos,
+                    "scores": account_result.scores,
+                    "performance_stats": account_result.performance_stats
+                }
+            
+            if eval_result.metagraph_info:
+                stats["metagraph"] = eval_result.metagraph_info
+        else:
+            stats = {"scores": {}, "uid": uid}
+        
+        stats.update(self._extras.get(index, {}))
+        return stats
+
+
+def set_stats_value(stats_list: Sequence, index: int, key: str, value: Any) -> None:
+    """Set a key on one stats entry; StatsList entries are not built to do so."""
+    if isinstance(stats_list, StatsList):
+        stats_list.set_extra(index, key, value)
+    else:
+        stats_list[index][key] = value
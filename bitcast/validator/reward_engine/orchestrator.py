@@ -4,9 +4,24 @@ from typing import List, Tuple, Dict, Any
 import asyncio
 import numpy as np
 import bittensor as bt
-from bitcast.validator.utils.briefs import get_briefs
+from bitcast.validator.utils.briefs import get_briefs, get_briefs_snapshot_age
 from bitcast.validator.platforms.youtube.utils import state
+from bitcast.validator.clients.llm_client import (
+    get_llm_cache_stats, get_llm_coalesced_count, get_llm_cycle_calls_saved, get_llm_usage, reset_llm_cycle_stats
+)
+from bitcast.validator.platforms.youtube.api.transcript import (
+    get_transcript_coalesced_count, reset_transcript_coalesced_count
+)
+from bitcast.validator.platforms.youtube.evaluation.video.llm_budget import get_llm_budget_stats, reset_llm_budget
+from bitcast.validator.platforms.youtube.evaluation.video.injection_prefilter import (
+    get_injection_prefilter_stats, reset_injection_prefilter_stats
+)
+from bitcast.validator.platforms.youtube.evaluation.score_cap import get_median_cache_stats, reset_median_cache
+from ..utils.cycle_context import CycleContext, activate_cycle, deactivate_cycle
+from ..utils.token_pricing import ChainPricingProvider, PricingSnapshotService, get_pricing_service
 from ..utils.run_manager import generate_current_run_id
+from ..utils.result_store import ResultStore
+from ..utils.memory_profiler import MemoryProfiler
 from ..utils.streaming_publisher import publish_miner_accounts_safe, log_streaming_status
 
 from .services.miner_query_service import MinerQueryService
@@ -17,8 +32,12 @@ from .services.reward_distribution_service import RewardDistributionService
 from .services.weight_corrections_service import WeightCorrectionsService
 from .models.evaluation_result import EvaluationResultCollection, EvaluationResult
 from .models.miner_response import MinerResponse
+from .models.stats_list import set_stats_value
 from ..utils.weight_corrections_publisher import publish_weight_corrections
-from ..utils.config import WEIGHT_CORRECTIONS_ENDPOINT, ENABLE_DATA_PUBLISH, CREDENTIAL_BATCH_SIZE, MAX_ACCOUNTS_PER_SYNAPSE
+from ..utils.config import (
+    WEIGHT_CORRECTIONS_ENDPOINT, ENABLE_DATA_PUBLISH, CREDENTIAL_BATCH_SIZE, MAX_ACCOUNTS_PER_SYNAPSE,
+    RESULT_SPILL, CACHE_DIRS
+)
 
 
 class RewardOrchestrator:
@@ -31,7 +50,8 @@ class RewardOrchestrator:
         score_aggregator: ScoreAggregationService = None,
         emission_calculator: EmissionCalculationService = None,
         reward_distributor: RewardDistributionService = None,
-        weight_corrections_service: WeightCorrectionsService = None
+        weight_corrections_service: WeightCorrectionsService = None,
+        pricing_service: PricingSnapshotService = None
     ):
         self.miner_query = miner_query_service or MinerQueryService()
         self.platforms = platform_registry or PlatformRegistry()
@@ -39,6 +59,8 @@ class RewardOrchestrator:
         self.emission_calculator = emission_calculator or EmissionCalculationService()
         self.reward_distributor = reward_distributor or RewardDistributionService()
         self.weight_corrections = weight_corrections_service or WeightCorrectionsService()
+        # None: use the background pricing refresher if one is running, else snapshot synchronously each cycle
+        self.pricing = pricing_service
     
     async def calculate_rewards(
         self, 
@@ -46,6 +68,7 @@ class RewardOrchestrator:
         uids: List[int]
     ) -> Tuple[np.ndarray, List[dict]]:
         """Main entry point for reward calculation workflow."""
+        memory_profiler = None
         try:
             # 1. Get content briefs
             try:
@@ -57,19 +80,33 @@ class RewardOrchestrator:
             if not briefs:
                 return self._no_briefs_fallback(uids)
             
+            snapshot_age = get_briefs_snapshot_age()
+            if snapshot_age is not None:
+                bt.logging.info(f"Briefs snapshot age: {snapshot_age}s")
+            
+            # Freeze the cycle clock, date windows and pricing for the whole evaluation
+            activate_cycle(CycleContext.create(briefs, pricing=self._get_pricing_snapshot()))
+            
             bt.logging.info(f"Processing {len(briefs)} briefs for {len(uids)} miners sequentially")
             
             # 2. Generate run ID for streaming per-account publishing  
             run_id = generate_current_run_id(validator_self.wallet)
             bt.logging.info(f"🔄 Generated run ID for validation cycle: {run_id}")
+            memory_profiler = MemoryProfiler(run_id)
+            memory_profiler.checkpoint("start")
             
             # Log streaming publishing status
             log_streaming_status(len(uids))
             
             # 3. Process miners sequentially to prevent token expiration
-            evaluation_results = EvaluationResultCollection()
+            evaluation_results = EvaluationResultCollection(store=self._create_result_store(run_id))
+            reset_llm_cycle_stats()
+            reset_transcript_coalesced_count()
+            reset_injection_prefilter_stats()
+            reset_llm_budget()
+            reset_median_cache()
             
-            for uid in uids:
+            for miners_done, uid in enumerate(uids, start=1):
                 miner_response = await self.miner_query.query_single_miner(validator_self, uid)
                 
                 result = await self._evaluate_single_miner(
@@ -78,11 +115,50 @@ class RewardOrchestrator:
                 evaluation_results.add_result(uid, result)
                 
                 await publish_miner_accounts_safe(result, run_id, validator_self.wallet)
+                self._spill_result(evaluation_results, uid)
+                memory_profiler.miner_evaluated(miners_done)
+            
+            memory_profiler.checkpoint("evaluate", miners=len(uids))
+            
+            bt.logging.info(f"LLM calls saved by validation strategy this cycle: {get_llm_cycle_calls_saved()}")
+            usage_totals = get_llm_usage("cycle")["totals"]
+            bt.logging.info(
+                f"LLM usage this cycle: {usage_totals['requests']} requests, {usage_totals['cache_hits']} cache hits, "
+                f"{usage_totals['prompt_tokens']} prompt / {usage_totals['completion_tokens']} completion tokens, "
+                f"{usage_totals['retries']} retries"
+            )
+            bt.logging.info(
+                f"Coalesced in-flight requests this cycle: {get_llm_coalesced_count()} LLM, "
+                f"{get_transcript_coalesced_count()} transcript"
+            )
+            cache_stats = get_llm_cache_stats()
+            bt.logging.info(
+                f"LLM cache writes this cycle: {cache_stats['writes']} writes, {cache_stats['failed_writes']} failed, "
+                f"write latency {cache_stats['write_latency_s']:.2f}s (max {cache_stats['max_write_latency_s']:.2f}s)"
+            )
+            prefilter_stats = get_injection_prefilter_stats()
+            if prefilter_stats["checked"]:
+                bt.logging.info(
+                    f"Injection prefilter this cycle: {prefilter_stats['checked']} checked, "
+                    f"{prefilter_stats['cleared']} cleared locally, {prefilter_stats['escalated']} escalated to LLM "
+                    f"({prefilter_stats['escalation_rate']:.1%})"
+                )
+            median_stats = get_median_cache_stats()
+            bt.logging.info(
+                f"Median cap cache this cycle: {median_stats['hits']} hits, {median_stats['misses']} computed"
+            )
+            budget_stats = get_llm_budget_stats()
+            if budget_stats["budget"]:
+                bt.logging.info(
+                    f"LLM budget this cycle: {budget_stats['spent']}/{budget_stats['budget']} requests spent, "
+                    f"{budget_stats['admitted']} evaluations admitted, {budget_stats['deferred']} deferred to next cycle"
+                )
             
             # 4. Aggregate scores across platforms
             bt.logging.info("🔄 PHASE 4: Aggregating individual video scores into score matrix")
             score_matrix = self.score_aggregator.aggregate_scores(evaluation_results, briefs)
             bt.logging.info(f"Score aggregation complete: {score_matrix.matrix.shape} matrix created")
+            memory_profiler.checkpoint("aggregate")
                         
             # 5. Reset state for next evaluation cycle
             state.reset_scored_videos()
@@ -90,12 +166,19 @@ class RewardOrchestrator:
             # 6. Calculate emission targets
             bt.logging.info("💰 PHASE 5: Converting scores to USD emission targets")
             emission_targets = self.emission_calculator.calculate_targets(score_matrix, briefs)
+            memory_profiler.checkpoint("emission")
             
             # 7. Distribute final rewards
             bt.logging.info("🎯 PHASE 6: Distributing final rewards to miners")
             rewards, stats_list, pre_constraint_weights, post_constraint_weights = self.reward_distributor.calculate_distribution(
                 emission_targets, evaluation_results, briefs, uids
             )
+            memory_profiler.checkpoint("distribution")
+            
+            # Attach cycle-wide LLM usage to the run stats (first entry, like brief_emission_percentages)
+            llm_usage = get_llm_usage("cycle")
+            if stats_list:
+                set_stats_value(stats_list, 0, "llm_usage", llm_usage)
             
             total_rewards = float(np.sum(rewards))
             non_zero_miners = np.count_nonzero(rewards)
@@ -104,19 +187,25 @@ class RewardOrchestrator:
             # 8. Publish weight corrections (fire-and-forget)
             if ENABLE_DATA_PUBLISH:
                 await self._publish_weight_corrections(
-                    evaluation_results, pre_constraint_weights, post_constraint_weights, briefs, run_id, validator_self.wallet
+                    evaluation_results, pre_constraint_weights, post_constraint_weights, briefs, run_id, validator_self.wallet,
+                    memory_profiler
                 )
 
             # Release heavy evaluation data now that all phases are complete.
-            # account_results hold the bulk of memory (videos, platform_data per miner).
+            # account_results hold the bulk of memory (videos, platform_data per miner);
+            # stats entries built afterwards only include spilled account details.
             for eval_result in evaluation_results.results.values():
-                eval_result.account_results.clear()
+                eval_result.account_results = {}
 
             return rewards, stats_list
             
         except Exception as e:
             bt.logging.error(f"Sequential reward calculation failed: {e}")
             return self._error_fallback(uids)
+        finally:
+            deactivate_cycle()
+            if memory_profiler is not None:
+                memory_profiler.finish()
     
     async def _evaluate_single_miner(
         self, 
@@ -214,6 +303,23 @@ class RewardOrchestrator:
         bt.logging.info(f"UID {uid}: batched evaluation complete, {len(combined.account_results)} accounts total")
         return combined
     
+    def _create_result_store(self, run_id: str):
+        """On-disk store for this run's evaluation details, None when spilling is off or unavailable."""
+        if not RESULT_SPILL:
+            return None
+        try:
+            return ResultStore(CACHE_DIRS["results"], run_id)
+        except OSError as e:
+            bt.logging.warning(f"Result spill unavailable, keeping evaluation results in memory: {e}")
+            return None
+    
+    def _spill_result(self, evaluation_results: EvaluationResultCollection, uid: int) -> None:
+        """Move a finished miner's account details to disk, keeping them in memory if that fails."""
+        try:
+            evaluation_results.spill(uid)
+        except Exception as e:
+            bt.logging.warning(f"Failed to spill evaluation results for UID {uid}, keeping in memory: {e}")
+    
     def _extract_metagraph_info(self, metagraph, uid: int) -> Dict[str, Any]:
         """Extract relevant metagraph information for a UID."""
         if metagraph is None:
@@ -243,6 +349,22 @@ class RewardOrchestrator:
             bt.logging.error(f"Failed to extract metagraph info for UID {uid}: {e}")
             return {}
     
+    def _get_pricing_snapshot(self):
+        """Pricing snapshot for this cycle, or None to fetch pricing on demand."""
+        pricing_service = self.pricing or get_pricing_service()
+        if pricing_service is None:
+            # No refresher running: take this cycle's snapshot synchronously
+            pricing_service = PricingSnapshotService(ChainPricingProvider())
+        snapshot = pricing_service.get_snapshot()
+        if snapshot is not None:
+            bt.logging.info(
+                f"Pricing snapshot: alpha=${snapshot.alpha_price_usd:.4f}, "
+                f"daily miner alpha={snapshot.total_daily_alpha:.2f}, age={pricing_service.snapshot_age()}s"
+            )
+        else:
+            bt.logging.warning("No usable pricing snapshot, fetching pricing on demand this cycle")
+        return snapshot
+    
     def _no_briefs_fallback(self, uids: List[int]) -> Tuple[np.ndarray, List[dict]]:
         """Handle case when no content briefs are available."""
         bt.logging.info("No briefs available - using fallback rewards")
@@ -257,7 +379,8 @@ class RewardOrchestrator:
         post_constraint_weights: np.ndarray,
         briefs: List[Dict[str, Any]],
         run_id: str,
-        wallet
+        wallet,
+        memory_profiler: MemoryProfiler = None
     ) -> None:
         """Publish weight corrections in fire-and-forget mode."""
         try:
@@ -267,11 +390,15 @@ class RewardOrchestrator:
             corrections = self.weight_corrections.calculate_corrections(
                 evaluation_results, pre_constraint_weights, post_constraint_weights, briefs
             )
+            if memory_profiler:
+                memory_profiler.checkpoint("corrections")
             
             # Execute immediately like account data publishing - IDENTICAL pattern
             success = await publish_weight_corrections(
                 corrections, run_id, wallet, WEIGHT_CORRECTIONS_ENDPOINT
             )
+            if memory_profiler:
+                memory_profiler.checkpoint("publish")
             
             if success:
                 bt.logging.info(f"🚀 Weight corrections published for {len(corrections)} corrections")
@@ -4,9 +4,10 @@ from typing import List, Dict, Any
 import numpy as np
 import bittensor as bt
 from ..interfaces.emission_calculator import EmissionCalculator
-from ..models.score_matrix import ScoreMatrix
+from ..models.score_matrix import ScoreMatrix, column_sums
 from ..models.emission_target import EmissionTarget
 
+from ...utils.cycle_context import get_active_cycle
 from ...utils.token_pricing import get_bitcast_alpha_price, get_total_miner_emissions
 
 
@@ -33,6 +34,11 @@ class EmissionCalculationService(EmissionCalculator):
         # Convert USD targets to raw weights using alpha price and total emissions
         raw_weights_matrix = self._calculate_raw_weights(emission_targets_matrix)
         
+        # Per-brief totals in one pass; weights stay NumPy column views (no list copies)
+        num_columns = raw_weights_matrix.shape[1] if raw_weights_matrix.ndim == 2 else 0
+        usd_targets = column_sums(emission_targets_matrix) if num_columns else np.zeros(0)
+        weight_sums = column_sums(raw_weights_matrix) if num_columns else np.zeros(0)
+        
         # Create EmissionTarget objects for each brief
         targets = []
         total_usd_targets = 0.0
@@ -40,12 +46,12 @@ class EmissionCalculationService(EmissionCalculator):
         
         for brief_idx, brief in enumerate(briefs):
             # Extract weights for this brief
-            per_miner_weights = raw_weights_matrix[:, brief_idx] if brief_idx < raw_weights_matrix.shape[1] else []
+            per_miner_weights = raw_weights_matrix[:, brief_idx] if brief_idx < num_columns else np.zeros(0)
             
             # Calculate USD target for this brief
-            usd_target = float(np.sum(emission_targets_matrix[:, brief_idx])) if brief_idx < emission_targets_matrix.shape[1] else 0.0
+            usd_target = float(usd_targets[brief_idx]) if brief_idx < num_columns else 0.0
             
-            brief_weight_sum = float(np.sum(per_miner_weights)) if len(per_miner_weights) > 0 else 0.0
+            brief_weight_sum = float(weight_sums[brief_idx]) if brief_idx < num_columns else 0.0
             
             # Only log if there are significant targets
             if usd_target > 0.01:
@@ -61,7 +67,7 @@ class EmissionCalculationService(EmissionCalculator):
                 brief_id=brief["id"],
                 usd_target=usd_target,
                 allocation_details={
-                    "per_miner_weights": per_miner_weights.tolist(),
+                    "per_miner_weights": per_miner_weights,
                     "brief_format": brief_format
                 },
                 scaling_factors=scaling_factors
@@ -83,8 +89,14 @@ class EmissionCalculationService(EmissionCalculator):
             return np.array([])
         
         try:
-            alpha_price_usd = get_bitcast_alpha_price()
-            total_daily_alpha = get_total_miner_emissions()
+            # Same pricing snapshot the per-video metrics were computed with, when a cycle is active
+            cycle = get_active_cycle()
+            if cycle is not None and cycle.pricing is not None:
+                alpha_price_usd = cycle.pricing.alpha_price_usd
+                total_daily_alpha = cycle.pricing.total_daily_alpha
+            else:
+                alpha_price_usd = get_bitcast_alpha_price()
+                total_daily_alpha = get_total_miner_emissions()
             
             # Calculate conversion factor once
             total_daily_usd = alpha_price_usd * total_daily_alpha
@@ -4,7 +4,9 @@ from typing import List, Dict, Any, Tuple
 import numpy as np
 import bittensor as bt
 from ..models.emission_target import EmissionTarget
+from ..models.score_matrix import column_sums
 from ..models.evaluation_result import EvaluationResultCollection
+from ..models.stats_list import StatsList
 from ...utils.config import YT_MIN_EMISSIONS
 from ...rewards_scaling import allocate_subnet_treasury
 
@@ -58,20 +60,14 @@ class RewardDistributionService:
         matrix = np.zeros((num_miners, num_briefs), dtype=np.float64)
         
         for brief_idx, target in enumerate(emission_targets):
-            weights = target.allocation_details.get("per_miner_weights", [])
-            brief_id = target.brief_id
-            brief_total = 0.0
-            non_zero_count = 0
-            
-            for miner_idx, weight in enumerate(weights):
-                if miner_idx < num_miners and weight != 0:
-                    matrix[miner_idx, brief_idx] = weight
-                    brief_total += weight
-                    non_zero_count += 1
+            # Column views from EmissionCalculationService are copied in without a list round trip
+            weights = np.asarray(target.allocation_details.get("per_miner_weights", []), dtype=np.float64)[:num_miners]
+            matrix[:len(weights), brief_idx] = weights
             
             # Only log briefs with significant activity
-            if brief_total > 0.001 or non_zero_count > 0:
-                bt.logging.info(f"Brief {brief_id}: {non_zero_count} miners, ${target.usd_target:.2f}")
+            non_zero_count = np.count_nonzero(weights)
+            if non_zero_count > 0:
+                bt.logging.info(f"Brief {target.brief_id}: {non_zero_count} miners, ${target.usd_target:.2f}")
         
         return matrix
     
@@ -100,8 +96,9 @@ class RewardDistributionService:
         
         # Calculate brief emission percentages for stats
         brief_emission_percentages = {}
+        brief_percentages = column_sums(normalized)
         for brief_idx, brief in enumerate(briefs):
-            brief_percentage = normalized[:, brief_idx].sum()
+            brief_percentage = brief_percentages[brief_idx]
             brief_id = brief.get('id', f'brief_{brief_idx}')
             brief_emission_percentages[brief_id] = brief_percentage
             bt.logging.info(f"Brief {brief_id}: {brief_percentage:.6f} total emission percentage")
@@ -117,19 +114,24 @@ class RewardDistributionService:
         if scores_matrix.size == 0:
             return scores_matrix
         
+        if len(briefs) > scores_matrix.shape[1]:
+            raise IndexError(f"{len(briefs)} briefs for a weights matrix with {scores_matrix.shape[1]} columns")
+        
         result = scores_matrix.copy()
         
-        # Apply individual brief caps
-        for brief_idx, brief in enumerate(briefs):
-            brief_cap = brief.get("cap", 1.0)
-            brief_sum = result[:, brief_idx].sum()
-            
-            if brief_sum > brief_cap:
-                scale_factor = brief_cap / brief_sum
-                result[:, brief_idx] *= scale_factor
+        # Apply individual brief caps: scale every over-cap column in one multiply
+        num_briefs = len(briefs)
+        brief_caps = np.array([brief.get("cap", 1.0) for brief in briefs], dtype=np.float64)
+        brief_sums = column_sums(result[:, :num_briefs])
+        over_cap = brief_sums > brief_caps
+        if over_cap.any():
+            scale_factors = np.ones(num_briefs, dtype=np.float64)
+            scale_factors[over_cap] = brief_caps[over_cap] / brief_sums[over_cap]
+            result[:, :num_briefs] *= scale_factors
+            for brief_idx in np.flatnonzero(over_cap):
                 # Log when brief exceeds cap (BA requirement)
-                bt.logging.info(f"Brief '{brief.get('id', 'unknown')}' exceeded cap {brief_cap:.4f}, "
-                               f"scaled down by factor {scale_factor:.4f}")
+                bt.logging.info(f"Brief '{briefs[brief_idx].get('id', 'unknown')}' exceeded cap {brief_caps[brief_idx]:.4f}, "
+                               f"scaled down by factor {scale_factors[brief_idx]:.4f}")
         
         # Apply global minimum scaling if total < YT_MIN_EMISSIONS
         total_sum = result.sum()
@@ -147,8 +149,9 @@ class RewardDistributionService:
             bt.logging.info(f"Applied global scaling factor {global_scale_factor:.4f} (total was {total_sum:.4f})")
         
         # Log emission percentages per brief (BA requirement)
+        brief_percentages = column_sums(result)
         for brief_idx, brief in enumerate(briefs):
-            brief_percentage = result[:, brief_idx].sum()
+            brief_percentage = brief_percentages[brief_idx]
             bt.logging.info(f"Brief '{brief.get('id', 'unknown')}' claiming {brief_percentage:.4f} "
                            f"({brief_percentage * 100:.2f}%) of total emissions")
         
@@ -165,7 +168,9 @@ class RewardDistributionService:
         # Ensure total rewards sum to 1 by adjusting UID 0, but never negative
         uid_0_idx = next((i for i, uid in enumerate(uids) if uid == 0), None)
         if uid_0_idx is not None:
-            other_sum = sum(rewards[i] for i in range(len(rewards)) if i != uid_0_idx)
+            # Running (cumsum) total keeps the left-to-right summation order of a Python sum
+            others = np.delete(rewards, uid_0_idx)
+            other_sum = others.cumsum()[-1] if others.size else 0.0
             rewards[uid_0_idx] = max(1.0 - other_sum, 0.0)
         
         return rewards
@@ -175,43 +180,11 @@ class RewardDistributionService:
         evaluation_results: EvaluationResultCollection,
         uids: List[int],
         brief_emission_percentages: Dict[str, float] = None
-    ) -> List[dict]:
-        """Create simplified stats list from evaluation results."""
-        stats_list = []
-        
-        for uid in uids:
-            eval_result = evaluation_results.get_result(uid)
-            
-            if eval_result:
-                # Convert evaluation result to stats format
-                stats = {
-                    "scores": eval_result.aggregated_scores,
-                    "uid": uid
-                }
-                
-                # Add account details
-                for account_id, account_result in eval_result.account_results.items():
-                    stats[account_id] = {
-                        "yt_account": account_result.platform_data,
-                        "videos": account_result.videos,
-                        "scores": account_result.scores,
-                        "performance_stats": account_result.performance_stats
-                    }
-                
-                # Add metagraph info if available
-                if eval_result.metagraph_info:
-                    stats["metagraph"] = eval_result.metagraph_info
-            else:
-                # Minimal stats for missing results
-                stats = {"scores": {}, "uid": uid}
-            
-            stats_list.append(stats)
-        
+    ) -> StatsList:
+        """Create simplified stats list from evaluation results, built per entry when read."""
         # Add brief emission percentages to the first stats entry (BA requirement)
-        if stats_list and brief_emission_percentages:
-            stats_list[0]["brief_emission_percentages"] = brief_emission_percentages
-        
-        return stats_list
+        first_entry_extras = {"brief_emission_percentages": brief_emission_percentages} if brief_emission_percentages else None
+        return StatsList(uids, evaluation_results, first_entry_extras)
     
     def _error_fallback(self, uids: List[int]) -> Tuple[np.ndarray, List[dict], np.ndarray, np.ndarray]:
         """Simple error fallback that gives all rewards to UID 0."""
@@ -1,6 +1,6 @@
 """Handles score aggregation across platforms and accounts."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from ..interfaces.score_aggregator import ScoreAggregator
 from ..models.score_matrix import ScoreMatrix
 from ..models.evaluation_result import EvaluationResultCollection
@@ -18,40 +18,54 @@ class ScoreAggregationService(ScoreAggregator):
         Aggregate scores from all platforms and accounts.
         
         This replaces the complex logic in the current reward() function.
+        Account scores are collected as sparse (miner, brief, score) triplets and
+        reduced into the dense matrix in one NumPy operation.
+        
+        Note: This is platform-agnostic summation. Platform-specific transformations
+        (scaling factors, boost multipliers) are applied at the platform level
+        before aggregation, making this service work for any future platform.
         """
-        # Create mapping from UID to matrix index
-        uid_to_index = {uid: idx for idx, uid in enumerate(evaluation_results.results.keys())}
+        # Column of each brief id (the first one if ids repeat)
+        brief_index = {}
+        for brief_idx, brief in enumerate(briefs):
+            brief_index.setdefault(brief["id"], brief_idx)
         
-        score_matrix = ScoreMatrix.create_empty(
+        miner_indices, brief_indices, scores = self._collect_score_triplets(evaluation_results, brief_index)
+        score_matrix = ScoreMatrix.from_triplets(
+            miner_indices, brief_indices, scores,
             num_miners=len(evaluation_results.results),
             num_briefs=len(briefs)
         )
         
-        for uid, result in evaluation_results.results.items():
-            miner_idx = uid_to_index[uid]
-            
-            for brief_idx, brief in enumerate(briefs):
-                brief_id = brief["id"]
-                
-                # Aggregate scores across all accounts for this brief
-                total_score = self._aggregate_brief_scores(result, brief_id)
-                score_matrix.set_score(miner_idx, brief_idx, total_score)
+        # Briefs sharing an id get the same totals
+        for brief_idx, brief in enumerate(briefs):
+            first_idx = brief_index[brief["id"]]
+            if first_idx != brief_idx:
+                score_matrix.matrix[:, brief_idx] = score_matrix.matrix[:, first_idx]
         
         return score_matrix
     
-    def _aggregate_brief_scores(self, evaluation_result, brief_id: str) -> float:
+    def _collect_score_triplets(
+        self,
+        evaluation_results: EvaluationResultCollection,
+        brief_index: Dict[str, int]
+    ) -> Tuple[List[int], List[int], List[float]]:
         """
-        Aggregate scores for a specific brief across all accounts.
+        Flatten every account's brief scores into (miner index, brief index, score) triplets.
         
-        Note: This is platform-agnostic summation. Platform-specific transformations
-        (scaling factors, boost multipliers) are applied at the platform level
-        before aggregation, making this service work for any future platform.
+        Miner indices follow the UID order of evaluation_results. Zero scores are skipped
+        (most accounts score zero for most briefs) and scores for brief ids not in
+        brief_index are dropped.
         """
-        total_score = 0.0
-        
-        # Sum pre-scaled scores from all account evaluations
-        for account_data in evaluation_result.account_results.values():
-            brief_score = account_data.scores.get(brief_id, 0.0)
-            total_score += brief_score
-        
-        return total_score 
\ No newline at end of file
+        miner_indices, brief_indices, scores = [], [], []
+        for miner_idx, result in enumerate(evaluation_results.results.values()):
+            for account_data in result.account_results.values():
+                for brief_id, score in account_data.scores.items():
+                    if not score:
+                        continue
+                    brief_idx = brief_index.get(brief_id)
+                    if brief_idx is not None:
+                        miner_indices.append(miner_idx)
+                        brief_indices.append(brief_idx)
+                        scores.append(score)
+        return miner_indices, brief_indices, scores
@@ -1,6 +1,6 @@
 """Weight corrections calculation service for post-constraint scaling factors."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping
 import numpy as np
 import bittensor as bt
 from ..models.evaluation_result import EvaluationResultCollection
@@ -28,110 +28,121 @@ class WeightCorrectionsService:
         Returns:
             List of corrections: [{"content_id": str, "brief_id": str, "scaling_factor": float}]
         """
-        corrections = []
-        
         # Build brief_id to index mapping
         brief_id_to_idx = {brief["id"]: idx for idx, brief in enumerate(briefs)}
         
-        # Process each miner's results
+        # Index every (video, brief) pair once, then look up all scaling factors in one gather
+        video_table = _VideoTable()
         for uid_idx, (uid, evaluation_result) in enumerate(evaluation_results.results.items()):
             if not evaluation_result or not evaluation_result.account_results:
                 continue
                 
-            # Process each account for this miner
-            for account_result in evaluation_result.account_results.values():
-                self._process_account_corrections(
-                    account_result, 
-                    uid_idx,
-                    brief_id_to_idx,
-                    pre_constraint_weights,
-                    post_constraint_weights,
-                    corrections
-                )
+            # Process each account for this miner (read back from disk if spilled)
+            for account_result in evaluation_results.get_account_results(uid).values():
+                self._index_account_videos(account_result, uid_idx, brief_id_to_idx, video_table)
+        
+        scaling_factors = self._calculate_scaling_factors(
+            pre_constraint_weights, post_constraint_weights,
+            np.asarray(video_table.uid_indices, dtype=np.intp),
+            np.asarray(video_table.brief_indices, dtype=np.intp)
+        )
+        
+        corrections = [
+            {"content_id": content_id, "brief_id": brief_id, "scaling_factor": scaling_factor}
+            for content_id, brief_id, scaling_factor in zip(
+                video_table.content_ids, video_table.brief_ids, scaling_factors.tolist()
+            )
+        ]
         
         bt.logging.info(f"Generated {len(corrections)} weight corrections")
         return corrections
     
-    def _process_account_corrections(
+    def _index_account_videos(
         self,
         account_result,
         uid_idx: int,
         brief_id_to_idx: Dict[str, int],
-        pre_constraint_weights: np.ndarray,
-        post_constraint_weights: np.ndarray,
-        corrections: List[Dict[str, Any]]
+        video_table: "_VideoTable"
     ) -> None:
-        """Process corrections for a single account."""
+        """Add a row to video_table for each (video, matched brief) pair of an account."""
+        # Bound appends: this loop runs once per (video, brief) pair of the whole cycle
+        add_content_id = video_table.content_ids.append
+        add_brief_id = video_table.brief_ids.append
+        add_uid_idx = video_table.uid_indices.append
+        add_brief_idx = video_table.brief_indices.append
+        extract_content_id = self._extract_content_id
         
         for video_id, video_data in account_result.videos.items():
-            if not isinstance(video_data, dict):
+            if not isinstance(video_data, Mapping):
+                continue
+            
+            brief_metrics = video_data.get("brief_metrics")
+            if not brief_metrics:
                 continue
                 
             # Extract content_id (platform-agnostic identifier)
-            content_id = self._extract_content_id(video_data, video_id)
+            content_id = extract_content_id(video_data, video_id)
             
             # Process each brief this video matched
-            brief_metrics = video_data.get("brief_metrics", {})
-            
-            for brief_id, metrics in brief_metrics.items():
-                if brief_id not in brief_id_to_idx:
+            for brief_id in brief_metrics:
+                brief_idx = brief_id_to_idx.get(brief_id)
+                if brief_idx is None:
                     continue
-                    
-                brief_idx = brief_id_to_idx[brief_id]
-                
-                # Calculate scaling factor from weight matrices
-                scaling_factor = self._calculate_scaling_factor(
-                    uid_idx, brief_idx, pre_constraint_weights, post_constraint_weights
-                )
-                
-                # Add correction entry
-                corrections.append({
-                    "content_id": content_id,
-                    "brief_id": brief_id,
-                    "scaling_factor": scaling_factor
-                })
+                add_content_id(content_id)
+                add_brief_id(brief_id)
+                add_uid_idx(uid_idx)
+                add_brief_idx(brief_idx)
     
     def _extract_content_id(self, video_data: Dict[str, Any], fallback_video_id: str) -> str:
         """Extract platform-agnostic content_id from video data."""
-        if isinstance(video_data, dict) and "details" in video_data:
+        if isinstance(video_data, Mapping) and "details" in video_data:
             details = video_data["details"]
             if isinstance(details, dict):
                 return details.get("bitcastVideoId", fallback_video_id)
         
         return fallback_video_id
     
-    def _calculate_scaling_factor(
+    def _calculate_scaling_factors(
         self,
-        uid_idx: int,
-        brief_idx: int,
         pre_constraint_weights: np.ndarray,
-        post_constraint_weights: np.ndarray
-    ) -> float:
+        post_constraint_weights: np.ndarray,
+        uid_indices: np.ndarray,
+        brief_indices: np.ndarray
+    ) -> np.ndarray:
         """
-        Calculate scaling factor by comparing pre and post constraint weights.
+        Calculate scaling factors by comparing pre and post constraint weights.
         
         Returns:
-            float: Scaling factor (0.0-2.0+)
+            np.ndarray: Scaling factor (0.0-10.0) per (uid index, brief index) pair
                 - 1.0 = No scaling applied
                 - 0.0-0.99 = Weight reduced by constraints
-                - 0.0 = Content was limited
+                - 0.0 = Content was limited, no original weight or outside the matrices
                 - 1.01+ = Weight increased (rare, minimum scaling)
         """
-        # Handle matrix bounds checking
-        if (uid_idx >= pre_constraint_weights.shape[0] or 
-            brief_idx >= pre_constraint_weights.shape[1] or
-            uid_idx >= post_constraint_weights.shape[0] or 
-            brief_idx >= post_constraint_weights.shape[1]):
-            return 0.0
-            
-        pre_weight = float(pre_constraint_weights[uid_idx, brief_idx])
-        post_weight = float(post_constraint_weights[uid_idx, brief_idx])
+        num_rows = min(pre_constraint_weights.shape[0], post_constraint_weights.shape[0])
+        num_cols = min(pre_constraint_weights.shape[1], post_constraint_weights.shape[1])
         
-        # Handle edge cases
-        if pre_weight == 0.0:
-            return 0.0  # No original weight
-            
-        scaling_factor = post_weight / pre_weight
+        pre_weights = pre_constraint_weights[:num_rows, :num_cols].astype(np.float64, copy=False)
+        post_weights = post_constraint_weights[:num_rows, :num_cols].astype(np.float64, copy=False)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factors = post_weights / pre_weights
+        # Ensure reasonable bounds (protect against numerical issues); NaN and -0.0 become 0.0
+        factors = np.clip(factors, 0.0, 10.0)
+        factors[(pre_weights == 0.0) | np.isnan(factors) | (factors == 0.0)] = 0.0
         
-        # Ensure reasonable bounds (protect against numerical issues)
-        return max(0.0, min(scaling_factor, 10.0))
\ No newline at end of file
+        in_bounds = (uid_indices < num_rows) & (brief_indices < num_cols)
+        scaling_factors = np.zeros(len(uid_indices), dtype=np.float64)
+        scaling_factors[in_bounds] = factors[uid_indices[in_bounds], brief_indices[in_bounds]]
+        return scaling_factors
+
+
+class _VideoTable:
+    """Columnar index of (content, brief) pairs and their matrix coordinates."""
+    
+    __slots__ = ("content_ids", "brief_ids", "uid_indices", "brief_indices")
+    
+    def __init__(self):
+        self.content_ids: List[str] = []
+        self.brief_ids: List[str] = []
+        self.uid_indices: List[int] = []
+        self.brief_indices: List[int] = []
@@ -0,0 +1,116 @@
+"""
+Compiled, immutable brief representation.
+
+get_briefs compiles each raw brief dict once when briefs are loaded. A Brief is a
+read-only Mapping over the raw fields, so existing `brief["id"]` / `brief.get(...)`
+access keeps working and a Brief compares equal to its raw dict, and it also
+carries values that validation, prescreening, priority selection and prompt
+generation would otherwise re-derive for every video:
+
+- publish_date_range: allowed publish window (start date minus the release buffer
+  to the end of the end date), None if the dates are malformed
+- identifier: stripped, lowercased unique identifier, None if not required
+- priority: weight * boost used by select_highest_priority_brief
+- prompt_version: resolved prompt version (the latest one when unspecified)
+
+Consumers read these attributes when given a Brief and fall back to parsing raw
+dicts, so plain dicts (e.g. in tests) are still accepted everywhere.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from bitcast.validator.clients.prompts import get_latest_prompt_version
+from bitcast.validator.utils.config import YT_VIDEO_RELEASE_BUFFER
+
+
+def get_brief_date_range(brief) -> Tuple[datetime, datetime]:
+    """
+    Allowed publish range of a brief: start date minus the release buffer to the end of the end date.
+
+    Raises:
+        KeyError, ValueError, TypeError: If the brief dates are missing or malformed
+    """
+    brief_start = datetime.fromisoformat(brief["start_date"])
+    brief_end = datetime.fromisoformat(brief["end_date"])
+    allowed_start = brief_start - timedelta(days=YT_VIDEO_RELEASE_BUFFER)
+    allowed_end = brief_end.replace(hour=23, minute=59, second=59, microsecond=999999)
+    return allowed_start, allowed_end
+
+
+def normalize_identifier(identifier: Optional[str]) -> Optional[str]:
+    """Return the stripped, lowercased identifier, or None when blank or missing."""
+    if identifier is None:
+        return None
+    identifier = identifier.strip()
+    return identifier.lower() if identifier else None
+
+
+@dataclass(frozen=True, eq=False)
+class Brief(Mapping):
+    """Immutable brief with pre-parsed dates and normalized fields; a read-only Mapping of the raw brief."""
+    raw: Mapping[str, Any] = field(repr=False)
+    id: Any
+    format: str
+    weight: Any
+    boost: Any
+    priority: Any
+    identifier: Optional[str]
+    publish_date_range: Optional[Tuple[datetime, datetime]]
+    prompt_version: Optional[int]
+
+    @classmethod
+    def compile(cls, raw: Mapping[str, Any]) -> "Brief":
+        """Compile a raw brief dict. Never raises for malformed optional fields."""
+        if isinstance(raw, Brief):
+            return raw
+        raw = MappingProxyType(dict(raw))
+        weight = raw.get("weight", 0)
+        boost = raw.get("boost", 1.0)
+        try:
+            priority = weight * boost
+        except TypeError:
+            priority = 0
+        try:
+            publish_date_range = get_brief_date_range(raw)
+        except (KeyError, ValueError, TypeError, AttributeError):
+            publish_date_range = None
+        try:
+            identifier = normalize_identifier(raw.get("unique_identifier"))
+        except AttributeError:
+            identifier = None
+        prompt_version = raw.get("prompt_version")
+        return cls(
+            raw=raw,
+            id=raw.get("id"),
+            format=raw.get("format", "dedicated"),
+            weight=weight,
+            boost=boost,
+            priority=priority,
+            identifier=identifier,
+            publish_date_range=publish_date_range,
+            prompt_version=prompt_version if prompt_version is not None else get_latest_prompt_version(),
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        return self.raw[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __reduce__(self):
+        return (Brief.compile, (dict(self.raw),))
+
+    def to_dict(self) -> dict:
+        """Return a mutable copy of the raw brief."""
+        return dict(self.raw)
+
+
+def compile_briefs(briefs: Iterable[Mapping[str, Any]]) -> List[Brief]:
+    """Compile raw brief dicts, keeping order."""
+    return [Brief.compile(brief) for brief in briefs]
@@ -3,9 +3,19 @@ import bittensor as bt
 from datetime import datetime, timezone, timedelta
 from diskcache import Cache
 import os
-from threading import Lock
+import time
+from threading import Event, Lock, Thread
 import atexit
-from bitcast.validator.utils.config import BITCAST_BRIEFS_ENDPOINT, YT_REWARD_DELAY, YT_SCORING_WINDOW, CACHE_DIRS
+from typing import Dict, List, Optional, Tuple
+from bitcast.validator.utils.config import (
+    BITCAST_BRIEFS_ENDPOINT,
+    BRIEFS_FETCH_TIMEOUT,
+    BRIEFS_REFRESH_INTERVAL,
+    YT_REWARD_DELAY,
+    YT_SCORING_WINDOW,
+    CACHE_DIRS,
+)
+from bitcast.validator.utils.brief_model import Brief, compile_briefs
 from bitcast.validator.utils.error_handling import log_and_raise_api_error
 
 class BriefsCache:
@@ -51,21 +61,183 @@ class BriefsCache:
 # Initialize cache
 BriefsCache.initialize_cache()
 
+def _filter_active_briefs(briefs_list, current_date):
+    """
+    Keep briefs whose window (start_date + YT_REWARD_DELAY to end_date + YT_SCORING_WINDOW + YT_REWARD_DELAY)
+    includes current_date. Briefs with malformed dates are skipped.
+    """
+    filtered_briefs = []
+    for brief in briefs_list:
+        try:
+            start_date = datetime.strptime(brief["start_date"], "%Y-%m-%d").date()
+            end_date = datetime.strptime(brief["end_date"], "%Y-%m-%d").date()
+            # Apply new window: start_date + YT_REWARD_DELAY, end_date + YT_SCORING_WINDOW + YT_REWARD_DELAY
+            start_window = start_date + timedelta(days=YT_REWARD_DELAY)
+            end_window = end_date + timedelta(days=YT_SCORING_WINDOW + YT_REWARD_DELAY)
+            
+            if start_window <= current_date <= end_window:
+                filtered_briefs.append(brief)
+        except Exception as e:
+            bt.logging.error(f"Error parsing dates for brief {brief.get('id', 'unknown')}: {e}")
+    
+    if not filtered_briefs:
+        bt.logging.info("No briefs have an active date range or are within the reward delay period.")
+    return filtered_briefs
+
+
+class BriefsRefresher:
+    """
+    Keeps a last good snapshot of all briefs fresh from a daemon thread.
+
+    Each refresh is a conditional GET (If-None-Match / If-Modified-Since) with a strict
+    timeout, so an unchanged or hung endpoint costs the validator nothing: get_briefs
+    serves the snapshot without touching the network. Successful fetches are written
+    to BriefsCache, which also seeds the snapshot on start.
+    """
+
+    def __init__(self, interval: float = BRIEFS_REFRESH_INTERVAL, timeout: float = BRIEFS_FETCH_TIMEOUT):
+        self.interval = interval
+        self.timeout = timeout
+        self._lock = Lock()
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+        self._briefs: Optional[list] = None
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._fetched_at: Optional[float] = None
+        self._compiled: Dict[Tuple[bool, object], List[Brief]] = {}
+
+    def start(self) -> None:
+        """Seed the snapshot from BriefsCache and start refreshing in the background."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        cached_briefs = BriefsCache.get_cache().get("briefs_True")
+        if cached_briefs is not None:
+            self._set_snapshot(cached_briefs, fetched=False)
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run, name="briefs-refresher", daemon=True)
+        self._thread.start()
+        bt.logging.info(f"Briefs refresher started (every {self.interval}s, timeout {self.timeout}s)")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self.refresh()
+            self._stop_event.wait(self.interval)
+
+    def refresh(self) -> bool:
+        """
+        Revalidate the snapshot against the briefs endpoint.
+
+        Returns:
+            bool: True if the snapshot is current (changed or not modified), False if the fetch failed
+        """
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+
+        try:
+            response = requests.get(BITCAST_BRIEFS_ENDPOINT, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and self._briefs is not None:
+                with self._lock:
+                    self._fetched_at = time.monotonic()
+                return True
+            response.raise_for_status()
+            briefs_list = response.json().get("items") or []
+        except (requests.exceptions.RequestException, ValueError) as e:
+            bt.logging.warning(f"Briefs refresh failed, serving snapshot (age: {self.snapshot_age()}s): {e}")
+            return False
+
+        BriefsCache.get_cache().set("briefs_True", briefs_list)
+        response_headers = getattr(response, "headers", None) or {}
+        self._set_snapshot(briefs_list, response_headers.get("ETag"), response_headers.get("Last-Modified"))
+        bt.logging.debug(f"Refreshed {len(briefs_list)} briefs.")
+        return True
+
+    def _set_snapshot(self, briefs_list, etag=None, last_modified=None, fetched=True) -> None:
+        with self._lock:
+            self._briefs = briefs_list
+            self._etag = etag
+            self._last_modified = last_modified
+            self._fetched_at = time.monotonic() if fetched else None
+            self._compiled = {}
+
+    def get(self, all: bool = False) -> Optional[List[Brief]]:
+        """Return compiled briefs from the snapshot, or None if there is no snapshot yet."""
+        current_date = datetime.now(timezone.utc).date()
+        key = (all, None if all else current_date)
+        with self._lock:
+            if self._briefs is None:
+                return None
+            briefs = self._compiled.get(key)
+            if briefs is None:
+                briefs_list = self._briefs if all else _filter_active_briefs(self._briefs, current_date)
+                briefs = compile_briefs(briefs_list)
+                self._compiled = {k: v for k, v in self._compiled.items() if k[1] in (None, current_date)}
+                self._compiled[key] = briefs
+            # Callers own the list; the compiled briefs themselves are immutable
+            return list(briefs)
+
+    def snapshot_age(self) -> Optional[float]:
+        """Seconds since the snapshot was last fetched or revalidated, None if never."""
+        fetched_at = self._fetched_at
+        return None if fetched_at is None else round(time.monotonic() - fetched_at, 1)
+
+
+_refresher: Optional[BriefsRefresher] = None
+
+
+def start_briefs_refresher(interval: float = BRIEFS_REFRESH_INTERVAL) -> BriefsRefresher:
+    """Start the process-wide background briefs refresher (idempotent)."""
+    global _refresher
+    if _refresher is None:
+        _refresher = BriefsRefresher(interval=interval)
+    _refresher.start()
+    return _refresher
+
+
+def stop_briefs_refresher() -> None:
+    global _refresher
+    if _refresher is not None:
+        _refresher.stop()
+        _refresher = None
+
+
+def get_briefs_snapshot_age() -> Optional[float]:
+    """Age in seconds of the briefs snapshot served by the background refresher, None if not running."""
+    return _refresher.snapshot_age() if _refresher is not None else None
+
+
 def get_briefs(all: bool = False):
     """
     Fetches the briefs from the server.
 
+    When the background refresher is running, briefs are served from its last good
+    snapshot without a network call; otherwise they are fetched synchronously.
+
     :param all: If True, returns all briefs without filtering;
                 if False, only returns briefs where the current UTC date is between start and end dates (inclusive),
                 or where the end date is within YT_REWARD_DELAY days of the current date.
-    :return: List of brief objects
+    :return: List of compiled Brief objects (read-only mappings over the raw briefs)
     """
+    if _refresher is not None:
+        briefs = _refresher.get(all)
+        if briefs is not None:
+            return briefs
+
     cache = BriefsCache.get_cache()
     cache_key = f"briefs_{all}"
     
     try:
         # Always try to fetch from API first
-        response = requests.get(BITCAST_BRIEFS_ENDPOINT)
+        response = requests.get(BITCAST_BRIEFS_ENDPOINT, timeout=BRIEFS_FETCH_TIMEOUT)
         response.raise_for_status()
         briefs_data = response.json()
         
@@ -73,38 +245,21 @@ def get_briefs(all: bool = False):
         briefs_list = briefs_data.get("items") or []
         bt.logging.info(f"Fetched {len(briefs_list)} briefs.")
 
-        filtered_briefs = []
         if not all:
-            current_date = datetime.now(timezone.utc).date()
-            
-            for brief in briefs_list:
-                try:
-                    start_date = datetime.strptime(brief["start_date"], "%Y-%m-%d").date()
-                    end_date = datetime.strptime(brief["end_date"], "%Y-%m-%d").date()
-                    # Apply new window: start_date + YT_REWARD_DELAY, end_date + YT_SCORING_WINDOW + YT_REWARD_DELAY
-                    start_window = start_date + timedelta(days=YT_REWARD_DELAY)
-                    end_window = end_date + timedelta(days=YT_SCORING_WINDOW + YT_REWARD_DELAY)
-                    
-                    if start_window <= current_date <= end_window:
-                        filtered_briefs.append(brief)
-                except Exception as e:
-                    bt.logging.error(f"Error parsing dates for brief {brief.get('id', 'unknown')}: {e}")
-            
-            if not filtered_briefs:
-                bt.logging.info("No briefs have an active date range or are within the reward delay period.")
+            filtered_briefs = _filter_active_briefs(briefs_list, datetime.now(timezone.utc).date())
         else:
             filtered_briefs = briefs_list
 
         # Store the successful API response in cache
         cache.set(cache_key, filtered_briefs)
-        return filtered_briefs
+        return compile_briefs(filtered_briefs)
 
     except requests.exceptions.RequestException as e:
         # Try to return cached data if available
         cached_briefs = cache.get(cache_key)
         if cached_briefs is not None:
             bt.logging.warning("Using cached briefs due to API error")
-            return cached_briefs
+            return compile_briefs(cached_briefs)
         
         # No cached data available - this is a real error
         log_and_raise_api_error(
@@ -13,18 +13,37 @@ CACHE_DIRS = {
     "openai": os.path.join(CACHE_ROOT, "openai"),
     "briefs": os.path.join(CACHE_ROOT, "briefs"),
     "youtube_search": os.path.join(CACHE_ROOT, "youtube_search"),
-    "minutes_revenue_ratio": os.path.join(CACHE_ROOT, "minutes_revenue_ratio")
+    "minutes_revenue_ratio": os.path.join(CACHE_ROOT, "minutes_revenue_ratio"),
+    "lexical_prefilter": os.path.join(CACHE_ROOT, "lexical_prefilter"),
+    "results": os.path.join(CACHE_ROOT, "results"),
+    "memory_profiles": os.path.join(CACHE_ROOT, "memory_profiles")
 }
 
 # Cache expiry times (in seconds)
 YOUTUBE_SEARCH_CACHE_EXPIRY = 12 * 60 * 60  # 12 hours
 OPENAI_CACHE_EXPIRY = 3 * 24 * 60 * 60  # 3 days
 
+# Number of SQLite shards for the LLM cache (1 = single diskcache.Cache)
+LLM_CACHE_SHARDS = int(os.getenv('LLM_CACHE_SHARDS', '1'))
+# Seconds a sharded cache write waits for a busy shard before giving up
+LLM_CACHE_TIMEOUT = float(os.getenv('LLM_CACHE_TIMEOUT', '60'))
+# Move entries of an existing single-file LLM cache into the sharded cache on startup
+LLM_CACHE_MIGRATE = os.getenv('LLM_CACHE_MIGRATE', 'False').lower() == 'true'
+
 __version__ = "2.6.1"
 
 # required
 BITCAST_API_URL = os.getenv('BITCAST_API_URL', 'https://bitcast-api.bitcast.network')
 BITCAST_BRIEFS_ENDPOINT = os.getenv('BITCAST_BRIEFS_ENDPOINT', f"{BITCAST_API_URL}/api/v2/validator/briefs")
+# Briefs are refreshed in the background and served from the last good snapshot
+BRIEFS_BACKGROUND_REFRESH = os.getenv('BRIEFS_BACKGROUND_REFRESH', 'True').lower() == 'true'
+BRIEFS_REFRESH_INTERVAL = int(os.getenv('BRIEFS_REFRESH_INTERVAL', '300'))  # seconds
+BRIEFS_FETCH_TIMEOUT = float(os.getenv('BRIEFS_FETCH_TIMEOUT', '10'))  # seconds
+# Pricing is snapshotted once per cycle and frozen; opt-in: keep the snapshot fresh from a background thread
+PRICING_BACKGROUND_REFRESH = os.getenv('PRICING_BACKGROUND_REFRESH', 'False').lower() == 'true'
+PRICING_REFRESH_INTERVAL = int(os.getenv('PRICING_REFRESH_INTERVAL', '300'))  # seconds
+# Oldest snapshot served before a synchronous refresh; older snapshots are never used
+PRICING_MAX_AGE = int(os.getenv('PRICING_MAX_AGE', '1800'))  # seconds
 
 # subnet mechanism configuration
 MECHID = int(os.getenv('MECHID', '0'))
@@ -55,6 +74,29 @@ ECO_MODE = os.getenv('ECO_MODE', 'True').lower() == 'true'
 # Disable prompt injection checking (saves 15-28s per request)
 DISABLE_PROMPT_INJECTION = os.getenv('DISABLE_PROMPT_INJECTION', 'True').lower() == 'true'
 
+# Opt-in: clear obviously clean content locally and only escalate suspicious videos to the LLM injection check
+PROMPT_INJECTION_PREFILTER = os.getenv('PROMPT_INJECTION_PREFILTER', 'False').lower() == 'true'
+# "low", "medium" or "high" - higher sensitivity escalates more content to the LLM
+PROMPT_INJECTION_SENSITIVITY = os.getenv('PROMPT_INJECTION_SENSITIVITY', 'medium').lower()
+# Run the prompt injection check concurrently with brief evaluation (hides its latency, results discarded on detection)
+PROMPT_INJECTION_CONCURRENT = os.getenv('PROMPT_INJECTION_CONCURRENT', 'False').lower() == 'true'
+
+# How the three brief evaluation samples are run:
+# "all" runs all three concurrently, "early_exit" runs all three concurrently and returns at the first YES,
+# "speculative" makes one call and only escalates to the remaining two (concurrently) on NO
+LLM_VALIDATION_STRATEGY = os.getenv('LLM_VALIDATION_STRATEGY', 'all').lower()
+
+# Max LLM requests spent on brief evaluation per validation cycle (0 = unlimited)
+LLM_CYCLE_BUDGET = int(os.getenv('LLM_CYCLE_BUDGET', '0'))
+# Share of the budget held back for high-value evaluations
+LLM_BUDGET_RESERVE_FRACTION = float(os.getenv('LLM_BUDGET_RESERVE_FRACTION', '0.2'))
+# Value percentile (among evaluations seen this cycle) required to use the reserve
+LLM_BUDGET_PRIORITY_PERCENTILE = float(os.getenv('LLM_BUDGET_PRIORITY_PERCENTILE', '0.75'))
+
+# Local lexical relevance prefilter before LLM brief checks: "off", "shadow" (log only) or "enforce"
+LEXICAL_PREFILTER_MODE = os.getenv('LEXICAL_PREFILTER_MODE', 'off').lower()
+LEXICAL_PREFILTER_THRESHOLD = float(os.getenv('LEXICAL_PREFILTER_THRESHOLD', '0.05'))
+
 # youtube scoring
 YT_LOOKBACK = 90
 YT_ROLLING_WINDOW = 7
@@ -72,6 +114,8 @@ YT_NON_YPP_REVENUE_MULTIPLIER = 0.00005
 YT_CURVE_DAMPENING_FACTOR = 0.1
 YT_LIFETIME_DEDUCTION = 100
 YT_LIFETIME_DEDUCTION_AD_READ = 25
+# Score all matched videos of an account in one batch pass instead of one at a time
+YT_BATCH_SCORING = os.getenv('YT_BATCH_SCORING', 'True').lower() == 'true'
 
 # score capping
 YT_SCORE_CAP_START_DAYS = 60  # T-60 days
@@ -93,10 +137,25 @@ TRANSCRIPT_MAX_RETRY = 10
 # transcript maximum length in characters
 TRANSCRIPT_MAX_LENGTH = 250000
 
+# evaluate over-length transcripts window by window instead of cropping them
+TRANSCRIPT_CHUNKED_EVALUATION = os.getenv('TRANSCRIPT_CHUNKED_EVALUATION', 'False').lower() == 'true'
+TRANSCRIPT_CHUNK_OVERLAP = 2000  # characters shared by consecutive windows
+TRANSCRIPT_MAX_CHUNKS = 4
+
 # validation cycle
 VALIDATOR_WAIT = 60 # 60 seconds
 VALIDATOR_STEPS_INTERVAL = 240 # 4 hours
 
+# Spill each miner's evaluation details to CACHE_DIRS["results"] during a cycle,
+# keeping only scores in memory (flat memory use for large fleets)
+RESULT_SPILL = os.getenv('RESULT_SPILL', 'False').lower() == 'true'
+
+# Record RSS and top tracemalloc allocation sites at each reward cycle phase and every
+# N miners, written as one JSON report per run to CACHE_DIRS["memory_profiles"]
+MEMORY_PROFILING = os.getenv('MEMORY_PROFILING', 'False').lower() == 'true'
+MEMORY_PROFILE_EVERY_N_MINERS = int(os.getenv('MEMORY_PROFILE_EVERY_N_MINERS', '32'))
+MEMORY_PROFILE_TOP_N = int(os.getenv('MEMORY_PROFILE_TOP_N', '10'))
+
 # synapse limits
 MAX_ACCOUNTS_PER_SYNAPSE = 1000
 CREDENTIAL_BATCH_SIZE = 8
@@ -112,13 +171,29 @@ SUBNET_TREASURY_UID = int(os.getenv('SUBNET_TREASURY_UID', '155'))
 
 # Log out all non-sensitive config variables
 bt.logging.info(f"BITCAST_BRIEFS_ENDPOINT: {BITCAST_BRIEFS_ENDPOINT}")
+bt.logging.info(f"BRIEFS_BACKGROUND_REFRESH: {BRIEFS_BACKGROUND_REFRESH}")
+bt.logging.info(f"BRIEFS_REFRESH_INTERVAL: {BRIEFS_REFRESH_INTERVAL}")
+bt.logging.info(f"BRIEFS_FETCH_TIMEOUT: {BRIEFS_FETCH_TIMEOUT}")
+bt.logging.info(f"PRICING_BACKGROUND_REFRESH: {PRICING_BACKGROUND_REFRESH}")
+bt.logging.info(f"PRICING_REFRESH_INTERVAL: {PRICING_REFRESH_INTERVAL}")
+bt.logging.info(f"PRICING_MAX_AGE: {PRICING_MAX_AGE}")
 bt.logging.info(f"YOUTUBE_SUBMIT_ENDPOINT: {YOUTUBE_SUBMIT_ENDPOINT}")
 bt.logging.info(f"ENABLE_DATA_PUBLISH: {ENABLE_DATA_PUBLISH}")
 bt.logging.info(f"WEIGHT_CORRECTIONS_ENDPOINT: {WEIGHT_CORRECTIONS_ENDPOINT}")
 bt.logging.info(f"DISABLE_LLM_CACHING: {DISABLE_LLM_CACHING}")
+bt.logging.info(f"LLM_CACHE_SHARDS: {LLM_CACHE_SHARDS}")
+bt.logging.info(f"LLM_CACHE_TIMEOUT: {LLM_CACHE_TIMEOUT}")
+bt.logging.info(f"LLM_CACHE_MIGRATE: {LLM_CACHE_MIGRATE}")
 bt.logging.info(f"LLM_PROVIDER: {LLM_PROVIDER}")
 bt.logging.info(f"ECO_MODE: {ECO_MODE}")
 bt.logging.info(f"DISABLE_PROMPT_INJECTION: {DISABLE_PROMPT_INJECTION}")
+bt.logging.info(f"PROMPT_INJECTION_PREFILTER: {PROMPT_INJECTION_PREFILTER}")
+bt.logging.info(f"PROMPT_INJECTION_SENSITIVITY: {PROMPT_INJECTION_SENSITIVITY}")
+bt.logging.info(f"PROMPT_INJECTION_CONCURRENT: {PROMPT_INJECTION_CONCURRENT}")
+bt.logging.info(f"LLM_VALIDATION_STRATEGY: {LLM_VALIDATION_STRATEGY}")
+bt.logging.info(f"LLM_CYCLE_BUDGET: {LLM_CYCLE_BUDGET}")
+bt.logging.info(f"LEXICAL_PREFILTER_MODE: {LEXICAL_PREFILTER_MODE}")
+bt.logging.info(f"LEXICAL_PREFILTER_THRESHOLD: {LEXICAL_PREFILTER_THRESHOLD}")
 bt.logging.info(f"YT_MIN_SUBS: {YT_MIN_SUBS}")
 bt.logging.info(f"YT_MAX_SUBS: {YT_MAX_SUBS}")
 bt.logging.info(f"YT_MIN_CHANNEL_AGE: {YT_MIN_CHANNEL_AGE}")
@@ -137,10 +212,18 @@ bt.logging.info(f"YT_SCORE_CAP_START_DAYS: {YT_SCORE_CAP_START_DAYS}")
 bt.logging.info(f"YT_SCORE_CAP_END_DAYS: {YT_SCORE_CAP_END_DAYS}")
 bt.logging.info(f"YT_LIFETIME_DEDUCTION: {YT_LIFETIME_DEDUCTION}")
 bt.logging.info(f"YT_LIFETIME_DEDUCTION_AD_READ: {YT_LIFETIME_DEDUCTION_AD_READ}")
+bt.logging.info(f"YT_BATCH_SCORING: {YT_BATCH_SCORING}")
 bt.logging.info(f"TRANSCRIPT_MAX_RETRY: {TRANSCRIPT_MAX_RETRY}")
 bt.logging.info(f"TRANSCRIPT_MAX_LENGTH: {TRANSCRIPT_MAX_LENGTH}")
+bt.logging.info(f"TRANSCRIPT_CHUNKED_EVALUATION: {TRANSCRIPT_CHUNKED_EVALUATION}")
+bt.logging.info(f"TRANSCRIPT_CHUNK_OVERLAP: {TRANSCRIPT_CHUNK_OVERLAP}")
+bt.logging.info(f"TRANSCRIPT_MAX_CHUNKS: {TRANSCRIPT_MAX_CHUNKS}")
 bt.logging.info(f"VALIDATOR_WAIT: {VALIDATOR_WAIT}")
 bt.logging.info(f"VALIDATOR_STEPS_INTERVAL: {VALIDATOR_STEPS_INTERVAL}")
+bt.logging.info(f"RESULT_SPILL: {RESULT_SPILL}")
+bt.logging.info(f"MEMORY_PROFILING: {MEMORY_PROFILING}")
+bt.logging.info(f"MEMORY_PROFILE_EVERY_N_MINERS: {MEMORY_PROFILE_EVERY_N_MINERS}")
+bt.logging.info(f"MEMORY_PROFILE_TOP_N: {MEMORY_PROFILE_TOP_N}")
 bt.logging.info(f"MAX_ACCOUNTS_PER_SYNAPSE: {MAX_ACCOUNTS_PER_SYNAPSE}")
 bt.logging.info(f"CREDENTIAL_BATCH_SIZE: {CREDENTIAL_BATCH_SIZE}")
 bt.logging.info(f"DISCRETE_MODE: {DISCRETE_MODE}")
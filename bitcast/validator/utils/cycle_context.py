@@ -0,0 +1,129 @@
+"""
+Frozen clock and precomputed date windows for one validation cycle.
+
+A cycle can run for hours and cross midnight. RewardOrchestrator.calculate_rewards
+creates one CycleContext when the cycle starts and activates it for the whole
+evaluation, so every miner is scored against the same "now", the same day1/day2
+scoring windows, the same score cap period, the same brief date ranges and the
+same alpha price and miner emissions.
+
+Evaluation code reads the active context through get_active_cycle() and falls
+back to computing from datetime.now() when no cycle is active (standalone calls,
+tests). The active context is process-wide rather than a context variable because
+vetting runs in worker threads that would not inherit one.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, Iterable, Optional, Tuple
+
+import bittensor as bt
+
+from bitcast.validator.utils.brief_model import get_brief_date_range
+from bitcast.validator.utils.config import (
+    YT_LOOKBACK,
+    YT_REWARD_DELAY,
+    YT_ROLLING_WINDOW,
+    YT_SCORE_CAP_END_DAYS,
+    YT_SCORE_CAP_START_DAYS,
+    YT_SCORING_WINDOW,
+)
+from bitcast.validator.utils.token_pricing import PricingSnapshot
+
+BriefKey = Tuple[str, str, str]
+
+
+def _brief_key(brief) -> BriefKey:
+    return (brief.get("id"), brief.get("start_date"), brief.get("end_date"))
+
+
+@dataclass(frozen=True)
+class CycleContext:
+    """Immutable snapshot of the cycle clock and the date windows derived from it."""
+    now: datetime
+    scoring_periods: Tuple[str, str, str, str]
+    cap_period: Tuple[str, str]
+    lookback_period: Tuple[str, str]
+    age_cutoff: datetime
+    brief_date_ranges: Dict[BriefKey, Tuple[datetime, datetime]] = field(default_factory=dict)
+    pricing: Optional[PricingSnapshot] = None
+
+    @classmethod
+    def create(
+        cls,
+        briefs: Iterable[dict] = (),
+        now: Optional[datetime] = None,
+        pricing: Optional[PricingSnapshot] = None,
+    ) -> "CycleContext":
+        """
+        Build the context for a cycle starting at now (default: the current time).
+
+        Args:
+            briefs: Briefs evaluated this cycle; their allowed publish ranges are precomputed
+            now: Cycle clock
+            pricing: Pricing snapshot for the cycle; None to fetch pricing on demand
+        """
+        now = now or datetime.now()
+        today = now.date()
+
+        def days_ago(days):
+            return (now - timedelta(days=days)).strftime('%Y-%m-%d')
+
+        brief_date_ranges = {}
+        for brief in briefs:
+            try:
+                brief_date_ranges[_brief_key(brief)] = get_brief_date_range(brief)
+            except (KeyError, ValueError, TypeError, AttributeError):
+                continue  # Validation reports malformed briefs when it parses them
+
+        return cls(
+            now=now,
+            scoring_periods=(
+                days_ago(YT_REWARD_DELAY + 1 + YT_ROLLING_WINDOW - 1),
+                days_ago(YT_REWARD_DELAY + 1),
+                days_ago(YT_REWARD_DELAY + YT_ROLLING_WINDOW - 1),
+                days_ago(YT_REWARD_DELAY),
+            ),
+            cap_period=(
+                (today - timedelta(days=YT_SCORE_CAP_START_DAYS)).strftime('%Y-%m-%d'),
+                (today - timedelta(days=YT_SCORE_CAP_END_DAYS)).strftime('%Y-%m-%d'),
+            ),
+            lookback_period=(days_ago(YT_LOOKBACK), now.strftime('%Y-%m-%d')),
+            age_cutoff=(now - timedelta(days=YT_SCORING_WINDOW + YT_REWARD_DELAY)).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            ),
+            brief_date_ranges=brief_date_ranges,
+            pricing=pricing,
+        )
+
+    @property
+    def today(self) -> str:
+        return self.now.strftime('%Y-%m-%d')
+
+    def brief_date_range(self, brief) -> Optional[Tuple[datetime, datetime]]:
+        """Precomputed allowed publish range of a brief, None if it was not known at cycle start."""
+        return self.brief_date_ranges.get(_brief_key(brief))
+
+
+_active_lock = Lock()
+_active_cycle: Optional[CycleContext] = None
+
+
+def activate_cycle(cycle: CycleContext) -> None:
+    """Make cycle the active context for all evaluation until deactivate_cycle()."""
+    global _active_cycle
+    with _active_lock:
+        _active_cycle = cycle
+    bt.logging.info(f"Cycle clock frozen at {cycle.now.isoformat(timespec='seconds')}")
+
+
+def deactivate_cycle() -> None:
+    global _active_cycle
+    with _active_lock:
+        _active_cycle = None
+
+
+def get_active_cycle() -> Optional[CycleContext]:
+    """Return the active cycle context, or None outside a validation cycle."""
+    return _active_cycle
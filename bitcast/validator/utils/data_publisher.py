@@ -11,7 +11,7 @@ import aiohttp
 import bittensor as bt
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Mapping, Optional, Union, List
 import time
 
 import numpy as np
@@ -25,7 +25,7 @@ def convert_numpy_types(obj):
         return float(obj)
     elif isinstance(obj, np.ndarray):
         return obj.tolist()
-    elif isinstance(obj, dict):
+    elif isinstance(obj, Mapping):
         return {key: convert_numpy_types(value) for key, value in obj.items()}
     elif isinstance(obj, list):
         return [convert_numpy_types(item) for item in obj]
@@ -33,6 +33,26 @@ def convert_numpy_types(obj):
         return obj
 
 
+def _json_default(obj):
+    """json.dumps hook for NumPy values, matching convert_numpy_types."""
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.bool_):
+        return bool(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def canonical_json(obj) -> str:
+    """Serialize obj with sorted keys, encoding NumPy values in place instead of copying the structure."""
+    return json.dumps(obj, sort_keys=True, default=_json_default)
+
+
 class DataPublisher(ABC):
     """Abstract base class for data publishing with message signing."""
     
@@ -81,42 +101,84 @@ class DataPublisher(ABC):
         Returns:
             Dict containing signed payload with signature and signer
         """
+        signature_fields, _ = self._sign_core_data(data)
+
+        # Create final payload with SAME timestamp used for signing
+        signed_payload = {
+            **convert_numpy_types(data),
+            **signature_fields
+        }
+
+        return signed_payload
+
+    def _sign_message_bytes(self, data: Dict[str, Any]) -> bytes:
+        """
+        Sign message data and serialize the signed payload to JSON bytes for the request body.
+
+        The core data is serialized once: the canonical JSON that is signed is
+        embedded in the body as-is rather than re-encoded by the HTTP client.
+
+        Args:
+            data: Full payload including metadata and core data
+
+        Returns:
+            UTF-8 JSON of the signed payload (same content as _sign_message)
+        """
+        signature_fields, core_json = self._sign_core_data(data)
+        signable_key = self._signable_key(data)
+
+        fields = {key: value for key, value in data.items() if key != signable_key}
+        fields.update(signature_fields)
+        members = {key: canonical_json(value) for key, value in fields.items()}
+        if signable_key is not None:
+            members[signable_key] = core_json
+
+        body = ", ".join(f"{json.dumps(key)}: {members[key]}" for key in sorted(members))
+        return f"{{{body}}}".encode("utf-8")
+
+    def _sign_core_data(self, data: Dict[str, Any]):
+        """
+        Sign the core data of a payload.
+
+        Returns:
+            Tuple of (time/signature/signer fields to add to the payload, canonical JSON of the core data)
+        """
         keypair = self.wallet.hotkey
         signer = keypair.ss58_address
 
-        # Convert numpy types once for the entire payload
-        converted_payload = convert_numpy_types(data)
-
-        # Extract core data to sign from the already-converted payload
-        core_data_to_sign = self._extract_signable_data(converted_payload)
+        # Serialize core data once, converting numpy types during encoding
+        core_json = canonical_json(self._extract_signable_data(data))
 
         # Generate timestamp for BOTH signing and payload (must be identical!)
         timestamp = datetime.utcnow().isoformat()
 
         # Create message to sign (format: signer:timestamp:core_data)
-        message = f"{signer}:{timestamp}:{json.dumps(core_data_to_sign, sort_keys=True)}"
+        message = f"{signer}:{timestamp}:{core_json}"
 
         # Sign the message
         signature = keypair.sign(data=message)
 
-        # Create final payload with SAME timestamp used for signing
-        signed_payload = {
-            **converted_payload,
+        signature_fields = {
             "time": timestamp,
             "signature": signature.hex(),
             "signer": signer,
             "vali_hotkey": signer
         }
+        return signature_fields, core_json
 
-        return signed_payload
+    def _signable_key(self, data: Dict[str, Any]) -> Optional[str]:
+        """Key of the payload field holding the signed core data, None if there is none."""
+        if 'payload' in data:
+            return 'payload'
+        if 'account_data' in data:
+            return 'account_data'
+        return None
 
     def _extract_signable_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract the core data that should be signed from the payload.
         Supports both unified format ('payload' field) and legacy format ('account_data' field).
 
-        Data is expected to already have numpy types converted.
-
         Args:
             data: Full payload data (already converted)
 
@@ -209,15 +271,15 @@ class UnifiedDataPublisher(DataPublisher):
         """
         start_time = time.time()
         try:
-            # Sign the message using corrected format
-            signed_payload = self._sign_message(data)
+            # Sign the message and serialize the body once; the bytes are sent as-is
+            body = self._sign_message_bytes(data)
             
             # Make async HTTP request with longer timeout
             timeout = aiohttp.ClientTimeout(total=self.timeout_seconds)
             async with aiohttp.ClientSession(timeout=timeout) as session:
                 async with session.post(
                     endpoint, 
-                    json=signed_payload,
+                    data=body,
                     headers={
                         "Content-Type": "application/json",
                         "Accept": "application/json"
@@ -229,7 +291,7 @@ class UnifiedDataPublisher(DataPublisher):
                             response_data = await response.json()
                             # Check for success status in response
                             if response_data.get("status") == "success":
-                                payload_type = signed_payload.get("payload_type", "unknown")
+                                payload_type = data.get("payload_type", "unknown")
                                 bt.logging.info(f"✅ Successfully published {payload_type} data (%.2fs)", response_time)
                                 return True
                             else:
@@ -0,0 +1,168 @@
+"""
+Optional memory instrumentation for the reward cycle.
+
+With MEMORY_PROFILING enabled, RewardOrchestrator.calculate_rewards records the
+process RSS and the largest tracemalloc allocation sites at each phase boundary
+(evaluate, aggregate, emission, distribution, corrections, publish) and every
+MEMORY_PROFILE_EVERY_N_MINERS miners during evaluation. Each checkpoint is
+logged as one line, and the run's checkpoints are written as a compact JSON
+report to CACHE_DIRS["memory_profiles"]/<run_id>.json when the cycle ends.
+
+Each checkpoint lists the top allocation sites by size and the sites that grew
+the most since the previous checkpoint, so a memory regression can be traced to
+a phase and a source line without attaching an external profiler. Only
+per-line totals are kept between checkpoints, never full tracemalloc snapshots.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import bittensor as bt
+import psutil
+
+from bitcast.validator.utils.config import (
+    CACHE_DIRS,
+    MEMORY_PROFILE_EVERY_N_MINERS,
+    MEMORY_PROFILE_TOP_N,
+    MEMORY_PROFILING,
+)
+
+_MIB = 1024 * 1024
+
+_TRACE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class MemoryProfiler:
+    """Records memory checkpoints for one validation run; every method is a no-op when disabled."""
+
+    def __init__(
+        self,
+        run_id: str,
+        enabled: bool = MEMORY_PROFILING,
+        every_n_miners: int = MEMORY_PROFILE_EVERY_N_MINERS,
+        top_n: int = MEMORY_PROFILE_TOP_N,
+        report_dir: str = CACHE_DIRS["memory_profiles"]
+    ):
+        self.run_id = run_id
+        self.enabled = enabled
+        self.every_n_miners = every_n_miners
+        self.top_n = top_n
+        self.report_dir = report_dir
+        self.checkpoints: List[Dict[str, Any]] = []
+        self._process = psutil.Process() if enabled else None
+        self._started_tracing = False
+        self._start_time = time.monotonic()
+        self._previous_rss = 0
+        self._previous_sites: Dict[str, Tuple[int, int]] = {}
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def checkpoint(self, label: str, miners: Optional[int] = None) -> None:
+        """Record RSS and allocation sites at a phase boundary."""
+        if not self.enabled:
+            return
+        try:
+            rss = self._process.memory_info().rss
+            traced, traced_peak = tracemalloc.get_traced_memory()
+            sites = self._allocation_sites()
+        except Exception as e:
+            bt.logging.warning(f"Memory checkpoint '{label}' failed: {e}")
+            return
+
+        checkpoint = {
+            "label": label,
+            "elapsed_s": round(time.monotonic() - self._start_time, 1),
+            "rss_mib": round(rss / _MIB, 1),
+            "rss_delta_mib": round((rss - self._previous_rss) / _MIB, 1) if self.checkpoints else 0.0,
+            "traced_mib": round(traced / _MIB, 1),
+            "traced_peak_mib": round(traced_peak / _MIB, 1),
+            "top": self._top_sites(sites),
+            "growth": self._top_growth(sites),
+        }
+        if miners is not None:
+            checkpoint["miners"] = miners
+        self.checkpoints.append(checkpoint)
+        self._previous_rss = rss
+        self._previous_sites = sites
+
+        bt.logging.info(
+            f"Memory [{label}]: RSS {checkpoint['rss_mib']} MiB ({checkpoint['rss_delta_mib']:+} MiB), "
+            f"traced {checkpoint['traced_mib']} MiB (peak {checkpoint['traced_peak_mib']} MiB)"
+        )
+
+    def miner_evaluated(self, miners_done: int) -> None:
+        """Record a checkpoint every every_n_miners evaluated miners."""
+        if self.enabled and self.every_n_miners > 0 and miners_done % self.every_n_miners == 0:
+            self.checkpoint(f"miners_{miners_done}", miners=miners_done)
+
+    def finish(self) -> Optional[str]:
+        """
+        Stop tracing (if this profiler started it) and write the run report.
+
+        Returns:
+            Path of the written report, None when disabled or nothing was recorded
+        """
+        if not self.enabled:
+            return None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        if not self.checkpoints:
+            return None
+
+        report = {
+            "run_id": self.run_id,
+            "written_at": datetime.utcnow().isoformat(),
+            "peak_rss_mib": max(checkpoint["rss_mib"] for checkpoint in self.checkpoints),
+            "checkpoints": self.checkpoints,
+        }
+        try:
+            os.makedirs(self.report_dir, exist_ok=True)
+            path = os.path.join(self.report_dir, f"{self.run_id}.json")
+            with open(path, "w") as f:
+                json.dump(report, f, separators=(",", ":"))
+        except OSError as e:
+            bt.logging.warning(f"Failed to write memory report for run {self.run_id}: {e}")
+            return None
+        bt.logging.info(f"Memory report for run {self.run_id}: peak RSS {report['peak_rss_mib']} MiB, written to {path}")
+        return path
+
+    def _allocation_sites(self) -> Dict[str, Tuple[int, int]]:
+        """Traced (size, count) per source line, empty when tracemalloc is not tracing."""
+        if not tracemalloc.is_tracing():
+            return {}
+        snapshot = tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)
+        sites = {}
+        for stat in snapshot.statistics("lineno"):
+            frame = stat.traceback[0]
+            sites[f"{frame.filename}:{frame.lineno}"] = (stat.size, stat.count)
+        return sites
+
+    def _top_sites(self, sites: Dict[str, Tuple[int, int]]) -> List[Dict[str, Any]]:
+        largest = sorted(sites.items(), key=lambda item: item[1][0], reverse=True)[:self.top_n]
+        return [
+            {"where": where, "size_kib": round(size / 1024, 1), "count": count}
+            for where, (size, count) in largest
+        ]
+
+    def _top_growth(self, sites: Dict[str, Tuple[int, int]]) -> List[Dict[str, Any]]:
+        growth = []
+        for where, (size, _) in sites.items():
+            size_diff = size - self._previous_sites.get(where, (0, 0))[0]
+            if size_diff > 0:
+                growth.append((size_diff, where))
+        growth.sort(reverse=True)
+        return [
+            {"where": where, "size_diff_kib": round(size_diff / 1024, 1)}
+            for size_diff, where in growth[:self.top_n]
+        ]
@@ -0,0 +1,73 @@
+"""
+On-disk spill of per-miner evaluation details for one validation cycle.
+
+With RESULT_SPILL enabled, the orchestrator writes each miner's account results
+(videos, analytics, channel data) to <results cache dir>/<run_id>/<uid>.pkl as soon
+as the miner has been evaluated and published, and keeps only per-account scores
+in memory for aggregation. Weight corrections and the run stats list read the
+details back one miner at a time, so peak memory no longer grows with fleet size.
+
+A run's directory is kept after the cycle (the returned stats list reads from it)
+and removed when the next run's store is created.
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+from typing import Dict
+
+import bittensor as bt
+
+from bitcast.validator.reward_engine.models.evaluation_result import AccountResult
+
+
+class ResultStore:
+    """Per-run directory of pickled account results, one file per miner UID."""
+
+    def __init__(self, root: str, run_id: str):
+        """
+        Create the store for run_id under root, removing the directories of earlier runs.
+
+        Args:
+            root: Directory holding one subdirectory per run
+            run_id: Validation run identifier
+        """
+        self.root = root
+        self.run_id = run_id
+        self.path = os.path.join(root, run_id)
+        self._remove_previous_runs()
+        os.makedirs(self.path, exist_ok=True)
+
+    def save(self, uid: int, account_results: Dict[str, AccountResult]) -> None:
+        """
+        Write the account results of uid, replacing any earlier write for the same UID.
+
+        Raises:
+            OSError, pickle.PicklingError: If the results could not be written
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(account_results, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._file(uid))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def load(self, uid: int) -> Dict[str, AccountResult]:
+        """Read back the account results of uid."""
+        with open(self._file(uid), "rb") as f:
+            return pickle.load(f)
+
+    def _file(self, uid: int) -> str:
+        return os.path.join(self.path, f"{int(uid)}.pkl")
+
+    def _remove_previous_runs(self) -> None:
+        if not os.path.isdir(self.root):
+            return
+        for entry in os.listdir(self.root):
+            if entry != self.run_id:
+                shutil.rmtree(os.path.join(self.root, entry), ignore_errors=True)
+                bt.logging.debug(f"Removed spilled results of previous run {entry}")
@@ -0,0 +1,89 @@
+"""
+In-process request coalescing ("singleflight").
+
+When several threads ask for the same expensive result at the same time, only
+the first one (the leader) runs the call; the others wait for it and receive the
+same result or exception. Keys are request digests, so identical LLM prompts or
+transcript fetches issued concurrently by different accounts or miners share a
+single outbound request and a single cache write.
+"""
+
+import hashlib
+from threading import Event, Lock
+from typing import Any, Callable, Dict
+
+import bittensor as bt
+
+
+def request_digest(*parts: Any) -> str:
+    """Build a stable digest for a request from its identifying parts."""
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(str(part).encode("utf-8"))
+        hasher.update(b"\x00")
+    return hasher.hexdigest()
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one execution."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable, *args, **kwargs):
+        """
+        Run fn(*args, **kwargs) unless an identical call is already in flight.
+
+        Returns:
+            The result of the (possibly shared) call; its exception is re-raised to every waiter
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            bt.logging.debug(f"Coalesced {self.name} request {key[:12]} with in-flight call")
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Return executed and coalesced call counts."""
+        with self._lock:
+            return {"executed": self.executed, "coalesced": self.coalesced}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.executed = 0
+            self.coalesced = 0
@@ -1,18 +1,28 @@
 import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Event, Lock, Thread
+from typing import Optional
+
 import requests
 import bittensor as bt
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from bitcast.utils.misc import ttl_cache
+from bitcast.validator.utils.config import PRICING_MAX_AGE, PRICING_REFRESH_INTERVAL
 
 
-def get_subnet_mech_emission_ratio(netuid: int = 93, mechid: int = None, fallback: float = 0.85) -> float:
+def get_subnet_mech_emission_ratio(
+    netuid: int = 93, mechid: int = None, fallback: float = 0.85, subtensor: "bt.Subtensor" = None
+) -> float:
     """Retrieve subnet mechanism emission ratio from chain, with fallback on error."""
     if mechid is None:
         mechid = int(os.getenv('MECHID', '0'))
     
     try:
-        subtensor = bt.Subtensor(network="finney")
+        subtensor = subtensor or bt.Subtensor(network="finney")
         emission_split = subtensor.get_mechanism_emission_split(netuid=netuid)
         
         if emission_split and len(emission_split) > mechid and sum(emission_split) > 0:
@@ -26,13 +36,12 @@ def get_subnet_mech_emission_ratio(netuid: int = 93, mechid: int = None, fallbac
     return fallback
 
 
-@ttl_cache(ttl=600)  # 10 minutes TTL
 @retry(
     stop=stop_after_attempt(5),
     wait=wait_exponential(multiplier=1, min=1, max=10),
     retry=retry_if_exception_type((requests.exceptions.RequestException, KeyError))
 )
-def get_bitcast_alpha_price() -> float:
+def fetch_bitcast_alpha_price() -> float:
     """
     Get the current BitCast price in USD from CoinGecko API.
     
@@ -67,23 +76,199 @@ def get_bitcast_alpha_price() -> float:
 
 
 @ttl_cache(ttl=600)  # 10 minutes TTL
+def get_bitcast_alpha_price() -> float:
+    """Cached fetch_bitcast_alpha_price."""
+    return fetch_bitcast_alpha_price()
+
+
 @retry(
     stop=stop_after_attempt(5),
     wait=wait_exponential(multiplier=1, min=1, max=10),
     retry=retry_if_exception_type((Exception,))
 )
-def get_total_miner_emissions() -> float:
-    """Get daily miner emissions for subnet 93."""
-    subtensor = bt.Subtensor(network="finney")
+def fetch_total_miner_emissions(subtensor: "bt.Subtensor" = None) -> float:
+    """Get daily miner emissions for subnet 93, using subtensor if given instead of a new connection."""
+    subtensor = subtensor or bt.Subtensor(network="finney")
     subnet_info = subtensor.subnet(netuid=93)
     daily_alpha_emission = 7200 * float(subnet_info.alpha_out_emission)
 
     # miner share (41%) * subnet mech emission ratio
-    emission_ratio = get_subnet_mech_emission_ratio(netuid=93)
+    emission_ratio = get_subnet_mech_emission_ratio(netuid=93, subtensor=subtensor)
     miner_daily = daily_alpha_emission * 0.41 * emission_ratio
 
     if not isinstance(miner_daily, (int, float)) or miner_daily < 0:
         raise ValueError(f"Invalid miner emissions value: {miner_daily}")
 
     return float(miner_daily)
-    
\ No newline at end of file
+
+
+@ttl_cache(ttl=600)  # 10 minutes TTL
+def get_total_miner_emissions(subtensor: "bt.Subtensor" = None) -> float:
+    """Cached fetch_total_miner_emissions."""
+    return fetch_total_miner_emissions(subtensor)
+
+
+@dataclass(frozen=True)
+class PricingSnapshot:
+    """Alpha price and miner emissions used for every conversion in one validation cycle."""
+    alpha_price_usd: float
+    total_daily_alpha: float
+    taken_at: datetime
+
+    @property
+    def total_daily_usd(self) -> float:
+        return self.alpha_price_usd * self.total_daily_alpha
+
+
+class PricingProvider(ABC):
+    """Source of pricing snapshots; swap in a fake to keep tests off the network and chain."""
+
+    @abstractmethod
+    def get_snapshot(self) -> PricingSnapshot:
+        """Take a fresh snapshot. May raise on network or chain errors."""
+
+
+class ChainPricingProvider(PricingProvider):
+    """
+    CoinGecko alpha price and on-chain miner emissions over one long-lived subtensor connection.
+
+    Snapshots use the uncached fetch functions, so every refresh reaches CoinGecko and
+    the chain. The connection is dropped after a
+    failed snapshot and reopened on the next one.
+    """
+
+    def __init__(self, subtensor: "bt.Subtensor" = None, network: str = "finney"):
+        self._subtensor = subtensor
+        self._network = network
+
+    def _get_subtensor(self) -> "bt.Subtensor":
+        if self._subtensor is None:
+            self._subtensor = bt.Subtensor(network=self._network)
+        return self._subtensor
+
+    def _drop_subtensor(self) -> None:
+        subtensor, self._subtensor = self._subtensor, None
+        if subtensor is not None:
+            try:
+                subtensor.close()
+            except Exception:
+                pass
+
+    def get_snapshot(self) -> PricingSnapshot:
+        try:
+            return PricingSnapshot(
+                alpha_price_usd=fetch_bitcast_alpha_price(),
+                total_daily_alpha=fetch_total_miner_emissions(self._get_subtensor()),
+                taken_at=datetime.now(),
+            )
+        except Exception:
+            self._drop_subtensor()
+            raise
+
+
+class StaticPricingProvider(PricingProvider):
+    """Fixed pricing, for tests and offline runs."""
+
+    def __init__(self, alpha_price_usd: float, total_daily_alpha: float):
+        self.alpha_price_usd = alpha_price_usd
+        self.total_daily_alpha = total_daily_alpha
+
+    def get_snapshot(self) -> PricingSnapshot:
+        return PricingSnapshot(self.alpha_price_usd, self.total_daily_alpha, datetime.now())
+
+
+class PricingSnapshotService:
+    """
+    Holds the latest good pricing snapshot, optionally refreshed from a daemon thread.
+
+    RewardOrchestrator takes one snapshot per cycle and freezes it in the CycleContext,
+    from the background refresher when one runs and synchronously otherwise,
+    so scoring and emission conversion never open chain connections or wait on
+    CoinGecko mid-cycle. A failed refresh keeps serving the previous snapshot for up
+    to max_age seconds; after that a synchronous refresh is attempted, and if it also
+    fails no snapshot is served.
+    """
+
+    def __init__(self, provider: PricingProvider, refresh_interval: float = PRICING_REFRESH_INTERVAL,
+                 max_age: float = PRICING_MAX_AGE):
+        self.provider = provider
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self._lock = Lock()
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+        self._snapshot: Optional[PricingSnapshot] = None
+        self._refreshed_at: Optional[float] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run, name="pricing-refresher", daemon=True)
+        self._thread.start()
+        bt.logging.info(f"Pricing refresher started (every {self.refresh_interval}s)")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self.refresh()
+            self._stop_event.wait(self.refresh_interval)
+
+    def refresh(self) -> bool:
+        """Take a new snapshot from the provider. Returns False and keeps the old one on failure."""
+        try:
+            snapshot = self.provider.get_snapshot()
+        except Exception as e:
+            bt.logging.warning(f"Pricing refresh failed, keeping previous snapshot: {e}")
+            return False
+        with self._lock:
+            self._snapshot = snapshot
+            self._refreshed_at = time.monotonic()
+        return True
+
+    def get_snapshot(self) -> Optional[PricingSnapshot]:
+        """
+        Latest snapshot, taken synchronously if none exists yet or it is older than max_age.
+
+        Returns None if pricing is unavailable or only a snapshot older than max_age exists.
+        """
+        age = self.snapshot_age()
+        if age is None or age > self.max_age:
+            if not self.refresh() and age is not None:
+                bt.logging.error(f"Pricing snapshot is {age}s old (max {self.max_age}s) and refresh failed")
+                return None
+        return self._snapshot
+
+    def snapshot_age(self) -> Optional[float]:
+        """Seconds since the last successful refresh, None if never."""
+        refreshed_at = self._refreshed_at
+        return None if refreshed_at is None else round(time.monotonic() - refreshed_at, 1)
+
+
+_pricing_service: Optional[PricingSnapshotService] = None
+
+
+def start_pricing_refresher(provider: PricingProvider = None) -> PricingSnapshotService:
+    """Start the process-wide background pricing refresher (idempotent)."""
+    global _pricing_service
+    if _pricing_service is None:
+        _pricing_service = PricingSnapshotService(provider or ChainPricingProvider())
+    _pricing_service.start()
+    return _pricing_service
+
+
+def stop_pricing_refresher() -> None:
+    global _pricing_service
+    if _pricing_service is not None:
+        _pricing_service.stop()
+        _pricing_service = None
+
+
+def get_pricing_service() -> Optional[PricingSnapshotService]:
+    """Return the running pricing service, or None when pricing is fetched on demand."""
+    return _pricing_service
@@ -7,7 +7,11 @@ import random
 
 from bitcast.base.validator import BaseValidatorNeuron
 from bitcast.validator import forward
-from bitcast.validator.utils.config import __version__, WANDB_PROJECT
+from bitcast.validator.utils.briefs import start_briefs_refresher
+from bitcast.validator.utils.config import (
+    __version__, WANDB_PROJECT, BRIEFS_BACKGROUND_REFRESH, PRICING_BACKGROUND_REFRESH
+)
+from bitcast.validator.utils.token_pricing import start_pricing_refresher
 from bitcast.utils.cloudwatch_logging import get_cloudwatch_handler
 from core.auto_update import run_auto_update
 
@@ -50,6 +54,12 @@ class Validator(BaseValidatorNeuron):
         bt.logging.info("load_state()")
         self.load_state()
 
+        # Keep briefs fresh off the critical path of each validation cycle
+        if BRIEFS_BACKGROUND_REFRESH:
+            start_briefs_refresher()
+        if PRICING_BACKGROUND_REFRESH:
+            start_pricing_refresher()
+
     async def forward(self):
         """
         Validator forward pass. Consists of:
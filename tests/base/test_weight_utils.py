@@ -0,0 +1,195 @@
+"""
+Property tests: vectorized weight_utils against the previous per-UID implementations.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from bitcast.base.utils.weight_utils import (
+    U16_MAX,
+    convert_weights_and_uids_for_emit,
+    normalize_max_weight,
+    process_weights_for_netuid,
+)
+
+
+def legacy_normalize_max_weight(x, limit=0.1):
+    epsilon = 1e-7
+    weights = x.copy()
+    values = np.sort(weights)
+    if x.sum() == 0 or len(x) * limit <= 1:
+        return np.ones_like(x) / x.size
+    estimation = values / values.sum()
+    if estimation.max() <= limit:
+        return weights / weights.sum()
+    cumsum = np.cumsum(estimation, 0)
+    estimation_sum = np.array(
+        [(len(values) - i - 1) * estimation[i] for i in range(len(values))]
+    )
+    n_values = (estimation / (estimation_sum + cumsum + epsilon) < limit).sum()
+    cutoff_scale = (limit * cumsum[n_values - 1] - epsilon) / (
+        1 - (limit * (len(estimation) - n_values))
+    )
+    cutoff = cutoff_scale * values.sum()
+    weights[weights > cutoff] = cutoff
+    return weights / weights.sum()
+
+
+def legacy_convert_weights_and_uids_for_emit(uids, weights):
+    uids = np.asarray(uids)
+    weights = np.asarray(weights)
+    if np.min(weights) < 0:
+        raise ValueError("negative weight")
+    if np.min(uids) < 0:
+        raise ValueError("negative uid")
+    if len(uids) != len(weights):
+        raise ValueError("length mismatch")
+    if np.sum(weights) == 0:
+        return [], []
+    max_weight = float(np.max(weights))
+    weights = [float(value) / max_weight for value in weights]
+    weight_vals = []
+    weight_uids = []
+    for weight_i, uid_i in zip(weights, uids):
+        uint16_val = round(float(weight_i) * int(U16_MAX))
+        if uint16_val != 0:
+            weight_vals.append(uint16_val)
+            weight_uids.append(uid_i)
+    return weight_uids, weight_vals
+
+
+def _random_weights(rng, n, dtype):
+    """Weights with zeros, ties and a few outliers."""
+    weights = rng.random(n)
+    weights[rng.random(n) < 0.3] = 0.0
+    weights[rng.random(n) < 0.2] = 0.5
+    weights[rng.integers(0, n, size=max(1, n // 50))] *= 1000.0
+    return weights.astype(dtype)
+
+
+EDGE_CASES = [
+    np.zeros(8),
+    np.ones(8),
+    np.array([1.0]),
+    np.array([0.0, 0.0, 3.0]),
+    np.array([5.0, 5.0, 5.0, 1.0, 0.0]),
+    np.array([1e-12, 1.0, 1e12]),
+    np.arange(20, dtype=np.float64),
+]
+
+
+def _assert_same_array(actual, expected):
+    assert actual.dtype == expected.dtype
+    np.testing.assert_array_equal(actual, expected)
+
+
+class TestNormalizeMaxWeight:
+
+    @pytest.mark.parametrize("weights", EDGE_CASES)
+    @pytest.mark.parametrize("limit", [0.05, 0.1, 0.5, 1.0])
+    def test_edge_cases_match_legacy(self, weights, limit):
+        _assert_same_array(normalize_max_weight(weights, limit), legacy_normalize_max_weight(weights, limit))
+
+    @pytest.mark.parametrize("seed", range(20))
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_random_weights_match_legacy(self, seed, dtype):
+        rng = np.random.default_rng(seed)
+        n = int(rng.integers(2, 4096))
+        weights = _random_weights(rng, n, dtype)
+        limit = float(rng.choice([1.0 / n, 2.0 / n, 0.01, 0.1, 0.5]))
+        _assert_same_array(normalize_max_weight(weights, limit), legacy_normalize_max_weight(weights, limit))
+
+
+class TestConvertWeightsAndUidsForEmit:
+
+    @pytest.mark.parametrize("weights", EDGE_CASES)
+    def test_edge_cases_match_legacy(self, weights):
+        uids = np.arange(len(weights))
+        assert convert_weights_and_uids_for_emit(uids, weights) == \
+            legacy_convert_weights_and_uids_for_emit(uids, weights)
+
+    @pytest.mark.parametrize("seed", range(20))
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_random_weights_match_legacy(self, seed, dtype):
+        rng = np.random.default_rng(seed)
+        n = int(rng.integers(1, 4096))
+        weights = _random_weights(rng, n, dtype)
+        uids = rng.permutation(n)
+        weight_uids, weight_vals = convert_weights_and_uids_for_emit(uids, weights)
+        legacy_uids, legacy_vals = legacy_convert_weights_and_uids_for_emit(uids, weights)
+        assert weight_uids == legacy_uids
+        assert weight_vals == legacy_vals
+        assert all(type(val) is int for val in weight_vals)
+
+    def test_rounds_half_to_even(self):
+        # 0.5 / 65535 and 1.5 / 65535 of the max land exactly on .5 after upscaling
+        weights = np.array([0.5, 1.5, 2.5, float(U16_MAX)])
+        assert convert_weights_and_uids_for_emit(np.arange(4), weights) == \
+            legacy_convert_weights_and_uids_for_emit(np.arange(4), weights)
+
+    @pytest.mark.parametrize("uids, weights", [
+        (np.arange(3), np.array([0.1, -0.1, 0.2])),
+        (np.array([0, -1, 2]), np.array([0.1, 0.1, 0.2])),
+        (np.arange(2), np.array([np.inf, 1.0])),
+    ])
+    def test_invalid_input_raises(self, uids, weights):
+        with pytest.raises(ValueError):
+            convert_weights_and_uids_for_emit(uids, weights)
+
+
+def _legacy_process_weights(uids, weights, subtensor, metagraph, exclude_quantile=0):
+    """process_weights_for_netuid with legacy_normalize_max_weight, for comparison."""
+    weights = weights.astype(np.float32)
+    quantile = exclude_quantile / U16_MAX
+    min_allowed_weights = subtensor.min_allowed_weights(netuid=1)
+    max_weight_limit = subtensor.max_weight_limit(netuid=1)
+    non_zero_weight_idx = np.atleast_1d(np.argwhere(weights > 0).squeeze())
+    non_zero_weight_uids = uids[non_zero_weight_idx]
+    non_zero_weights = weights[non_zero_weight_idx]
+    if non_zero_weights.size == 0 or metagraph.n < min_allowed_weights:
+        final_weights = np.ones(metagraph.n) / metagraph.n
+        return np.arange(len(final_weights)), final_weights
+    elif non_zero_weights.size < min_allowed_weights:
+        weights = np.ones(metagraph.n) * 1e-5
+        weights[non_zero_weight_idx] += non_zero_weights
+        normalized_weights = legacy_normalize_max_weight(x=weights, limit=max_weight_limit)
+        return np.arange(len(normalized_weights)), normalized_weights
+    max_exclude = max(0, len(non_zero_weights) - min_allowed_weights) / len(non_zero_weights)
+    lowest_quantile = np.quantile(non_zero_weights, min([quantile, max_exclude]))
+    non_zero_weight_uids = non_zero_weight_uids[lowest_quantile <= non_zero_weights]
+    non_zero_weights = non_zero_weights[lowest_quantile <= non_zero_weights]
+    return non_zero_weight_uids, legacy_normalize_max_weight(x=non_zero_weights, limit=max_weight_limit)
+
+
+class TestProcessWeightsForNetuid:
+
+    @pytest.mark.parametrize("seed", range(10))
+    @pytest.mark.parametrize("min_allowed_weights", [1, 8, 5000])
+    def test_matches_legacy_pipeline(self, seed, min_allowed_weights):
+        rng = np.random.default_rng(seed)
+        n = int(rng.choice([256, 1024, 4096]))
+        weights = _random_weights(rng, n, np.float64)
+        if seed == 0:
+            weights[:] = 0.0
+        limit = float(rng.choice([0.05, 0.1, 1.0]))
+        exclude_quantile = int(rng.integers(0, U16_MAX // 4))
+        subtensor = SimpleNamespace(
+            min_allowed_weights=lambda netuid: min_allowed_weights,
+            max_weight_limit=lambda netuid: limit,
+        )
+        metagraph = SimpleNamespace(n=n)
+        uids = np.arange(n)
+
+        processed_uids, processed_weights = process_weights_for_netuid(
+            uids=uids, weights=weights, netuid=1, subtensor=subtensor, metagraph=metagraph,
+            exclude_quantile=exclude_quantile,
+        )
+        legacy_uids, legacy_weights = _legacy_process_weights(
+            uids, weights, subtensor, metagraph, exclude_quantile
+        )
+        np.testing.assert_array_equal(processed_uids, legacy_uids)
+        _assert_same_array(processed_weights, legacy_weights)
+        assert convert_weights_and_uids_for_emit(processed_uids, processed_weights) == \
+            legacy_convert_weights_and_uids_for_emit(legacy_uids, legacy_weights)
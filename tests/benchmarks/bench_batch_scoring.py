@@ -0,0 +1,54 @@
+"""
+Micro-benchmark: per-video vs. batch curve scoring of one account.
+
+Run with: python -m tests.benchmarks.bench_batch_scoring
+"""
+import random
+import timeit
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from bitcast.validator.platforms.youtube.evaluation.curve_based_scoring import (
+    calculate_curve_based_score,
+    calculate_curve_based_scores_batch,
+)
+
+MEDIAN_TARGET = 'bitcast.validator.platforms.youtube.evaluation.proportional_scaling.calculate_median_from_analytics'
+REPEAT = 10
+
+
+def _analytics(rng, days):
+    today = datetime.now()
+    return [
+        {
+            "day": (today - timedelta(days=offset)).strftime('%Y-%m-%d'),
+            "estimatedRedPartnerRevenue": rng.uniform(0, 20),
+            "estimatedMinutesWatched": rng.randint(0, 5000),
+        }
+        for offset in range(days, -1, -1)
+        if rng.random() > 0.1
+    ]
+
+
+def main():
+    rng = random.Random(0)
+    channel_analytics = {"ypp": True}
+    print(f"{'videos':>7} {'per-video (ms)':>15} {'batch (ms)':>11} {'speedup':>8}")
+    with patch(MEDIAN_TARGET, return_value=5.0), patch('bittensor.logging.info'):
+        for count in (10, 50, 200):
+            analytics_list = [_analytics(rng, rng.randint(14, 365)) for _ in range(count)]
+
+            def per_video():
+                return [calculate_curve_based_score(a, "", "", True, channel_analytics) for a in analytics_list]
+
+            def batch():
+                return calculate_curve_based_scores_batch(analytics_list, True, channel_analytics)
+
+            assert per_video() == batch()
+            per_video_ms = timeit.timeit(per_video, number=REPEAT) / REPEAT * 1e3
+            batch_ms = timeit.timeit(batch, number=REPEAT) / REPEAT * 1e3
+            print(f"{count:>7} {per_video_ms:>15.2f} {batch_ms:>11.2f} {per_video_ms / batch_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Micro-benchmark: per-brief unique identifier checks vs. the shared identifier index.
+
+Run with: python -m tests.benchmarks.bench_identifier_index
+"""
+import random
+import string
+import timeit
+
+from bitcast.validator.platforms.youtube.evaluation.video.brief_matching import check_brief_unique_identifier
+from bitcast.validator.platforms.youtube.evaluation.video.identifier_index import get_brief_identifier_index
+
+REPEAT = 200
+
+
+def _description(rng, words=900):
+    return " ".join("".join(rng.choices(string.ascii_letters, k=rng.randint(2, 9))) for _ in range(words))
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'briefs':>8} {'desc chars':>11} {'per-brief (us)':>15} {'index (us)':>11} {'automaton':>10}")
+    for brief_count in (5, 20, 50, 100, 200, 500):
+        briefs = [
+            {"id": f"brief{i}", "unique_identifier": "".join(rng.choices(string.ascii_uppercase, k=6))}
+            for i in range(brief_count)
+        ]
+        description = _description(rng) + " " + briefs[0]["unique_identifier"].lower()
+
+        def per_brief():
+            return [check_brief_unique_identifier(brief, description) for brief in briefs]
+
+        def indexed():
+            return get_brief_identifier_index(briefs).match(description)
+
+        assert {i for i, ok in enumerate(per_brief()) if ok} == indexed()
+        legacy = timeit.timeit(per_brief, number=REPEAT) / REPEAT * 1e6
+        index = timeit.timeit(indexed, number=REPEAT) / REPEAT * 1e6
+        print(
+            f"{brief_count:>8} {len(description):>11} {legacy:>15.1f} {index:>11.1f} "
+            f"{str(get_brief_identifier_index(briefs).uses_automaton):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
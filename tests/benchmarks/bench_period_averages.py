@@ -0,0 +1,54 @@
+"""
+Micro-benchmark: row-wise vs. columnar get_period_averages.
+
+Run with: python -m tests.benchmarks.bench_period_averages
+"""
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from bitcast.validator.platforms.youtube.evaluation.data_processing import (
+    _get_period_averages_rowwise,
+    get_period_averages,
+)
+
+METRIC = "estimatedRedPartnerRevenue"
+REPEAT = 50
+
+
+def _analytics(rng, base, days):
+    return [
+        {
+            "day": (base + timedelta(days=offset)).strftime('%Y-%m-%d'),
+            METRIC: rng.uniform(0, 20),
+            "estimatedMinutesWatched": rng.randint(0, 5000),
+            "views": rng.randint(0, 1000),
+        }
+        for offset in range(days)
+        if rng.random() > 0.1
+    ]
+
+
+def main():
+    rng = random.Random(0)
+    base = datetime(2023, 1, 1)
+    print(f"{'history days':>13} {'row-wise (us)':>14} {'columnar (us)':>14} {'speedup':>8}")
+    for days in (30, 90, 180, 365, 730):
+        analytics = _analytics(rng, base, days)
+        day2_end = base + timedelta(days=days - 3)
+        periods = [
+            (day2_end - timedelta(days=8)).strftime('%Y-%m-%d'),
+            (day2_end - timedelta(days=1)).strftime('%Y-%m-%d'),
+            (day2_end - timedelta(days=7)).strftime('%Y-%m-%d'),
+            day2_end.strftime('%Y-%m-%d'),
+        ]
+        args = (analytics, METRIC, *periods, 7, None, True)
+
+        assert get_period_averages(*args) == _get_period_averages_rowwise(*args)
+        rowwise = timeit.timeit(lambda: _get_period_averages_rowwise(*args), number=REPEAT) / REPEAT * 1e6
+        columnar = timeit.timeit(lambda: get_period_averages(*args), number=REPEAT) / REPEAT * 1e6
+        print(f"{days:>13} {rowwise:>14.1f} {columnar:>14.1f} {rowwise / columnar:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Micro-benchmark: copy-convert-serialize vs. single-pass serialization of an account posting payload.
+
+Run with: python -m tests.benchmarks.bench_posting_payload
+"""
+import copy
+import json
+import timeit
+import tracemalloc
+from types import SimpleNamespace
+
+import numpy as np
+
+from bitcast.validator.reward_engine.models.evaluation_result import AccountResult
+from bitcast.validator.utils.data_publisher import UnifiedDataPublisher, convert_numpy_types
+
+NUM_VIDEOS = 200
+DAYS = 90
+REPEAT = 5
+ROUNDS = 5
+
+
+def _account_result():
+    videos = {}
+    for video_idx in range(NUM_VIDEOS):
+        videos[f"yt_{video_idx}"] = {
+            "details": {"bitcastVideoId": f"b{video_idx}", "title": "title", "description": "d" * 2000,
+                        "transcript": "t" * 20000},
+            "analytics": {"day_metrics": {f"2025-01-{day % 28 + 1:02d}_{day}": {"views": np.int64(day), "minutes": np.float64(day * 1.5)}
+                                          for day in range(DAYS)}},
+            "brief_metrics": {"brief1": {"weight": np.float32(0.5), "usd_target": np.float64(12.5)}},
+            "decision_details": {"brief_reasonings": {"brief1": "r" * 1000}},
+        }
+    return AccountResult(account_id="account_1", platform_data={"channel_id": "UC1"}, videos=videos,
+                         scores={"brief1": np.float64(1.0)}, performance_stats={}, success=True)
+
+
+def _legacy(account_result, publisher):
+    """Previous path: deep copy, recursive NumPy conversion, signed dumps, then the HTTP client's dumps."""
+    cleaned_videos = copy.deepcopy(account_result.videos)
+    for video_data in cleaned_videos.values():
+        video_data["details"].pop("description", None)
+        video_data["details"].pop("transcript", None)
+        video_data["per_video_metrics"] = video_data["brief_metrics"]
+    data = {"payload_type": "youtube", "run_id": "run", "miner_uid": 1,
+            "payload": {"account_data": {"videos": cleaned_videos, "scores": account_result.scores.copy()},
+                        "account_id": "account_1"}}
+    converted = convert_numpy_types(data)
+    publisher.wallet.hotkey.sign(data=f"signer:time:{json.dumps(converted['payload'], sort_keys=True)}")
+    return json.dumps({**converted, "signature": "00"}).encode("utf-8")
+
+
+def _single_pass(account_result, publisher):
+    account_data = account_result.to_posting_payload()["account_data"]
+    data = {"payload_type": "youtube", "run_id": "run", "miner_uid": 1,
+            "payload": {"account_data": account_data, "account_id": "account_1"}}
+    return publisher._sign_message_bytes(data)
+
+
+def _peak_kib(fn):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    account_result = _account_result()
+    hotkey = SimpleNamespace(ss58_address="signer", sign=lambda data: b"\x00")
+    publisher = UnifiedDataPublisher(SimpleNamespace(hotkey=hotkey))
+
+    for name, fn in (("copy+convert", _legacy), ("single-pass", _single_pass)):
+        run = lambda: fn(account_result, publisher)
+        ms = min(timeit.repeat(run, number=ROUNDS, repeat=REPEAT)) / ROUNDS * 1e3
+        print(f"{name:>13}: {ms:8.1f} ms/account, peak {_peak_kib(run):9.0f} KiB, body {len(run()) / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
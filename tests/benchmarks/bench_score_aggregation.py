@@ -0,0 +1,68 @@
+"""
+Micro-benchmark: per-cell vs. triplet score aggregation at fleet sizes.
+
+Run with: python -m tests.benchmarks.bench_score_aggregation
+"""
+import random
+import timeit
+
+import numpy as np
+
+from bitcast.validator.reward_engine.models.evaluation_result import (
+    AccountResult,
+    EvaluationResult,
+    EvaluationResultCollection,
+)
+from bitcast.validator.reward_engine.models.score_matrix import ScoreMatrix
+from bitcast.validator.reward_engine.services.score_aggregation_service import ScoreAggregationService
+
+REPEAT = 5
+ROUNDS = 5
+
+
+def _results(rng, num_uids, num_briefs, num_accounts):
+    brief_ids = [f"brief{i}" for i in range(num_briefs)]
+    results = EvaluationResultCollection()
+    for uid in range(num_uids):
+        results.add_result(uid, EvaluationResult(uid=uid, platform="youtube"))
+    for account_idx in range(num_accounts):
+        result = results.results[rng.randrange(num_uids)]
+        result.add_account_result(f"account{account_idx}", AccountResult(
+            account_id=f"account{account_idx}",
+            platform_data={},
+            videos={},
+            scores={brief_id: rng.random() if rng.random() < 0.2 else 0.0 for brief_id in brief_ids},
+            performance_stats={},
+            success=True,
+        ))
+    return results, [{"id": brief_id} for brief_id in brief_ids]
+
+
+def _per_cell(results, briefs):
+    """The previous UID x brief x account loop."""
+    matrix = ScoreMatrix.create_empty(len(results.results), len(briefs))
+    for miner_idx, result in enumerate(results.results.values()):
+        for brief_idx, brief in enumerate(briefs):
+            total_score = 0.0
+            for account_data in result.account_results.values():
+                total_score += account_data.scores.get(brief["id"], 0.0)
+            matrix.set_score(miner_idx, brief_idx, total_score)
+    return matrix
+
+
+def main():
+    rng = random.Random(0)
+    service = ScoreAggregationService()
+    print(f"{'uids':>5} {'briefs':>7} {'accounts':>9} {'per-cell (ms)':>14} {'triplets (ms)':>14} {'speedup':>8}")
+    for num_uids, num_briefs, num_accounts in ((64, 10, 500), (256, 20, 2000), (256, 50, 8000)):
+        results, briefs = _results(rng, num_uids, num_briefs, num_accounts)
+
+        assert np.array_equal(_per_cell(results, briefs).matrix, service.aggregate_scores(results, briefs).matrix)
+        per_cell_ms = min(timeit.repeat(lambda: _per_cell(results, briefs), number=REPEAT, repeat=ROUNDS)) / REPEAT * 1e3
+        triplet_ms = min(timeit.repeat(lambda: service.aggregate_scores(results, briefs), number=REPEAT, repeat=ROUNDS)) / REPEAT * 1e3
+        print(f"{num_uids:>5} {num_briefs:>7} {num_accounts:>9} {per_cell_ms:>14.2f} {triplet_ms:>14.2f} "
+              f"{per_cell_ms / triplet_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Micro-benchmark: per-video dicts vs. slotted VideoRecords (memory and field access).
+
+Run with: python -m tests.benchmarks.bench_video_record
+"""
+import timeit
+import tracemalloc
+
+from bitcast.validator.platforms.youtube.evaluation.video.video_record import VideoRecord
+
+NUM_VIDEOS = 50_000
+REPEAT = 5
+
+
+def _fields(video_idx):
+    # Nested payloads are shared so only the per-video containers are measured
+    return dict(
+        details=_DETAILS, analytics=_ANALYTICS, matches_brief=True, matching_brief_ids=["brief1"],
+        url=f"https://www.youtube.com/watch?v={video_idx}", vet_outcomes=[True], decision_details={},
+    )
+
+
+_DETAILS = {"bitcastVideoId": "b", "publishedAt": "2025-01-01T00:00:00Z"}
+_ANALYTICS = {"views": 1}
+
+
+def _build(make):
+    videos = {}
+    for video_idx in range(NUM_VIDEOS):
+        video = make(**_fields(video_idx))
+        video["base_score"] = 1.0
+        video["scoring_method"] = "ypp"
+        video["brief_metrics"] = {}
+        video["usd_targets"] = {}
+        video["score"] = 1.0
+        videos[video_idx] = video
+    return videos
+
+
+def _peak_mib(make):
+    tracemalloc.start()
+    videos = _build(make)
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del videos
+    return current / 2**20
+
+
+def main():
+    dict_videos, record_videos = _build(dict), _build(VideoRecord)
+
+    def read_dict():
+        for video in dict_videos.values():
+            video["details"], video["score"], video["usd_targets"]
+
+    def read_record():
+        for video in record_videos.values():
+            video.details, video.score, video.usd_targets
+
+    def read_record_items():
+        for video in record_videos.values():
+            video["details"], video["score"], video["usd_targets"]
+
+    print(f"{NUM_VIDEOS} videos")
+    print(f"memory: dict {_peak_mib(dict):.1f} MiB, VideoRecord {_peak_mib(VideoRecord):.1f} MiB")
+    for name, fn in (("dict items", read_dict), ("record attributes", read_record),
+                     ("record items", read_record_items)):
+        ms = min(timeit.repeat(fn, number=1, repeat=REPEAT)) * 1e3
+        print(f"{name:>18}: {ms:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
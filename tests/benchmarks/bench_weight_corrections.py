@@ -0,0 +1,85 @@
+"""
+Micro-benchmark: per-pair vs. vectorized weight corrections on a synthetic 100k-video cycle.
+
+Run with: python -m tests.benchmarks.bench_weight_corrections
+"""
+import random
+import timeit
+
+import numpy as np
+
+from bitcast.validator.reward_engine.models.evaluation_result import (
+    AccountResult,
+    EvaluationResult,
+    EvaluationResultCollection,
+)
+from bitcast.validator.reward_engine.services.weight_corrections_service import WeightCorrectionsService
+
+NUM_UIDS = 256
+NUM_BRIEFS = 20
+NUM_VIDEOS = 100_000
+ACCOUNTS_PER_UID = 4
+REPEAT = 3
+
+
+def _cycle(rng):
+    briefs = [{"id": f"brief_{i}"} for i in range(NUM_BRIEFS)]
+    results = EvaluationResultCollection()
+    for uid in range(NUM_UIDS):
+        result = EvaluationResult(uid=uid, platform="youtube")
+        for account_idx in range(ACCOUNTS_PER_UID):
+            result.add_account_result(f"account_{account_idx}", AccountResult(
+                account_id=f"account_{account_idx}", platform_data={}, videos={}, scores={},
+                performance_stats={}, success=True,
+            ))
+        results.add_result(uid, result)
+
+    for video_idx in range(NUM_VIDEOS):
+        account = results.results[rng.randrange(NUM_UIDS)].account_results[f"account_{rng.randrange(ACCOUNTS_PER_UID)}"]
+        matched = rng.sample(range(NUM_BRIEFS), rng.choice((1, 1, 2)))
+        account.videos[f"yt_{video_idx}"] = {
+            "details": {"bitcastVideoId": f"bitcast_{video_idx}"},
+            "brief_metrics": {f"brief_{b}": {"weight": rng.random()} for b in matched},
+        }
+
+    pre = np.random.default_rng(0).random((NUM_UIDS, NUM_BRIEFS))
+    post = pre * np.random.default_rng(1).choice([0.0, 0.5, 1.0], size=pre.shape)
+    return results, pre, post, briefs
+
+
+def _per_pair(results, pre, post, briefs):
+    """The previous implementation: a scaling factor lookup per (video, brief) pair."""
+    service = WeightCorrectionsService()
+    brief_id_to_idx = {brief["id"]: idx for idx, brief in enumerate(briefs)}
+    corrections = []
+    for uid_idx, result in enumerate(results.results.values()):
+        for account in result.account_results.values():
+            for video_id, video_data in account.videos.items():
+                content_id = service._extract_content_id(video_data, video_id)
+                for brief_id in video_data.get("brief_metrics", {}):
+                    brief_idx = brief_id_to_idx[brief_id]
+                    pre_weight = float(pre[uid_idx, brief_idx])
+                    post_weight = float(post[uid_idx, brief_idx])
+                    factor = 0.0 if pre_weight == 0.0 else max(0.0, min(post_weight / pre_weight, 10.0))
+                    corrections.append({"content_id": content_id, "brief_id": brief_id, "scaling_factor": factor})
+    return corrections
+
+
+def main():
+    results, pre, post, briefs = _cycle(random.Random(0))
+    service = WeightCorrectionsService()
+
+    def vectorized():
+        return service.calculate_corrections(results, pre, post, briefs)
+
+    corrections = vectorized()
+    assert corrections == _per_pair(results, pre, post, briefs)
+    per_pair_ms = min(timeit.repeat(lambda: _per_pair(results, pre, post, briefs), number=1, repeat=REPEAT)) * 1e3
+    vectorized_ms = min(timeit.repeat(vectorized, number=1, repeat=REPEAT)) * 1e3
+    print(f"{NUM_VIDEOS} videos, {len(corrections)} corrections, {NUM_UIDS} UIDs x {NUM_BRIEFS} briefs")
+    print(f"per-pair:   {per_pair_ms:8.1f} ms")
+    print(f"vectorized: {vectorized_ms:8.1f} ms ({per_pair_ms / vectorized_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Micro-benchmark: per-UID vs. vectorized weight emission (normalize_max_weight and
+convert_weights_and_uids_for_emit) at 256/1024/4096 UIDs.
+
+Run with: python -m tests.benchmarks.bench_weight_utils
+"""
+import timeit
+
+import numpy as np
+
+from bitcast.base.utils.weight_utils import convert_weights_and_uids_for_emit, normalize_max_weight
+from tests.base.test_weight_utils import (
+    legacy_convert_weights_and_uids_for_emit,
+    legacy_normalize_max_weight,
+)
+
+UID_COUNTS = (256, 1024, 4096)
+LIMIT = 0.005  # low enough that the cap binds at every fleet size
+REPEAT = 5
+ROUNDS = 20
+
+
+def _weights(num_uids):
+    rng = np.random.default_rng(num_uids)
+    weights = rng.random(num_uids).astype(np.float32)
+    weights[rng.random(num_uids) < 0.3] = 0.0
+    weights[rng.integers(0, num_uids, size=num_uids // 50)] *= 1000.0
+    return weights
+
+
+def _time_ms(fn):
+    return min(timeit.repeat(fn, number=ROUNDS, repeat=REPEAT)) / ROUNDS * 1e3
+
+
+def main():
+    print(f"{'uids':>6} {'stage':>10} {'per-uid ms':>12} {'vectorized ms':>14} {'speedup':>8}")
+    for num_uids in UID_COUNTS:
+        weights = _weights(num_uids)
+        uids = np.arange(num_uids)
+        normalized = normalize_max_weight(weights, LIMIT)
+        assert np.array_equal(normalized, legacy_normalize_max_weight(weights, LIMIT))
+        assert convert_weights_and_uids_for_emit(uids, normalized) == \
+            legacy_convert_weights_and_uids_for_emit(uids, normalized)
+
+        stages = (
+            ("normalize", lambda: legacy_normalize_max_weight(weights, LIMIT),
+             lambda: normalize_max_weight(weights, LIMIT)),
+            ("emit", lambda: legacy_convert_weights_and_uids_for_emit(uids, normalized),
+             lambda: convert_weights_and_uids_for_emit(uids, normalized)),
+        )
+        for stage, legacy, vectorized in stages:
+            legacy_ms = _time_ms(legacy)
+            vectorized_ms = _time_ms(vectorized)
+            print(f"{num_uids:>6} {stage:>10} {legacy_ms:>12.3f} {vectorized_ms:>14.3f} "
+                  f"{legacy_ms / vectorized_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
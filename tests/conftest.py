@@ -6,9 +6,23 @@ slow network requests during testing.
 """
 
 import pytest
+from datetime import datetime
 from unittest.mock import patch, Mock
 import numpy as np
 
+from bitcast.validator.utils import token_pricing
+
+
+class _MockPricingProvider(token_pricing.PricingProvider):
+    """Per-cycle pricing snapshot built from the (mocked) pricing functions."""
+
+    def get_snapshot(self):
+        return token_pricing.PricingSnapshot(
+            alpha_price_usd=token_pricing.get_bitcast_alpha_price(),
+            total_daily_alpha=token_pricing.get_total_miner_emissions(),
+            taken_at=datetime.now(),
+        )
+
 
 @pytest.fixture(autouse=True)
 def mock_external_apis():
@@ -19,6 +33,7 @@ def mock_external_apis():
     with patch('bitcast.validator.utils.briefs.get_briefs') as mock_briefs, \
          patch('bitcast.validator.utils.token_pricing.get_bitcast_alpha_price') as mock_price, \
          patch('bitcast.validator.utils.token_pricing.get_total_miner_emissions') as mock_emissions, \
+         patch('bitcast.validator.reward_engine.orchestrator.ChainPricingProvider', _MockPricingProvider), \
          patch('bitcast.validator.clients.llm_client.evaluate_content_against_brief') as mock_llm_eval, \
          patch('bitcast.validator.clients.llm_client.check_for_prompt_injection') as mock_llm_inject, \
          patch('bitcast.validator.platforms.youtube.api.transcript._fetch_transcript') as mock_transcript, \
@@ -0,0 +1,78 @@
+"""
+Tests for the slotted per-video record.
+"""
+
+import json
+import pickle
+import sys
+
+import numpy as np
+import pytest
+
+from bitcast.validator.platforms.youtube.evaluation.video.video_record import VideoRecord
+from bitcast.validator.reward_engine.models.evaluation_result import AccountResult
+from bitcast.validator.utils.data_publisher import canonical_json, convert_numpy_types
+
+
+def _fields():
+    return {
+        "details": {"bitcastVideoId": "b1", "publishedAt": "2025-01-01T00:00:00Z", "transcript": "text"},
+        "analytics": {"views": 10},
+        "matches_brief": True,
+        "matching_brief_ids": ["brief1"],
+        "url": "https://www.youtube.com/watch?v=v1",
+        "vet_outcomes": [True],
+        "decision_details": {"video_vet_result": True},
+    }
+
+
+class TestVideoRecord:
+
+    def test_behaves_like_the_dict_it_replaces(self):
+        expected = _fields()
+        record = VideoRecord(**_fields())
+        assert record == expected
+        assert "score" not in record and record.get("score") is None
+        with pytest.raises(KeyError):
+            record["score"]
+
+        record["brief_metrics"] = {"brief1": {"usd_target": 1.0}}
+        record["score"] = 1.0
+        expected.update(brief_metrics={"brief1": {"usd_target": 1.0}}, score=1.0)
+        assert record == expected
+        assert record.score == 1.0
+        assert list(record) == list(expected)
+        assert record.to_dict() == expected and type(record.to_dict()) is dict
+
+        del record["score"]
+        assert "score" not in record and len(record) == len(expected) - 1
+
+    def test_unknown_keys_are_kept(self):
+        record = VideoRecord(**_fields(), custom_flag=True)
+        record["another"] = 1
+        assert record["custom_flag"] is True
+        assert record.to_dict() == {**_fields(), "custom_flag": True, "another": 1}
+
+    def test_pickle_round_trip(self):
+        record = VideoRecord(**_fields(), score=0.5, extra="x")
+        restored = pickle.loads(pickle.dumps(record))
+        assert restored == record
+        assert restored.score == 0.5 and restored["extra"] == "x"
+
+    def test_smaller_than_dict(self):
+        fields = {**_fields(), "base_score": 1.0, "scoring_method": "ypp", "brief_metrics": {},
+                  "usd_targets": {}, "score": 1.0}
+        assert sys.getsizeof(VideoRecord(**fields)) < sys.getsizeof(dict(fields))
+
+    def test_publishing_exports_plain_dicts(self):
+        record = VideoRecord(**_fields(), brief_metrics={"brief1": {"weight": np.float32(0.5)}})
+        account_result = AccountResult(
+            account_id="a1", platform_data={}, videos={"v1": record},
+            scores={}, performance_stats={}, success=True
+        )
+        cleaned = account_result.to_posting_payload()["account_data"]["videos"]["v1"]
+        assert type(cleaned) is dict
+        assert "transcript" not in cleaned["details"]
+        assert cleaned["per_video_metrics"] == record.brief_metrics
+
+        assert json.loads(canonical_json({"v1": record})) == json.loads(json.dumps(convert_numpy_types({"v1": record})))
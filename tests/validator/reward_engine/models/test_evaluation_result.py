@@ -231,4 +231,27 @@ class TestAccountResultBasicPosting:
         assert "videos" in account_data  
         assert "scores" in account_data
         assert "performance_stats" in account_data
-        assert account_data["success"] is True 
\ No newline at end of file
+        assert account_data["success"] is True     
+    def test_to_posting_payload_strips_without_mutating(self):
+        """Posting payload strips heavy fields and mirrors brief metrics, leaving the videos untouched."""
+        videos = {
+            "video1": {
+                "details": {"bitcastVideoId": "b1", "description": "long text", "transcript": "longer text"},
+                "brief_metrics": {"brief1": {"weight": 0.5}},
+                "decision_details": {"brief_reasonings": {"brief1": "reasoning"}},
+            },
+            "video2": "not a dict",
+        }
+        account_result = AccountResult(
+            account_id="test_account", platform_data={}, videos=videos,
+            scores={}, performance_stats={}, success=True
+        )
+        
+        cleaned = account_result.to_posting_payload()["account_data"]["videos"]
+        
+        assert cleaned["video1"]["details"] == {"bitcastVideoId": "b1"}
+        assert cleaned["video1"]["per_video_metrics"] == {"brief1": {"weight": 0.5}}
+        assert cleaned["video1"]["decision_details"] == {"brief_reasonings": {"brief1": "reasoning"}}
+        assert cleaned["video2"] == "not a dict"
+        assert videos["video1"]["details"]["transcript"] == "longer text"
+        assert "per_video_metrics" not in videos["video1"]
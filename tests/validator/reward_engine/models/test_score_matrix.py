@@ -2,7 +2,8 @@
 
 import pytest
 import numpy as np
-from bitcast.validator.reward_engine.models.score_matrix import ScoreMatrix
+from bitcast.validator.reward_engine.models.emission_target import EmissionTarget
+from bitcast.validator.reward_engine.models.score_matrix import ScoreMatrix, column_sums
 
 
 class TestScoreMatrix:
@@ -99,4 +100,32 @@ class TestScoreMatrix:
         """Test string representation."""
         matrix = ScoreMatrix.create_empty(3, 2)
         repr_str = repr(matrix)
-        assert "ScoreMatrix(3×2)" in repr_str 
\ No newline at end of file
+        assert "ScoreMatrix(3×2)" in repr_str
+    
+    def test_from_triplets(self):
+        """Test building a matrix from triplets, summing duplicate cells."""
+        matrix = ScoreMatrix.from_triplets([0, 2, 0, 2], [1, 0, 1, 0], [0.1, 0.5, 0.2, 0.25], 3, 2)
+        
+        assert matrix.num_miners == 3
+        assert matrix.num_briefs == 2
+        assert matrix.get_score(0, 1) == 0.1 + 0.2
+        assert matrix.get_score(2, 0) == 0.75
+        assert matrix.get_score(1, 1) == 0.0
+    
+    def test_from_triplets_empty(self):
+        """Test building a matrix from no triplets."""
+        matrix = ScoreMatrix.from_triplets([], [], [], 2, 3)
+        assert matrix.matrix.shape == (2, 3)
+        assert not matrix.matrix.any()
+    
+    def test_column_sums_match_column_slices(self):
+        """Test column totals are bit-identical to summing each column slice."""
+        matrix = np.random.default_rng(3).random((513, 7)) * 1e3
+        assert column_sums(matrix).tolist() == [matrix[:, j].sum() for j in range(7)]
+    
+    def test_emission_target_serializes_weight_views(self):
+        """Test NumPy weight views are converted to lists only when serialized."""
+        weights = np.array([[0.1, 0.2], [0.3, 0.4]])
+        target = EmissionTarget(brief_id="b", usd_target=1.0, allocation_details={"per_miner_weights": weights[:, 1]})
+        assert target.to_dict()["allocation_details"]["per_miner_weights"] == [0.2, 0.4]
+
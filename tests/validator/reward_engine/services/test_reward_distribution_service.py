@@ -342,4 +342,37 @@ class TestRewardDistributionService:
             assert total_sum >= 0.5  # At least the capped amount
             
             # The implementation applies: caps first, then global minimum scaling
-            # which means caps can be violated by global minimum scaling 
\ No newline at end of file
+            # which means caps can be violated by global minimum scaling
+    
+    def test_vectorized_pipeline_matches_per_brief_loops(self):
+        """Test that NumPy caps, scaling and summation are bit-identical to the per-brief Python loops."""
+        rng = np.random.default_rng(11)
+        num_miners, num_briefs = 300, 12
+        weights = rng.random((num_miners, num_briefs)) * rng.choice([0.0, 1e-4, 1e-2], size=(num_miners, num_briefs))
+        briefs = [{"id": f"brief{i}", "cap": float(rng.choice([0.01, 0.05, 1.0]))} for i in range(num_briefs)]
+        uids = list(range(num_miners))
+        targets = [
+            EmissionTarget(brief_id=brief["id"], usd_target=0.0, allocation_details={"per_miner_weights": weights[:, i]})
+            for i, brief in enumerate(briefs)
+        ]
+        
+        # Previous implementation: per-brief caps and a Python sum for UID 0
+        expected = weights.copy()
+        for brief_idx, brief in enumerate(briefs):
+            brief_sum = expected[:, brief_idx].sum()
+            if brief_sum > brief["cap"]:
+                expected[:, brief_idx] *= brief["cap"] / brief_sum
+        total_sum = expected.sum()
+        if total_sum > 1.0:
+            expected = expected / total_sum
+        expected_rewards = expected.sum(axis=1)
+        expected_rewards[0] = max(1.0 - sum(expected_rewards[i] for i in range(1, num_miners)), 0.0)
+        
+        matrix = self.service._extract_raw_weights_matrix(targets, num_miners)
+        rewards, normalized, percentages = self.service._normalize_weights(matrix, briefs, uids)
+        
+        assert np.array_equal(matrix, weights)
+        assert np.array_equal(normalized, expected)
+        assert np.array_equal(rewards, expected_rewards)
+        assert [percentages[brief["id"]] for brief in briefs] == [expected[:, i].sum() for i in range(num_briefs)]
+
@@ -1,5 +1,7 @@
 """Unit tests for ScoreAggregationService."""
 
+import random
+
 import pytest
 from bitcast.validator.reward_engine.services.score_aggregation_service import ScoreAggregationService
 from bitcast.validator.reward_engine.models.evaluation_result import (
@@ -7,6 +9,14 @@ from bitcast.validator.reward_engine.models.evaluation_result import (
 )
 
 
+def _reference_brief_score(evaluation_result, brief_id):
+    """Per-cell reference: sum one brief's score over all accounts of a miner."""
+    total_score = 0.0
+    for account_data in evaluation_result.account_results.values():
+        total_score += account_data.scores.get(brief_id, 0.0)
+    return total_score
+
+
 class TestScoreAggregationService:
     """Test ScoreAggregationService class."""
     
@@ -101,8 +111,8 @@ class TestScoreAggregationService:
         assert (1.0, 0.5) in scores
         assert (0.3, 0.8) in scores
     
-    def test_aggregate_brief_scores(self):
-        """Test the _aggregate_brief_scores method."""
+    def test_aggregate_scores_sums_accounts(self):
+        """Test that a miner's brief score is the sum over its accounts."""
         # Create evaluation result with multiple accounts
         eval_result = EvaluationResult(uid=123, platform="youtube")
         
@@ -126,12 +136,12 @@ class TestScoreAggregationService:
         eval_result.add_account_result("account1", account1)
         eval_result.add_account_result("account2", account2)
         
-        # Test aggregation
-        total_brief1 = self.service._aggregate_brief_scores(eval_result, "brief1")
-        total_brief2 = self.service._aggregate_brief_scores(eval_result, "brief2")
+        results = EvaluationResultCollection()
+        results.add_result(123, eval_result)
+        score_matrix = self.service.aggregate_scores(results, self.briefs)
         
-        assert total_brief1 == 0.7  # 0.5 + 0.2
-        assert total_brief2 == 0.7  # 0.3 + 0.4
+        assert score_matrix.get_score(0, 0) == pytest.approx(0.7)  # 0.5 + 0.2
+        assert score_matrix.get_score(0, 1) == pytest.approx(0.7)  # 0.3 + 0.4
     
     def test_aggregate_scores_empty_results(self):
         """Test aggregating with empty results."""
@@ -139,4 +149,32 @@ class TestScoreAggregationService:
         score_matrix = self.service.aggregate_scores(results, self.briefs)
         
         assert score_matrix.num_miners == 0
-        assert score_matrix.num_briefs == 2 
\ No newline at end of file
+        assert score_matrix.num_briefs == 2
+    
+    def test_aggregate_scores_matches_per_cell_summation(self):
+        """Test that triplet aggregation equals summing each (miner, brief) cell over accounts."""
+        rng = random.Random(7)
+        briefs = [{"id": f"brief{i}"} for i in range(6)] + [{"id": "brief2"}]  # repeated id
+        results = EvaluationResultCollection()
+        for uid in rng.sample(range(1000), 40):
+            eval_result = EvaluationResult(uid=uid, platform="youtube")
+            for account_idx in range(rng.randint(0, 8)):
+                brief_ids = rng.sample([f"brief{i}" for i in range(8)], rng.randint(0, 8))  # brief6/7 unknown
+                eval_result.add_account_result(f"account{account_idx}", AccountResult(
+                    account_id=f"account{account_idx}",
+                    platform_data={},
+                    videos={},
+                    scores={brief_id: rng.choice([0, rng.random(), rng.uniform(0, 1e4)]) for brief_id in brief_ids},
+                    performance_stats={},
+                    success=True
+                ))
+            results.add_result(uid, eval_result)
+        
+        score_matrix = self.service.aggregate_scores(results, briefs)
+        
+        expected = [
+            [_reference_brief_score(result, brief["id"]) for brief in briefs]
+            for result in results.results.values()
+        ]
+        assert score_matrix.matrix.tolist() == expected
+
@@ -168,6 +168,51 @@ class TestWeightCorrectionsService:
         for correction in corrections:
             assert abs(correction["scaling_factor"] - 0.5) < 1e-6
     
+    def test_vectorized_factors_match_scalar_reference(self):
+        """Test gathered scaling factors equal the per-pair formula, in the same order."""
+        rng = np.random.default_rng(2)
+        num_miners, num_briefs = 30, 5
+        pre = rng.choice([0.0, 1e-9, 0.3, 2.0, np.nan, np.inf], size=(num_miners, num_briefs))
+        with np.errstate(invalid="ignore"):
+            post = pre * rng.choice([0.0, -1.0, 0.5, 1.0, 50.0], size=(num_miners, num_briefs))
+        post[0, 0] = np.nan
+        briefs = [{"id": f"brief_{i}"} for i in range(num_briefs + 1)]  # last brief outside the matrices
+        
+        evaluation_results = EvaluationResultCollection()
+        for uid in range(num_miners + 2):  # last UIDs outside the matrices
+            account_result = Mock()
+            account_result.videos = {
+                f"video_{uid}_{v}": {
+                    "details": {"bitcastVideoId": f"bitcast_{uid}_{v}"},
+                    "brief_metrics": {f"brief_{b}": {} for b in rng.choice(num_briefs + 2, size=2, replace=False)}
+                }
+                for v in range(3)
+            }
+            account_result.videos["not_a_video"] = None
+            eval_result = Mock()
+            eval_result.account_results = {"account": account_result}
+            evaluation_results.add_result(uid, eval_result)
+        
+        corrections = self.service.calculate_corrections(evaluation_results, pre, post, briefs)
+        
+        def reference(uid_idx, brief_idx):
+            if uid_idx >= num_miners or brief_idx >= num_briefs:
+                return 0.0
+            pre_weight, post_weight = float(pre[uid_idx, brief_idx]), float(post[uid_idx, brief_idx])
+            if pre_weight == 0.0:
+                return 0.0
+            return max(0.0, min(post_weight / pre_weight, 10.0))
+        
+        expected = [
+            {"content_id": video["details"]["bitcastVideoId"], "brief_id": brief_id,
+             "scaling_factor": reference(uid, int(brief_id.split("_")[1]))}
+            for uid, result in evaluation_results.results.items()
+            for video in result.account_results["account"].videos.values() if isinstance(video, dict)
+            for brief_id in video["brief_metrics"] if int(brief_id.split("_")[1]) <= num_briefs
+        ]
+        assert corrections == expected
+        assert all(type(c["scaling_factor"]) is float for c in corrections)
+    
     def _create_mock_evaluation_results(self):
         """Create mock evaluation results for testing."""
         evaluation_results = EvaluationResultCollection()
@@ -0,0 +1,194 @@
+"""
+Batch curve scoring must be identical to scoring each video on its own.
+"""
+import copy
+import random
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bitcast.validator.platforms.youtube.evaluation.curve_based_scoring import (
+    calculate_curve_based_score,
+    calculate_curve_based_scores_batch,
+)
+from bitcast.validator.platforms.youtube.evaluation.curve_scoring import (
+    calculate_adjusted_curve_difference,
+    calculate_adjusted_curve_differences,
+    calculate_curve_value,
+    calculate_curve_values,
+)
+from bitcast.validator.platforms.youtube.main import update_video_score, update_video_scores_batch
+
+MEDIAN_TARGET = 'bitcast.validator.platforms.youtube.evaluation.proportional_scaling.calculate_median_from_analytics'
+
+
+def _random_analytics(rng, days):
+    today = datetime.now()
+    analytics = []
+    for offset in range(days):
+        if rng.random() < 0.2:
+            continue
+        analytics.append({
+            "day": (today - timedelta(days=offset)).strftime('%Y-%m-%d'),
+            "estimatedRedPartnerRevenue": rng.choice([0.0, rng.uniform(0, 40), rng.randint(0, 300)]),
+            "estimatedMinutesWatched": rng.randint(0, 50000),
+        })
+    return sorted(analytics, key=lambda row: row["day"])
+
+
+def _random_accounts(seed, count=30):
+    rng = random.Random(seed)
+    analytics_list = [_random_analytics(rng, rng.randint(0, 120)) for _ in range(count)]
+    # Zero revenue videos, an empty history and irregular rows scored individually
+    analytics_list.append([{**row, "estimatedRedPartnerRevenue": 0.0} for row in analytics_list[0]])
+    analytics_list.append([])
+    analytics_list.append([{"day": "2024-1-2", "estimatedRedPartnerRevenue": 3.0, "estimatedMinutesWatched": 10}])
+    return analytics_list
+
+
+class TestVectorizedCurve:
+
+    def test_curve_values_match_scalar(self):
+        values = [-1.0, 0.0, 1e-12, 0.5, 2.0, 100.0, 12345.678, float("inf"), float("nan")]
+        assert calculate_curve_values(values).tolist() == [calculate_curve_value(v) for v in values]
+
+    def test_adjusted_differences_match_scalar(self):
+        rng = random.Random(3)
+        rows = [
+            (rng.uniform(0, 500), rng.uniform(0, 500), rng.choice([0, 200, 400, 1800]), rng.choice([0, 6.25, 25, 100]))
+            for _ in range(500)
+        ]
+        vectorized = calculate_adjusted_curve_differences(*zip(*rows)).tolist()
+        assert vectorized == [calculate_adjusted_curve_difference(*row) for row in rows]
+
+
+class TestCurveBasedScoresBatch:
+
+    @pytest.mark.parametrize("is_ypp_account", [True, False])
+    @pytest.mark.parametrize("min_stake", [True, False])
+    @pytest.mark.parametrize("threshold", [None, 0.0, 2.5, 5000.0])
+    def test_matches_per_video_scoring(self, is_ypp_account, min_stake, threshold):
+        analytics_list = _random_accounts(seed=5)
+        channel_analytics = None if threshold is None else {"ypp": is_ypp_account}
+        video_ids = [f"video_{i}" for i in range(len(analytics_list))]
+
+        with patch(MEDIAN_TARGET, return_value=threshold):
+            expected = [
+                calculate_curve_based_score(analytics, "", "", is_ypp_account, channel_analytics, video_id, min_stake)
+                for analytics, video_id in zip(analytics_list, video_ids)
+            ]
+            actual = calculate_curve_based_scores_batch(
+                analytics_list, is_ypp_account, channel_analytics, video_ids, min_stake
+            )
+
+        assert actual == expected
+
+    def test_empty_batch(self):
+        assert calculate_curve_based_scores_batch([], True) == []
+
+
+class TestUpdateVideoScoresBatch:
+
+    BRIEFS = [
+        {"id": "dedicated_brief", "format": "dedicated", "boost": 1.25},
+        {"id": "ad_read_brief", "format": "ad-read"},
+        {"id": "placement_brief", "format": "productPlacement", "boost": 2.0},
+    ]
+
+    def _account(self, seed):
+        rng = random.Random(seed)
+        analytics_list = _random_accounts(seed, count=20)
+        result = {"videos": {}, "scores": {brief["id"]: 0 for brief in self.BRIEFS}}
+        video_matches = {}
+        day_metrics = {}
+        for i, analytics in enumerate(analytics_list):
+            video_id = f"yt_{i}"
+            result["videos"][video_id] = {
+                "details": {"bitcastVideoId": f"bitcast_{i}", "publishedAt": "2024-01-01T00:00:00Z"},
+                "analytics": {},
+            }
+            video_matches[video_id] = [rng.random() < 0.7 for _ in self.BRIEFS]
+            day_metrics[video_id] = {"day_metrics": {row["day"]: row for row in analytics}}
+        return result, video_matches, day_metrics
+
+    @pytest.mark.parametrize("is_ypp_account", [True, False])
+    def test_matches_sequential_update_video_score(self, is_ypp_account):
+        result, video_matches, day_metrics = self._account(seed=21)
+        sequential = copy.deepcopy(result)
+        batched = copy.deepcopy(result)
+        video_ids = list(result["videos"])
+        channel_analytics = {"ypp": is_ypp_account}
+
+        with patch('bitcast.validator.platforms.youtube.evaluation.scoring.get_video_analytics',
+                   side_effect=lambda client, video_id, *args, **kwargs: day_metrics[video_id]), \
+             patch(MEDIAN_TARGET, return_value=8.0), \
+             patch('bitcast.validator.platforms.youtube.main.get_bitcast_alpha_price', return_value=0.37), \
+             patch('bitcast.validator.platforms.youtube.main.get_total_miner_emissions', return_value=1234.5):
+            for video_id in video_ids:
+                update_video_score(video_id, MagicMock(), video_matches, self.BRIEFS, sequential,
+                                   is_ypp_account, channel_analytics, min_stake=True)
+            update_video_scores_batch(video_ids, MagicMock(), video_matches, self.BRIEFS, batched,
+                                      is_ypp_account, channel_analytics, min_stake=True)
+
+        assert batched == sequential
+        assert any(score > 0 for score in batched["scores"].values())
+
+    def test_missing_curve_inputs_fall_back_to_per_pair_metrics(self):
+        result = {"videos": {"v1": {"details": {"bitcastVideoId": "b1"}, "analytics": {}}}, "scores": {"dedicated_brief": 0}}
+        score_result = {"score": 0.0, "daily_analytics": [], "scoring_method": "curve_error_fallback"}
+
+        with patch('bitcast.validator.platforms.youtube.main.calculate_video_scores_batch', return_value=[score_result]), \
+             patch('bitcast.validator.platforms.youtube.main.get_bitcast_alpha_price', return_value=1.0), \
+             patch('bitcast.validator.platforms.youtube.main.get_total_miner_emissions', return_value=1.0):
+            update_video_scores_batch(["v1"], MagicMock(), {"v1": [True]}, self.BRIEFS[:1], result, True)
+
+        assert result["videos"]["v1"]["brief_metrics"]["dedicated_brief"]["limitation_status"] == "error"
+        assert result["scores"]["dedicated_brief"] == 0.0
+
+    def test_failed_analytics_fetch_only_zeroes_that_video(self):
+        result, video_matches, day_metrics = self._account(seed=8)
+        video_ids = list(result["videos"])
+        failing_id = video_ids[1]
+        expected = copy.deepcopy(result)
+        batched = copy.deepcopy(result)
+
+        def fetch(client, video_id, *args, **kwargs):
+            if video_id == failing_id:
+                raise ConnectionError("analytics unavailable")
+            return day_metrics[video_id]
+
+        with patch('bitcast.validator.platforms.youtube.evaluation.scoring.get_video_analytics', side_effect=fetch), \
+             patch(MEDIAN_TARGET, return_value=8.0), \
+             patch('bitcast.validator.platforms.youtube.main.get_bitcast_alpha_price', return_value=0.37), \
+             patch('bitcast.validator.platforms.youtube.main.get_total_miner_emissions', return_value=1234.5):
+            remaining = [video_id for video_id in video_ids if video_id != failing_id]
+            update_video_scores_batch(remaining, MagicMock(), video_matches, self.BRIEFS, expected, True)
+            update_video_scores_batch(video_ids, MagicMock(), video_matches, self.BRIEFS, batched, True)
+
+        expected["videos"][failing_id]["score"] = 0
+        assert batched == expected
+        assert any(score > 0 for score in batched["scores"].values())
+
+    def test_failed_analytics_fetch_matches_sequential_update_video_score(self):
+        result, video_matches, day_metrics = self._account(seed=8)
+        video_ids = list(result["videos"])
+        failing_id = video_ids[1]
+        sequential = copy.deepcopy(result)
+        batched = copy.deepcopy(result)
+
+        def fetch(client, video_id, *args, **kwargs):
+            if video_id == failing_id:
+                raise ConnectionError("analytics unavailable")
+            return day_metrics[video_id]
+
+        with patch('bitcast.validator.platforms.youtube.evaluation.scoring.get_video_analytics', side_effect=fetch), \
+             patch(MEDIAN_TARGET, return_value=8.0), \
+             patch('bitcast.validator.platforms.youtube.main.get_bitcast_alpha_price', return_value=0.37), \
+             patch('bitcast.validator.platforms.youtube.main.get_total_miner_emissions', return_value=1234.5):
+            for video_id in video_ids:
+                update_video_score(video_id, MagicMock(), video_matches, self.BRIEFS, sequential, True)
+            update_video_scores_batch(video_ids, MagicMock(), video_matches, self.BRIEFS, batched, True)
+
+        assert sequential["videos"][failing_id]["score"] == 0
+        assert batched == sequential
@@ -0,0 +1,81 @@
+"""
+Tests for the multi-pattern brief unique identifier index.
+"""
+import random
+import string
+
+import pytest
+
+from bitcast.validator.platforms.youtube.evaluation.video import check_brief_unique_identifier
+from bitcast.validator.platforms.youtube.evaluation.video.identifier_index import (
+    BriefIdentifierIndex,
+    get_brief_identifier_index,
+    normalize_unique_identifier,
+)
+
+
+def _build(briefs, use_automaton):
+    identifiers = [normalize_unique_identifier(brief) for brief in briefs]
+    return BriefIdentifierIndex(identifiers, min_automaton_patterns=1 if use_automaton else 10**6)
+
+
+def _expected(briefs, description):
+    return {i for i, brief in enumerate(briefs) if check_brief_unique_identifier(brief, description)}
+
+
+@pytest.mark.parametrize("use_automaton", [False, True])
+class TestBriefIdentifierIndex:
+
+    def test_overlapping_identifiers(self, use_automaton):
+        briefs = [
+            {"id": "a", "unique_identifier": "ABC"},
+            {"id": "b", "unique_identifier": "abcd"},
+            {"id": "c", "unique_identifier": "BCD"},
+            {"id": "d", "unique_identifier": "cdx"},
+            {"id": "e", "unique_identifier": "  "},
+            {"id": "f", "unique_identifier": None},
+            {"id": "g"},
+        ]
+        index = _build(briefs, use_automaton)
+
+        assert index.match("xxABCDyy") == {0, 1, 2, 4, 5, 6}
+        assert index.match(None) == {4, 5, 6}
+        assert index.match("") == {4, 5, 6}
+
+    def test_duplicate_identifiers(self, use_automaton):
+        briefs = [{"id": "a", "unique_identifier": "Tag"}, {"id": "b", "unique_identifier": " tag "}]
+        index = _build(briefs, use_automaton)
+
+        assert index.match("a TAG here") == {0, 1}
+
+    def test_matches_per_brief_check(self, use_automaton):
+        rng = random.Random(7)
+        alphabet = "abAB#"
+        for _ in range(200):
+            briefs = [
+                {"id": str(i), "unique_identifier": "".join(rng.choices(alphabet, k=rng.randint(0, 4)))}
+                for i in range(rng.randint(1, 8))
+            ]
+            description = "".join(rng.choices(alphabet + " ", k=rng.randint(0, 40)))
+            index = _build(briefs, use_automaton)
+
+            assert index.match(description) == _expected(briefs, description)
+
+
+def test_index_is_reused_until_identifiers_change():
+    briefs = [{"id": "a", "unique_identifier": "code1"}, {"id": "b", "unique_identifier": "code2"}]
+
+    first = get_brief_identifier_index(briefs)
+    assert get_brief_identifier_index([dict(b) for b in briefs]) is first
+
+    changed = get_brief_identifier_index([briefs[0], {"id": "b", "unique_identifier": "code3"}])
+    assert changed is not first
+    assert changed.match("has CODE3") == {1}
+
+
+def test_large_identifier_set_uses_automaton():
+    briefs = [{"id": str(i), "unique_identifier": "".join(random.choices(string.ascii_letters, k=8))} for i in range(200)]
+    index = get_brief_identifier_index(briefs)
+
+    assert index.uses_automaton
+    assert index.match("prefix " + briefs[42]["unique_identifier"].upper()) >= {42}
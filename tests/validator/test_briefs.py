@@ -2,13 +2,16 @@ from pathlib import Path
 
 import requests
 from datetime import datetime, timezone, timedelta
-from bitcast.validator.utils.briefs import get_briefs, BriefsCache
+from bitcast.validator.utils.brief_model import Brief
+from bitcast.validator.utils import briefs as briefs_module
+from bitcast.validator.utils.briefs import get_briefs, BriefsCache, BriefsRefresher
 from bitcast.validator.utils.config import YT_REWARD_DELAY
 
 class MockResponse:
-    def __init__(self, json_data, status_code=200):
+    def __init__(self, json_data, status_code=200, headers=None):
         self._json_data = json_data
         self.status_code = status_code
+        self.headers = headers or {}
 
     def json(self):
         return self._json_data
@@ -37,6 +40,7 @@ def test_get_briefs_all(monkeypatch):
     assert len(briefs) == 2
     assert briefs[0]["id"] == "brief1"
     assert briefs[1]["id"] == "brief2"
+    assert all(isinstance(brief, Brief) for brief in briefs)
 
 def test_get_briefs_active(monkeypatch):
     """
@@ -230,3 +234,90 @@ def test_get_briefs_no_cache_fallback(monkeypatch):
     import pytest
     with pytest.raises(ConnectionError, match="Content briefs fetch failed"):
         get_briefs(all=True)
+
+
+def _active_dates():
+    current_date = datetime.now(timezone.utc).date()
+    return (current_date - timedelta(days=YT_REWARD_DELAY)).strftime("%Y-%m-%d"), current_date.strftime("%Y-%m-%d")
+
+
+def test_refresher_serves_snapshot_without_network(monkeypatch):
+    """
+    Test that get_briefs serves the refresher snapshot and only the refresh touches the network.
+    """
+    start, end = _active_dates()
+    mock_data = {
+        "items": [
+            {"id": "active", "start_date": start, "end_date": end},
+            {"id": "inactive", "start_date": "2000-01-01", "end_date": "2000-01-02"}
+        ]
+    }
+    calls = []
+
+    def mock_get(*args, **kwargs):
+        calls.append(kwargs)
+        return MockResponse(mock_data, headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(requests, "get", mock_get)
+    refresher = BriefsRefresher(interval=3600, timeout=2)
+    assert refresher.get() is None
+    assert refresher.refresh() is True
+    assert calls[0]["timeout"] == 2
+
+    monkeypatch.setattr(briefs_module, "_refresher", refresher)
+    assert [brief["id"] for brief in get_briefs()] == ["active"]
+    assert [brief["id"] for brief in get_briefs(all=True)] == ["active", "inactive"]
+    assert len(calls) == 1
+    assert BriefsCache.get_cache().get("briefs_True") == mock_data["items"]
+    assert briefs_module.get_briefs_snapshot_age() is not None
+
+
+def test_refresher_conditional_fetch_and_failures(monkeypatch):
+    """
+    Test that unchanged briefs are revalidated with the ETag and failed refreshes keep the last good snapshot.
+    """
+    responses = [
+        MockResponse({"items": [{"id": "brief1", "start_date": "2020-01-01", "end_date": "2020-01-02"}]},
+                     headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2020 00:00:00 GMT"}),
+        MockResponse(None, status_code=304),
+        requests.exceptions.Timeout("timed out"),
+    ]
+    calls = []
+
+    def mock_get(*args, **kwargs):
+        calls.append(kwargs)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(requests, "get", mock_get)
+    refresher = BriefsRefresher(interval=3600, timeout=2)
+    assert refresher.refresh() is True
+    first = refresher.get(all=True)
+
+    assert refresher.refresh() is True
+    assert calls[1]["headers"] == {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 Jan 2020 00:00:00 GMT"}
+    assert refresher.get(all=True) == first
+
+    assert refresher.refresh() is False
+    assert [brief["id"] for brief in refresher.get(all=True)] == ["brief1"]
+
+
+def test_refresher_seeds_from_cache(monkeypatch):
+    """
+    Test that a started refresher serves cached briefs while the endpoint is down.
+    """
+    BriefsCache.get_cache().set("briefs_True", [{"id": "cached_brief", "start_date": "2020-01-01", "end_date": "2020-01-02"}])
+
+    def mock_get(*args, **kwargs):
+        raise requests.exceptions.ConnectionError("API down")
+
+    monkeypatch.setattr(requests, "get", mock_get)
+    refresher = BriefsRefresher(interval=3600, timeout=0.1)
+    refresher.start()
+    try:
+        assert [brief["id"] for brief in refresher.get(all=True)] == ["cached_brief"]
+        assert refresher.snapshot_age() is None
+    finally:
+        refresher.stop()
@@ -0,0 +1,86 @@
+"""
+Tests for running the prompt injection check concurrently with brief evaluation.
+"""
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from bitcast.validator.platforms.youtube.evaluation.video import orchestration
+
+BRIEFS = [{"id": "brief1", "brief": "b1"}, {"id": "brief2", "brief": "b2"}]
+
+
+def _fake_brief_evaluation(briefs, video_data, transcript, decision_details):
+    decision_details["contentAgainstBriefCheck"] = [True, False]
+    return ["brief1"], ["meets", "does not meet"]
+
+
+def _run(injection_passes, evaluate=_fake_brief_evaluation, concurrent=True):
+    def fake_injection_check(video_id, video_data, transcript, decision_details):
+        decision_details["promptInjectionCheck"] = injection_passes
+        return injection_passes
+
+    decision_details = {}
+    with patch.object(orchestration, "DISABLE_PROMPT_INJECTION", False), \
+         patch.object(orchestration, "PROMPT_INJECTION_CONCURRENT", concurrent), \
+         patch.object(orchestration, "prescreen_briefs_for_video", return_value=(BRIEFS, [True, True], [])), \
+         patch.object(orchestration, "get_video_transcript", return_value="transcript"), \
+         patch.object(orchestration, "check_prompt_injection", side_effect=fake_injection_check), \
+         patch.object(orchestration, "evaluate_content_against_briefs", side_effect=evaluate):
+        result = orchestration._process_video_transcript_and_briefs("vid", {"description": ""}, BRIEFS, decision_details)
+    return result, decision_details
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_clean_video_keeps_brief_results(concurrent):
+    (met, reasonings), details = _run(True, concurrent=concurrent)
+
+    assert met == ["brief1"]
+    assert reasonings == ["meets", "does not meet"]
+    assert details["promptInjectionCheck"] is True
+    assert details["contentAgainstBriefCheck"] == [True, False]
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_injected_video_discards_brief_results(concurrent):
+    (met, reasonings), details = _run(False, concurrent=concurrent)
+
+    assert met == []
+    assert reasonings == ["Video failed prompt injection check"] * 2
+    assert details["promptInjectionCheck"] is False
+    assert details["video_vet_result"] is False
+    assert details["contentAgainstBriefCheck"] == [False, False]
+
+
+def test_injection_check_overlaps_brief_evaluation():
+    both_running = threading.Barrier(2, timeout=5)
+
+    def fake_injection_check(video_id, video_data, transcript, decision_details):
+        both_running.wait()
+        decision_details["promptInjectionCheck"] = True
+        return True
+
+    def slow_brief_evaluation(*args):
+        both_running.wait()
+        return _fake_brief_evaluation(*args)
+
+    with patch.object(orchestration, "DISABLE_PROMPT_INJECTION", False), \
+         patch.object(orchestration, "PROMPT_INJECTION_CONCURRENT", True), \
+         patch.object(orchestration, "prescreen_briefs_for_video", return_value=(BRIEFS, [True, True], [])), \
+         patch.object(orchestration, "get_video_transcript", return_value="transcript"), \
+         patch.object(orchestration, "check_prompt_injection", side_effect=fake_injection_check), \
+         patch.object(orchestration, "evaluate_content_against_briefs", side_effect=slow_brief_evaluation):
+        met, _ = orchestration._process_video_transcript_and_briefs("vid", {}, BRIEFS, {})
+
+    assert met == ["brief1"]
+
+
+def test_injection_failure_takes_precedence_over_brief_error():
+    def failing_evaluation(*args):
+        raise RuntimeError("LLM down")
+
+    (met, reasonings), details = _run(False, evaluate=failing_evaluation)
+
+    assert reasonings == ["Video failed prompt injection check"] * 2
+    assert details["promptInjectionCheck"] is False
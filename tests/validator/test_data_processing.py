@@ -2,10 +2,13 @@
 Unit tests for data processing utilities for curve-based scoring.
 """
 
+import random
 import unittest
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 from bitcast.validator.platforms.youtube.evaluation.data_processing import (
+    _get_period_averages_rowwise,
     fill_missing_dates,
     calculate_cumulative_totals,
     get_period_averages
@@ -66,5 +69,69 @@ class TestDataProcessing(unittest.TestCase):
         self.assertGreaterEqual(day2_avg, 0)
 
 
+class TestColumnarPeriodAverages(unittest.TestCase):
+    """The columnar get_period_averages must match the row-wise implementation exactly."""
+
+    METRIC = "estimatedRedPartnerRevenue"
+
+    def _random_analytics(self, rng, base, days):
+        analytics = []
+        for offset in range(days):
+            if rng.random() < 0.3:
+                continue  # Gap to be zero-filled
+            day = (base + timedelta(days=offset)).strftime('%Y-%m-%d')
+            value = rng.choice([rng.uniform(0, 50), rng.randint(0, 500), 0.1, 1e-9])
+            analytics.append({"day": day, self.METRIC: value, "estimatedMinutesWatched": rng.randint(0, 999)})
+        rng.shuffle(analytics)
+        return analytics
+
+    def _periods(self, base, end_offset, window=7):
+        day2_end = base + timedelta(days=end_offset)
+        day2_start = day2_end - timedelta(days=window)
+        day1_end = day2_end - timedelta(days=1)
+        day1_start = day1_end - timedelta(days=window)
+        return [d.strftime('%Y-%m-%d') for d in (day1_start, day1_end, day2_start, day2_end)]
+
+    def _assert_identical(self, analytics, periods, window=7, channel_analytics=None):
+        args = (analytics, self.METRIC, *periods, window, channel_analytics, True)
+        self.assertEqual(get_period_averages(*args), _get_period_averages_rowwise(*args))
+
+    def test_matches_rowwise_on_random_histories(self):
+        rng = random.Random(7)
+        base = datetime(2024, 1, 1)
+        for _ in range(200):
+            analytics = self._random_analytics(rng, base, rng.randint(0, 90))
+            periods = self._periods(base, rng.randint(-5, 100))
+            self._assert_identical(analytics, periods, window=rng.choice([1, 3, 7, 10]))
+
+    def test_matches_rowwise_with_proportional_scaling(self):
+        rng = random.Random(11)
+        base = datetime(2024, 3, 1)
+        target = 'bitcast.validator.platforms.youtube.evaluation.proportional_scaling.calculate_median_from_analytics'
+        for threshold in (0.0, 1.5, 10.0, 1000.0):
+            with patch(target, return_value=threshold):
+                for _ in range(50):
+                    analytics = self._random_analytics(rng, base, 60)
+                    self._assert_identical(analytics, self._periods(base, 45), channel_analytics={"ypp": True})
+
+    def test_duplicate_days_use_last_row(self):
+        analytics = [
+            {"day": "2024-01-01", self.METRIC: 1.0},
+            {"day": "2024-01-02", self.METRIC: 2.0},
+            {"day": "2024-01-02", self.METRIC: 5.0},
+        ]
+        self._assert_identical(analytics, ["2024-01-01", "2024-01-02", "2024-01-02", "2024-01-03"], window=2)
+
+    def test_irregular_input_falls_back_to_rowwise(self):
+        periods = ["2024-01-01", "2024-01-03", "2024-01-02", "2024-01-04"]
+        self._assert_identical([{"day": "2024-01-02", self.METRIC: "n/a"}, {"day": "2024-01-03", self.METRIC: 4.0}], periods)
+        self._assert_identical([{"day": "2024-1-2", self.METRIC: 3.0}, {"day": "2024-01-03", self.METRIC: 4.0}], periods)
+        self._assert_identical([{"day": "2024-02-30", self.METRIC: 3.0}], periods)
+
+    def test_invalid_period_dates_return_zero(self):
+        result = get_period_averages([], self.METRIC, "bad", "2024-01-02", "2024-01-02", "2024-01-03", 7)
+        self.assertEqual(result, (0.0, 0.0))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+Tests for the local lexical relevance prefilter.
+"""
+import json
+from collections import Counter
+from unittest.mock import patch
+
+from bitcast.validator.platforms.youtube.evaluation.video import relevance
+from bitcast.validator.platforms.youtube.evaluation.video.relevance import (
+    compute_idf,
+    prefilter_briefs_by_relevance,
+    score_brief_relevance,
+    tokenize,
+)
+
+BRIEFS = [
+    {"id": "wallet", "brief": "Review the Talisman wallet: staking, swaps and hardware wallet support."},
+    {"id": "cooking", "brief": "Cook a vegan lasagna and explain every ingredient."},
+    {"id": "empty", "brief": ""},
+]
+TRANSCRIPT = str([
+    {"start": 0.0, "dur": 2.5, "text": "today we review the talisman wallet"},
+    {"start": 2.5, "dur": 3.0, "text": "staking works and swaps are cheap, the wallet supports ledger hardware"},
+])
+
+
+def test_tokenize_drops_stopwords_numbers_and_transcript_keys():
+    assert tokenize("The start of 2024: staking, dur TEXT Wallet") == ["staking", "wallet"]
+    assert tokenize(None) == []
+
+
+def test_relevant_brief_scores_higher():
+    idf = compute_idf(BRIEFS)
+    terms = Counter(tokenize(TRANSCRIPT))
+
+    wallet = score_brief_relevance(BRIEFS[0], terms, idf)
+    cooking = score_brief_relevance(BRIEFS[1], terms, idf)
+
+    assert 0.0 <= cooking < wallet < 1.0
+    assert cooking == 0.0
+    assert score_brief_relevance(BRIEFS[2], terms, idf) == 1.0
+
+
+def test_off_mode_keeps_everything_without_scoring():
+    with patch.object(relevance, "LEXICAL_PREFILTER_MODE", "off"):
+        keep, scores = prefilter_briefs_by_relevance("vid", BRIEFS, BRIEFS, "", TRANSCRIPT)
+
+    assert keep == [True, True, True]
+    assert scores is None
+
+
+def test_enforce_mode_skips_and_logs_low_scoring_pairs(tmp_path):
+    log_file = tmp_path / "pairs.jsonl"
+    with patch.object(relevance, "LEXICAL_PREFILTER_MODE", "enforce"), \
+         patch.object(relevance, "LEXICAL_PREFILTER_THRESHOLD", 0.05), \
+         patch.object(relevance, "PREFILTER_LOG_FILE", str(log_file)), \
+         patch.dict(relevance.CACHE_DIRS, {"lexical_prefilter": str(tmp_path)}):
+        keep, scores = prefilter_briefs_by_relevance("vid", BRIEFS, BRIEFS, "", TRANSCRIPT)
+
+    assert keep == [True, False, True]
+    records = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert [(r["video_id"], r["brief_id"], r["decision"]) for r in records] == [("vid", "cooking", "skipped")]
+
+
+def test_shadow_mode_never_skips_and_logs_verdicts(tmp_path):
+    log_file = tmp_path / "pairs.jsonl"
+    with patch.object(relevance, "LEXICAL_PREFILTER_MODE", "shadow"), \
+         patch.object(relevance, "PREFILTER_LOG_FILE", str(log_file)), \
+         patch.dict(relevance.CACHE_DIRS, {"lexical_prefilter": str(tmp_path)}):
+        keep, scores = prefilter_briefs_by_relevance("vid", BRIEFS[:2], BRIEFS, "", TRANSCRIPT)
+        relevance.log_shadow_verdicts("vid", BRIEFS[:2], scores, [True, False])
+
+    assert keep == [True, True]
+    records = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert [(r["brief_id"], r["decision"], r["llm_verdict"]) for r in records] == [
+        ("wallet", "keep", True),
+        ("cooking", "would_skip", False),
+    ]
+
+
+def test_skipped_briefs_are_not_sent_to_llm(tmp_path):
+    from bitcast.validator.platforms.youtube.evaluation.video import orchestration
+
+    def fake_evaluate(briefs, video_data, transcript, decision_details):
+        decision_details["contentAgainstBriefCheck"].extend([True] * len(briefs))
+        return [b["id"] for b in briefs], ["matched"] * len(briefs)
+
+    decision_details = {}
+    with patch.object(relevance, "LEXICAL_PREFILTER_MODE", "enforce"), \
+         patch.object(relevance, "PREFILTER_LOG_FILE", str(tmp_path / "pairs.jsonl")), \
+         patch.dict(relevance.CACHE_DIRS, {"lexical_prefilter": str(tmp_path)}), \
+         patch.object(orchestration, "prescreen_briefs_for_video", return_value=(BRIEFS[:2], [True, True], [])), \
+         patch.object(orchestration, "get_video_transcript", return_value=TRANSCRIPT), \
+         patch.object(orchestration, "evaluate_content_against_briefs", side_effect=fake_evaluate) as mock_evaluate:
+        met_ids, reasonings = orchestration._process_video_transcript_and_briefs(
+            "vid", {"description": ""}, BRIEFS[:2], decision_details
+        )
+
+    assert [b["id"] for b in mock_evaluate.call_args[0][0]] == ["wallet"]
+    assert met_ids == ["wallet"]
+    assert decision_details["contentAgainstBriefCheck"] == [True, False]
+    assert reasonings[1].startswith("Skipped by lexical relevance prefilter")
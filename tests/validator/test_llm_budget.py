@@ -0,0 +1,115 @@
+"""
+Tests for the value-aware per-cycle LLM budget.
+"""
+import threading
+from unittest.mock import patch
+
+from bitcast.validator.clients.llm_telemetry import bind_request_meter, note_request_attempt
+from bitcast.validator.platforms.youtube.evaluation.video import llm_budget, orchestration
+from bitcast.validator.platforms.youtube.evaluation.video.llm_budget import (
+    DEFERRED_REASONING,
+    LLMBudgetScheduler,
+    get_channel_value,
+    get_evaluation_value,
+)
+
+HIGH = {"id": "high", "weight": 100, "boost": 2.0}
+LOW = {"id": "low", "weight": 10}
+
+
+def test_channel_value_sums_daily_minutes():
+    assert get_channel_value({"estimatedMinutesWatched": {"2024-01-01": 100, "2024-01-02": 50}}) == 150.0
+    assert get_channel_value({"estimatedMinutesWatched": 75}) == 75.0
+    assert get_channel_value(None) == 0.0
+
+
+def test_evaluation_value_uses_weight_and_boost():
+    assert get_evaluation_value(HIGH, 10.0) == 2000.0
+    assert get_evaluation_value(LOW, 10.0) == 100.0
+
+
+def test_unlimited_budget_admits_everything():
+    scheduler = LLMBudgetScheduler(budget=0)
+
+    assert scheduler.admit([HIGH, LOW], 1.0) == [True, True]
+    assert not scheduler.enabled
+
+
+def test_everything_admitted_outside_reserve():
+    scheduler = LLMBudgetScheduler(budget=10, reserve_fraction=0.2, priority_percentile=0.75)
+
+    assert scheduler.admit([LOW, HIGH], 1.0) == [True, True]
+    assert scheduler.stats()["admitted"] == 2
+
+
+def test_reserve_only_admits_high_value_evaluations():
+    scheduler = LLMBudgetScheduler(budget=10, reserve_fraction=0.5, priority_percentile=0.75)
+    scheduler.admit([{"id": f"b{w}", "weight": w} for w in range(1, 9)], 1.0)
+    scheduler.charge(6)
+
+    assert scheduler.admit([{"id": "b2", "weight": 2}, HIGH], 1.0) == [False, True]
+    assert scheduler.stats()["deferred"] == 1
+
+
+def test_exhausted_budget_defers_everything():
+    scheduler = LLMBudgetScheduler(budget=5)
+    scheduler.charge(5)
+
+    assert scheduler.admit([HIGH, LOW], 1000.0) == [False, False]
+    assert scheduler.stats() == {"budget": 5, "spent": 5, "admitted": 0, "deferred": 2}
+    assert scheduler.account_deferred == 2
+
+    scheduler.reset_account_stats()
+    assert scheduler.account_deferred == 0
+
+
+def test_deferred_briefs_are_reported_as_not_met():
+    scheduler = LLMBudgetScheduler(budget=5)
+    scheduler.charge(5)
+    briefs = [HIGH, LOW]
+
+    with patch.object(orchestration, "get_llm_budget_scheduler", return_value=scheduler), \
+         patch.object(orchestration, "evaluate_content_against_briefs") as mock_evaluate:
+        met, reasonings, results = orchestration._evaluate_eligible_briefs(
+            "vid", {"description": ""}, briefs, briefs, [True, True], "transcript", channel_value=10.0
+        )
+
+    mock_evaluate.assert_not_called()
+    assert met == []
+    assert results == [False, False]
+    assert reasonings == [DEFERRED_REASONING, DEFERRED_REASONING]
+
+
+def test_admitted_evaluations_are_charged_actual_requests():
+    scheduler = LLMBudgetScheduler(budget=100)
+
+    def fake_evaluate(briefs, video_data, transcript, decision_details):
+        # Two requests in this thread, one in a worker thread, one unrelated concurrent request
+        note_request_attempt()
+        note_request_attempt()
+        worker = threading.Thread(target=bind_request_meter(note_request_attempt))
+        worker.start()
+        worker.join()
+        unrelated = threading.Thread(target=note_request_attempt)
+        unrelated.start()
+        unrelated.join()
+        decision_details["contentAgainstBriefCheck"] = [True, False]
+        return ["high"], ["meets", "does not meet"]
+
+    with patch.object(orchestration, "get_llm_budget_scheduler", return_value=scheduler), \
+         patch.object(orchestration, "evaluate_content_against_briefs", side_effect=fake_evaluate):
+        met, reasonings, results = orchestration._evaluate_eligible_briefs(
+            "vid", {"description": ""}, [HIGH, LOW], [HIGH, LOW], [True, True], "transcript", channel_value=10.0
+        )
+
+    assert met == ["high"]
+    assert results == [True, False]
+    assert scheduler.stats()["spent"] == 3
+
+
+def test_reset_starts_fresh_cycle():
+    llm_budget.reset_llm_budget(budget=7)
+    try:
+        assert llm_budget.get_llm_budget_stats() == {"budget": 7, "spent": 0, "admitted": 0, "deferred": 0}
+    finally:
+        llm_budget.reset_llm_budget(budget=0)
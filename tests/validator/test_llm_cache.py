@@ -0,0 +1,91 @@
+"""
+Tests for the sharded LLM cache backend and its migration from the legacy cache.
+"""
+import os
+import time
+
+import pytest
+from diskcache import Cache, FanoutCache
+
+from bitcast.validator.clients.base_client import BaseLLMClient, migrate_legacy_cache
+
+
+class ShardedTestClient(BaseLLMClient):
+    BRIEF_EVALUATION_MODEL = "test"
+    PROMPT_INJECTION_MODEL = "test"
+
+    def _make_request(self, model, **kwargs):
+        raise NotImplementedError
+
+    def get_provider_name(self):
+        return "test"
+
+
+@pytest.fixture
+def sharded_client(tmp_path):
+    ShardedTestClient._cache = None
+    ShardedTestClient._cache_dir = str(tmp_path / "openai")
+    ShardedTestClient._cache_shards = 4
+    ShardedTestClient._cache_migrate = False
+    ShardedTestClient.reset_cache_stats()
+    yield ShardedTestClient
+    ShardedTestClient.cleanup()
+
+
+def test_migration_moves_live_entries_once(tmp_path):
+    directory = str(tmp_path / "cache")
+    legacy = Cache(directory=directory)
+    legacy.set("permanent", {"meets_brief": True, "reasoning": "ok"})
+    legacy.set("expiring", True, expire=3600)
+    legacy.set("expired", False, expire=-1)
+    legacy.close()
+
+    fanout = FanoutCache(directory=directory, shards=4)
+    try:
+        assert migrate_legacy_cache(directory, fanout) == 2
+        assert fanout.get("permanent") == {"meets_brief": True, "reasoning": "ok"}
+        assert fanout.get("expiring") is True
+        assert "expired" not in fanout
+        _, expire_time = fanout.get("expiring", expire_time=True)
+        assert 3500 < expire_time - time.time() <= 3600
+
+        assert not os.path.exists(os.path.join(directory, "cache.db"))
+        assert migrate_legacy_cache(directory, fanout) == 0
+    finally:
+        fanout.close()
+
+
+def test_sharded_client_cache_writes_and_stats(sharded_client):
+    cache = sharded_client.get_cache()
+    assert isinstance(cache, FanoutCache)
+
+    assert sharded_client.cache_set("prompt", {"meets_brief": False, "reasoning": "no"})
+    assert sharded_client.cache_touch("prompt")
+    assert not sharded_client.cache_touch("missing")
+    assert cache.get("prompt") == {"meets_brief": False, "reasoning": "no"}
+
+    stats = sharded_client.get_cache_stats()
+    assert stats["writes"] == 3
+    assert stats["failed_writes"] == 1
+    assert stats["write_latency_s"] >= stats["max_write_latency_s"] > 0.0
+
+
+def test_single_shard_uses_plain_cache_and_lock(sharded_client):
+    sharded_client._cache_shards = 1
+
+    assert type(sharded_client.get_cache()) is Cache
+    assert sharded_client.cache_set("prompt", True)
+    assert sharded_client.get_cache_stats()["writes"] == 1
+
+
+@pytest.mark.parametrize("migrate", [False, True])
+def test_startup_migration_is_opt_in(sharded_client, migrate):
+    legacy = Cache(directory=sharded_client._cache_dir)
+    legacy.set("prompt", True)
+    legacy.close()
+    sharded_client._cache_migrate = migrate
+
+    cache = sharded_client.get_cache()
+
+    assert (cache.get("prompt") is True) is migrate
+    assert os.path.exists(os.path.join(sharded_client._cache_dir, "cache.db")) is not migrate
@@ -0,0 +1,135 @@
+"""
+Tests for LLM usage telemetry.
+"""
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from bitcast.validator.clients import llm_telemetry
+# Imported at collection time, before conftest replaces the module attribute with a mock
+from bitcast.validator.clients.llm_client import evaluate_content_against_brief
+from bitcast.validator.clients.llm_telemetry import (
+    LLMUsageStats,
+    estimate_tokens,
+    get_llm_usage,
+    note_request_attempt,
+    record_llm_cache_hit,
+    record_llm_request,
+    reset_llm_usage,
+)
+from bitcast.validator.utils.singleflight import SingleFlight
+
+
+@pytest.fixture(autouse=True)
+def clean_usage():
+    for scope in llm_telemetry.SCOPES:
+        reset_llm_usage(scope)
+    yield
+    for scope in llm_telemetry.SCOPES:
+        reset_llm_usage(scope)
+
+
+def test_provider_usage_is_recorded_per_dimension():
+    response = {"usage": {"prompt_tokens": 120, "completion_tokens": 30}}
+    record_llm_request("chutes", "brief1", 4, response, "prompt", "completion", latency_s=1.5, retries=1)
+
+    usage = get_llm_usage("cycle")
+    totals = usage["totals"]
+    assert totals["requests"] == 1
+    assert totals["retries"] == 1
+    assert (totals["prompt_tokens"], totals["completion_tokens"]) == (120, 30)
+    assert totals["estimated_token_requests"] == 0
+    assert totals["latency_histogram"] == {"le_2s": 1}
+    assert usage["by_provider"]["chutes"]["requests"] == 1
+    assert usage["by_brief"]["brief1"]["prompt_tokens"] == 120
+    assert usage["by_prompt_version"]["4"]["completion_tokens"] == 30
+
+
+def test_missing_usage_falls_back_to_estimate():
+    record_llm_request("chutes", "brief1", 4, {"choices": []}, "x" * 400, "y" * 40, latency_s=0.1)
+
+    totals = get_llm_usage("account")["totals"]
+    assert totals["prompt_tokens"] == estimate_tokens("x" * 400) == 100
+    assert totals["completion_tokens"] == 10
+    assert totals["estimated_token_requests"] == 1
+
+
+def test_failed_requests_and_cache_hits():
+    record_llm_request("chutes", llm_telemetry.INJECTION_LABEL, None, None, "prompt", None, latency_s=200.0, retries=2)
+    record_llm_cache_hit("chutes", "brief1", 4)
+
+    usage = get_llm_usage("cycle")
+    assert usage["totals"]["failed_requests"] == 1
+    assert usage["totals"]["prompt_tokens"] == 0
+    assert usage["totals"]["latency_histogram"] == {"inf": 1}
+    assert usage["totals"]["cache_hits"] == 1
+    assert usage["by_brief"]["brief1"]["cache_hits"] == 1
+    assert "None" not in usage["by_prompt_version"]
+
+
+def test_scopes_reset_independently():
+    record_llm_cache_hit("chutes", "brief1", 4)
+    reset_llm_usage("account")
+
+    assert get_llm_usage("account")["totals"]["cache_hits"] == 0
+    assert get_llm_usage("cycle")["totals"]["cache_hits"] == 1
+
+
+def test_concurrent_recording_is_exact():
+    stats = LLMUsageStats()
+
+    def worker():
+        for _ in range(500):
+            stats.record_request("p", "b", 1, 2, 3, False, 0.01, 0, False)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    totals = stats.snapshot()["totals"]
+    assert totals["requests"] == 4000
+    assert totals["prompt_tokens"] == 8000
+
+
+class RetryingClient:
+    """Client whose first attempt per request fails, then reports usage."""
+
+    BRIEF_EVALUATION_MODEL = "fake-model"
+    _inflight = SingleFlight("telemetry-test")
+
+    def get_cache(self):
+        return None
+
+    def get_provider_name(self):
+        return "fake"
+
+    def record_calls_saved(self, count):
+        pass
+
+    def _make_request(self, model, **kwargs):
+        # Simulates a retried provider call: two attempts counted for one logical request
+        note_request_attempt()
+        note_request_attempt()
+        return {
+            "choices": [{"message": {"content": "## Summary\nOk.\n\n## Verdict\nNO"}}],
+            "usage": {"prompt_tokens": 50, "completion_tokens": 5},
+        }
+
+
+def test_brief_evaluation_records_usage_by_brief():
+    brief = {"id": "brief7", "brief": "Talk about bitcast", "format": "dedicated", "prompt_version": 4}
+    with patch('bitcast.validator.clients.llm_client.get_llm_client', return_value=RetryingClient()), \
+         patch('bitcast.validator.clients.llm_client.DISABLE_LLM_CACHING', True), \
+         patch('bitcast.validator.clients.llm_client.TRANSCRIPT_CHUNKED_EVALUATION', False), \
+         patch('bitcast.validator.clients.llm_client.LLM_VALIDATION_STRATEGY', "all"):
+        meets_brief, _ = evaluate_content_against_brief(brief, "PT10M", "description", "transcript")
+
+    assert meets_brief is False
+    brief_usage = get_llm_usage("cycle")["by_brief"]["brief7"]
+    assert brief_usage["requests"] == 3
+    assert brief_usage["retries"] == 3
+    assert brief_usage["prompt_tokens"] == 150
+    assert get_llm_usage("cycle")["by_prompt_version"]["4"]["requests"] == 3
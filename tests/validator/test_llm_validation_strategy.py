@@ -0,0 +1,94 @@
+"""
+Tests for the LLM brief validation strategies (all / early_exit / speculative).
+"""
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from bitcast.validator.clients import llm_client
+
+
+class FakeClient:
+    """Client returning scripted verdicts in call order."""
+
+    def __init__(self, verdicts, block_after_first=False):
+        self.verdicts = list(verdicts)
+        self.calls = 0
+        self.calls_saved = 0
+        self._lock = threading.Lock()
+        self.release = threading.Event()
+        self.block_after_first = block_after_first
+
+    def record_calls_saved(self, count):
+        self.calls_saved += count
+
+
+def _fake_evaluation(client, prompt_content, labels=None):
+    with client._lock:
+        index = client.calls
+        client.calls += 1
+    if client.block_after_first and index > 0:
+        client.release.wait(timeout=5)
+    return {"meets_brief": client.verdicts[index], "reasoning": f"sample {index}"}
+
+
+def _run(strategy, client):
+    with patch.object(llm_client, "LLM_VALIDATION_STRATEGY", strategy), \
+         patch.object(llm_client, "_make_single_brief_evaluation", _fake_evaluation):
+        return llm_client._run_validation_samples(client, "prompt")
+
+
+def test_all_strategy_waits_for_every_sample():
+    client = FakeClient([False, True, False])
+
+    results = _run("all", client)
+
+    assert [r["meets_brief"] for r in results] == [False, True, False]
+    assert client.calls_saved == 0
+
+
+def test_early_exit_returns_on_first_yes_without_waiting():
+    client = FakeClient([True, False, False], block_after_first=True)
+
+    results = _run("early_exit", client)
+    client.release.set()
+
+    assert [r["meets_brief"] for r in results] == [True]
+    # Every sample was already sent, so none counts as saved
+    assert client.calls_saved == 0
+
+
+def test_early_exit_waits_for_all_when_every_sample_says_no():
+    client = FakeClient([False, False, False])
+
+    results = _run("early_exit", client)
+
+    assert len(results) == 3
+    assert not any(r["meets_brief"] for r in results)
+    assert client.calls_saved == 0
+
+
+def test_speculative_stops_after_single_yes():
+    client = FakeClient([True, False, False])
+
+    results = _run("speculative", client)
+
+    assert client.calls == 1
+    assert [r["meets_brief"] for r in results] == [True]
+    assert client.calls_saved == 2
+
+
+@pytest.mark.parametrize("verdicts, expected", [
+    ([False, True, False], True),
+    ([False, False, False], False),
+])
+def test_speculative_escalates_on_no(verdicts, expected):
+    client = FakeClient(verdicts)
+
+    results = _run("speculative", client)
+
+    assert results[0]["meets_brief"] is False
+    assert any(r["meets_brief"] for r in results) is expected
+    assert client.calls == 3
+    assert client.calls_saved == 0
@@ -2,6 +2,8 @@
 Tests for score cap functions.
 """
 
+import statistics
+
 import pytest
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
@@ -9,8 +11,12 @@ from datetime import datetime, timedelta
 from bitcast.validator.platforms.youtube.evaluation.score_cap import (
     get_cap_period_dates,
     pad_missing_days_with_zeros,
-    calculate_median_from_analytics
+    calculate_median_from_analytics,
+    get_median_cache_stats,
+    median_cache_channel,
+    reset_median_cache,
 )
+from bitcast.validator.utils.cycle_context import CycleContext, activate_cycle, deactivate_cycle
 
 
 class TestGetCapPeriodDates:
@@ -345,4 +351,77 @@ class TestEdgeCases:
             
             result = calculate_median_from_analytics(channel_analytics, 'views')
             
-            assert result == 2000000.0 
\ No newline at end of file
+            assert result == 2000000.0 
+
+
+class TestMedianCache:
+    """Test cases for per-cycle memoization of channel medians."""
+    
+    def setup_method(self):
+        reset_median_cache()
+    
+    def test_median_computed_once_per_channel_and_metric(self):
+        """Repeated calls for the same channel reuse the cached median."""
+        channel_analytics = {'views': {"2024-01-01": 1.0, "2024-01-02": 3.0}, 'estimatedMinutesWatched': {}}
+        with patch('bitcast.validator.platforms.youtube.evaluation.score_cap.get_cap_period_dates',
+                   return_value=("2024-01-01", "2024-01-02")), \
+             patch('bitcast.validator.platforms.youtube.evaluation.score_cap.statistics.median',
+                   wraps=statistics.median) as mock_median, \
+             median_cache_channel("UC_a"):
+            results = [calculate_median_from_analytics(channel_analytics, 'views') for _ in range(5)]
+            calculate_median_from_analytics(channel_analytics, 'estimatedMinutesWatched')
+        
+        assert results == [2.0] * 5
+        assert mock_median.call_count == 2
+        assert get_median_cache_stats() == {"hits": 4, "misses": 2, "entries": 2}
+    
+    def test_cache_is_keyed_by_window_and_channel(self):
+        """A different cap window or another channel id are computed separately."""
+        channel_a = {'views': {"2024-01-01": 1.0, "2024-01-02": 3.0}}
+        channel_b = {'views': {"2024-01-01": 5.0, "2024-01-02": 7.0}}
+        target = 'bitcast.validator.platforms.youtube.evaluation.score_cap.get_cap_period_dates'
+        with patch(target, return_value=("2024-01-01", "2024-01-02")):
+            with median_cache_channel("UC_a"):
+                assert calculate_median_from_analytics(channel_a, 'views') == 2.0
+            with median_cache_channel("UC_b"):
+                assert calculate_median_from_analytics(channel_b, 'views') == 6.0
+        with patch(target, return_value=("2024-01-02", "2024-01-02")), median_cache_channel("UC_a"):
+            assert calculate_median_from_analytics(channel_a, 'views') == 3.0
+        
+        assert get_median_cache_stats() == {"hits": 0, "misses": 3, "entries": 3}
+    
+    def test_no_channel_bound_is_not_cached(self):
+        """Without a bound channel id every call recomputes the median."""
+        with patch('bitcast.validator.platforms.youtube.evaluation.score_cap.get_cap_period_dates',
+                   return_value=("2024-01-01", "2024-01-01")):
+            assert calculate_median_from_analytics({'views': {"2024-01-01": 1.0}}, 'views') == 1.0
+            assert calculate_median_from_analytics({'views': {"2024-01-01": 9.0}}, 'views') == 9.0
+        
+        assert get_median_cache_stats() == {"hits": 0, "misses": 0, "entries": 0}
+    
+    def test_cycle_activation_clears_cache(self):
+        """Medians cached under one cycle are not served in the next."""
+        channel_analytics = {'views': {}}
+        try:
+            activate_cycle(CycleContext.create())
+            with median_cache_channel("UC_a"):
+                calculate_median_from_analytics(channel_analytics, 'views')
+                calculate_median_from_analytics(channel_analytics, 'views')
+                assert get_median_cache_stats()["entries"] == 1
+                
+                activate_cycle(CycleContext.create())
+                calculate_median_from_analytics(channel_analytics, 'views')
+        finally:
+            deactivate_cycle()
+        
+        assert get_median_cache_stats() == {"hits": 0, "misses": 1, "entries": 1}
+    
+    def test_reset_clears_cache(self):
+        """reset_median_cache starts a new cycle."""
+        channel_analytics = {'views': {}}
+        with median_cache_channel("UC_a"):
+            calculate_median_from_analytics(channel_analytics, 'views')
+            calculate_median_from_analytics(channel_analytics, 'views')
+        reset_median_cache()
+        
+        assert get_median_cache_stats() == {"hits": 0, "misses": 0, "entries": 0}
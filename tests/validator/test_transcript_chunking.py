@@ -0,0 +1,132 @@
+"""
+Tests for window-by-window evaluation of long transcripts.
+"""
+from threading import Lock
+from unittest.mock import patch
+
+from bitcast.validator.clients.base_client import crop_transcript, split_transcript
+# Imported at collection time, before conftest replaces the module attribute with a mock
+from bitcast.validator.clients.llm_client import evaluate_content_against_brief
+from bitcast.validator.utils.singleflight import SingleFlight
+
+
+class FakeCache(dict):
+    """Minimal stand-in for diskcache.Cache."""
+
+    def set(self, key, value, expire=None):
+        self[key] = value
+        return True
+
+
+class FakeClient:
+    """LLM client answering YES only for prompts containing a marker."""
+
+    BRIEF_EVALUATION_MODEL = "fake-model"
+    _inflight = SingleFlight("fake")
+
+    def __init__(self, marker):
+        self.marker = marker
+        self.prompts = []
+        self.cache = FakeCache()
+        self._cache_lock = Lock()
+
+    def get_cache(self):
+        return self.cache
+
+    def get_provider_name(self):
+        return "fake"
+
+    def record_calls_saved(self, count):
+        pass
+
+    def cache_set(self, key, value, expire=None):
+        return self.cache.set(key, value, expire=expire)
+
+    def cache_touch(self, key, expire=None):
+        return key in self.cache
+
+    def _make_request(self, model, **kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        self.prompts.append(prompt)
+        verdict = "YES" if self.marker in prompt else "NO"
+        return {"choices": [{"message": {"content": f"## Summary\nChecked.\n\n## Verdict\n{verdict}"}}]}
+
+
+BRIEF = {"id": "brief1", "brief": "Talk about bitcast", "format": "dedicated", "prompt_version": 4}
+
+
+def _evaluate(client, transcript, chunked=True):
+    with patch('bitcast.validator.clients.llm_client.get_llm_client', return_value=client), \
+         patch('bitcast.validator.clients.llm_client.DISABLE_LLM_CACHING', False), \
+         patch('bitcast.validator.clients.llm_client.TRANSCRIPT_CHUNKED_EVALUATION', chunked), \
+         patch('bitcast.validator.clients.llm_client.LLM_VALIDATION_STRATEGY', "all"), \
+         patch('bitcast.validator.clients.llm_client.split_transcript',
+               lambda t: split_transcript(t, window_length=100, overlap=10, max_windows=4)), \
+         patch('bitcast.validator.clients.llm_client.crop_transcript', lambda t: t[:100]):
+        return evaluate_content_against_brief(BRIEF, "PT10M", "description", transcript)
+
+
+class TestSplitTranscript:
+
+    def test_short_transcript_is_single_window(self):
+        assert split_transcript("abc", window_length=10, overlap=2) == ["abc"]
+
+    def test_first_window_matches_cropped_transcript(self):
+        transcript = "x" * 300000
+        assert split_transcript(transcript)[0] == crop_transcript(transcript)
+
+    def test_windows_overlap_and_cover_transcript(self):
+        transcript = "".join(chr(ord("a") + i % 26) for i in range(250))
+        windows = split_transcript(transcript, window_length=100, overlap=10, max_windows=10)
+
+        assert [len(w) for w in windows] == [100, 100, 70]
+        assert windows[0][-10:] == windows[1][:10]
+        assert windows[-1].endswith(transcript[-10:])
+
+    def test_window_count_is_capped(self):
+        windows = split_transcript("x" * 1000, window_length=100, overlap=0, max_windows=3)
+        assert len(windows) == 3
+
+
+class TestChunkedEvaluation:
+
+    def test_stops_at_first_matching_window(self):
+        transcript = "a" * 150 + "MARKER" + "b" * 300
+        client = FakeClient("MARKER")
+
+        meets_brief, _ = _evaluate(client, transcript)
+
+        assert meets_brief is True
+        # Window 1 (no marker) and window 2 (marker) evaluated, three calls each
+        assert len(client.prompts) == 6
+        assert len(client.cache) == 2
+
+    def test_no_match_evaluates_every_window(self):
+        transcript = "".join(chr(ord("a") + i % 26) for i in range(250))
+        client = FakeClient("MARKER")
+
+        meets_brief, _ = _evaluate(client, transcript)
+
+        assert meets_brief is False
+        assert len(client.prompts) == 9
+        assert all(v["meets_brief"] is False for v in client.cache.values())
+
+    def test_window_verdicts_are_served_from_cache(self):
+        transcript = "a" * 150 + "MARKER" + "b" * 300
+        client = FakeClient("MARKER")
+
+        _evaluate(client, transcript)
+        client.prompts.clear()
+        meets_brief, _ = _evaluate(client, transcript)
+
+        assert meets_brief is True
+        assert client.prompts == []
+
+    def test_disabled_crops_transcript(self):
+        transcript = "a" * 150 + "MARKER"
+        client = FakeClient("MARKER")
+
+        meets_brief, _ = _evaluate(client, transcript, chunked=False)
+
+        assert meets_brief is False
+        assert len(client.prompts) == 3
@@ -0,0 +1,127 @@
+"""
+Tests for the compiled Brief model.
+"""
+
+import pickle
+from datetime import datetime
+
+import pytest
+
+from bitcast.validator.clients.base_client import get_prompt_version
+from bitcast.validator.clients.prompts import get_latest_prompt_version
+from bitcast.validator.platforms.youtube.evaluation.video.brief_matching import (
+    check_brief_unique_identifier,
+    select_highest_priority_brief,
+)
+from bitcast.validator.platforms.youtube.evaluation.video.identifier_index import normalize_unique_identifier
+from bitcast.validator.platforms.youtube.evaluation.video.validation import (
+    check_brief_publish_date_range,
+    check_video_publish_date,
+    initialize_decision_details,
+)
+from bitcast.validator.utils.brief_model import Brief, compile_briefs, get_brief_date_range
+from bitcast.validator.utils.config import YT_VIDEO_RELEASE_BUFFER
+
+RAW_BRIEF = {
+    "id": "brief1",
+    "format": "ad-read",
+    "weight": 40,
+    "boost": 1.5,
+    "start_date": "2024-03-01",
+    "end_date": "2024-03-05",
+    "unique_identifier": "  Promo-CODE ",
+    "prompt_version": 3,
+}
+
+
+class TestBriefCompile:
+
+    def test_mapping_matches_raw_brief(self):
+        brief = Brief.compile(RAW_BRIEF)
+        assert brief == RAW_BRIEF
+        assert brief["id"] == "brief1"
+        assert brief.get("missing", "default") == "default"
+        assert dict(brief) == RAW_BRIEF
+        assert brief.to_dict() == RAW_BRIEF
+
+    def test_precomputed_fields(self):
+        brief = Brief.compile(RAW_BRIEF)
+        assert brief.id == "brief1"
+        assert brief.format == "ad-read"
+        assert brief.priority == 60
+        assert brief.identifier == "promo-code"
+        assert brief.prompt_version == 3
+        assert brief.publish_date_range == get_brief_date_range(RAW_BRIEF)
+        assert brief.publish_date_range[1] == datetime(2024, 3, 5, 23, 59, 59, 999999)
+
+    def test_defaults_for_minimal_brief(self):
+        brief = Brief.compile({"id": "minimal"})
+        assert brief.format == "dedicated"
+        assert brief.priority == 0
+        assert brief.identifier is None
+        assert brief.publish_date_range is None
+        assert brief.prompt_version == get_latest_prompt_version()
+
+    def test_malformed_fields_do_not_raise(self):
+        brief = Brief.compile({"id": "bad", "start_date": "not-a-date", "end_date": None, "weight": "x", "boost": "y"})
+        assert brief.publish_date_range is None
+        assert brief.priority == 0
+
+    def test_immutable_and_detached_from_source(self):
+        raw = dict(RAW_BRIEF)
+        brief = Brief.compile(raw)
+        raw["id"] = "changed"
+        assert brief["id"] == "brief1"
+        with pytest.raises(TypeError):
+            brief["id"] = "changed"
+        with pytest.raises(AttributeError):
+            brief.priority = 0
+
+    def test_compile_is_idempotent_and_picklable(self):
+        brief = Brief.compile(RAW_BRIEF)
+        assert Brief.compile(brief) is brief
+        restored = pickle.loads(pickle.dumps(brief))
+        assert restored == brief
+        assert restored.publish_date_range == brief.publish_date_range
+
+    def test_compile_briefs_keeps_order(self):
+        briefs = compile_briefs([{"id": "a"}, {"id": "b"}])
+        assert [brief.id for brief in briefs] == ["a", "b"]
+
+
+class TestCompiledBriefConsumers:
+    """Compiled briefs give the same answers as their raw dicts."""
+
+    @pytest.mark.parametrize("identifier", [None, "", "   ", "Promo-CODE"])
+    def test_identifier_check(self, identifier):
+        raw = {**RAW_BRIEF, "unique_identifier": identifier}
+        brief = Brief.compile(raw)
+        for description in ["use promo-code today", "no identifier here"]:
+            video_data = {"description": description}
+            assert check_brief_unique_identifier(video_data, brief) == check_brief_unique_identifier(video_data, raw)
+        assert normalize_unique_identifier(brief) == normalize_unique_identifier(raw)
+
+    def test_priority_selection(self):
+        raw_briefs = [{"id": "low", "weight": 10, "boost": 2.0}, {"id": "high", "weight": 30}]
+        matches = [True, True]
+        assert select_highest_priority_brief(compile_briefs(raw_briefs), matches) == \
+            select_highest_priority_brief(raw_briefs, matches)
+
+    def test_prompt_version(self):
+        assert get_prompt_version(Brief.compile(RAW_BRIEF)) == get_prompt_version(RAW_BRIEF)
+        assert get_prompt_version(Brief.compile({"id": "x"})) == get_latest_prompt_version()
+
+    @pytest.mark.parametrize("published_at", ["2024-03-05T23:00:00Z", "2024-03-06T00:00:01Z",
+                                              f"2024-02-{29 - YT_VIDEO_RELEASE_BUFFER:02d}T00:00:00Z"])
+    def test_publish_date_checks(self, published_at):
+        video_data = {"publishedAt": published_at}
+        brief = Brief.compile(RAW_BRIEF)
+        assert check_brief_publish_date_range(video_data, brief) == \
+            check_brief_publish_date_range(video_data, RAW_BRIEF)
+        assert check_video_publish_date(video_data, [brief], initialize_decision_details()) == \
+            check_video_publish_date(video_data, [RAW_BRIEF], initialize_decision_details())
+
+    def test_malformed_dates_still_fail_validation(self):
+        brief = Brief.compile({"id": "bad", "start_date": "not-a-date", "end_date": "2024-03-05"})
+        assert check_brief_publish_date_range({"publishedAt": "2024-03-05T00:00:00Z"}, brief) is False
+
@@ -0,0 +1,80 @@
+"""
+Tests for the frozen cycle clock.
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from bitcast.validator.platforms.youtube.evaluation.curve_based_scoring import _get_scoring_periods
+from bitcast.validator.platforms.youtube.evaluation.score_cap import get_cap_period_dates
+from bitcast.validator.platforms.youtube.evaluation.video.validation import (
+    check_brief_publish_date_range,
+    check_video_age_limit,
+)
+from bitcast.validator.utils.brief_model import get_brief_date_range
+from bitcast.validator.utils.cycle_context import (
+    CycleContext,
+    activate_cycle,
+    deactivate_cycle,
+    get_active_cycle,
+)
+
+CYCLE_NOW = datetime(2024, 3, 10, 23, 30)
+BRIEF = {"id": "brief1", "start_date": "2024-03-01", "end_date": "2024-03-05"}
+
+
+@pytest.fixture
+def active_cycle():
+    cycle = CycleContext.create([BRIEF, {"id": "broken", "start_date": "bad"}], now=CYCLE_NOW)
+    activate_cycle(cycle)
+    yield cycle
+    deactivate_cycle()
+
+
+class TestCycleContext:
+
+    def test_windows_match_unfrozen_computation(self):
+        """Precomputed windows equal what the scoring code derives from the same clock."""
+        cycle = CycleContext.create(now=CYCLE_NOW)
+
+        with patch('bitcast.validator.platforms.youtube.evaluation.curve_based_scoring.datetime') as mock_dt, \
+             patch('bitcast.validator.platforms.youtube.evaluation.score_cap.datetime') as mock_cap_dt:
+            mock_dt.now.return_value = CYCLE_NOW
+            mock_cap_dt.now.return_value = CYCLE_NOW
+            assert cycle.scoring_periods == _get_scoring_periods()
+            assert cycle.cap_period == get_cap_period_dates()
+
+    def test_brief_ranges_precomputed(self, active_cycle):
+        assert active_cycle.brief_date_range(BRIEF) == get_brief_date_range(BRIEF)
+        assert active_cycle.brief_date_range({"id": "broken", "start_date": "bad"}) is None
+        # A brief whose dates changed since the cycle started is not served from the snapshot
+        assert active_cycle.brief_date_range({**BRIEF, "end_date": "2024-03-09"}) is None
+
+    def test_context_is_immutable(self, active_cycle):
+        with pytest.raises(AttributeError):
+            active_cycle.now = datetime.now()
+
+
+class TestActiveCycle:
+
+    def test_scoring_uses_frozen_clock(self, active_cycle):
+        assert get_active_cycle() is active_cycle
+        assert _get_scoring_periods() == active_cycle.scoring_periods
+        assert get_cap_period_dates() == active_cycle.cap_period
+
+    def test_age_limit_uses_frozen_clock(self, active_cycle):
+        """A video that is too old today is still valid on the cycle's clock."""
+        video_data = {"publishedAt": "2024-02-25T12:00:00Z"}
+        assert check_video_age_limit(video_data, {}) is True
+        deactivate_cycle()
+        assert check_video_age_limit(video_data, {}) is False
+
+    def test_brief_date_range_check(self, active_cycle):
+        assert check_brief_publish_date_range({"publishedAt": "2024-03-05T22:00:00Z"}, BRIEF) is True
+        assert check_brief_publish_date_range({"publishedAt": "2024-03-06T00:00:01Z"}, BRIEF) is False
+        assert check_brief_publish_date_range({"publishedAt": "2024-03-06T00:00:01Z"}, {"id": "x"}) is False
+
+    def test_no_cycle_outside_evaluation(self):
+        assert get_active_cycle() is None
@@ -10,6 +10,7 @@ from datetime import datetime
 
 import bittensor as bt
 import aiohttp
+import numpy as np
 
 from bitcast.validator.utils.data_publisher import (
     DataPublisher,
@@ -91,6 +92,36 @@ class TestDataPublisher:
         expected_message = f"5GrwvaEF5zXb26Fz9rcQpDWS57CtERHpNehXCPcNoHGKutQY:2025-01-06T12:00:00:{json.dumps(account_data, sort_keys=True)}"
         self.mock_hotkey.sign.assert_called_once_with(data=expected_message)
     
+    @patch('bitcast.validator.utils.data_publisher.datetime')
+    def test_sign_message_bytes_matches_signed_payload(self, mock_datetime):
+        """The request body carries the same content as _sign_message and embeds the signed JSON as-is."""
+        mock_datetime.utcnow.return_value.isoformat.return_value = "2025-01-06T12:00:00"
+        mock_signature = Mock()
+        mock_signature.hex.return_value = "0x123456789abcdef"
+        self.mock_hotkey.sign.return_value = mock_signature
+        
+        payload_data = {
+            "account_id": "account_1",
+            "account_data": {
+                "videos": {"v1": {"views": np.int64(10), "weight": np.float32(0.5), "curve": np.array([1.0, 2.0])}},
+                "scores": {"brief1": np.float64(0.25)},
+                "success": np.bool_(True),
+            },
+        }
+        data = {"payload_type": "youtube", "run_id": "run_1", "payload": payload_data, "miner_uid": np.int64(7)}
+        
+        body = self.publisher._sign_message_bytes(data)
+        signed_message = self.mock_hotkey.sign.call_args.kwargs["data"]
+        signed_payload = self.publisher._sign_message(data)
+        
+        assert json.loads(body) == json.loads(json.dumps(signed_payload, default=bool))
+        prefix = f"{self.mock_hotkey.ss58_address}:2025-01-06T12:00:00:"
+        assert signed_message.startswith(prefix)
+        core_json = signed_message[len(prefix):]
+        assert core_json == json.dumps(json.loads(core_json), sort_keys=True)
+        assert f'"payload": {core_json}'.encode() in body
+        assert self.mock_hotkey.sign.call_args_list[0] == self.mock_hotkey.sign.call_args_list[1]
+    
     @patch('bitcast.validator.utils.data_publisher.bt')
     def test_log_success(self, mock_bt):
         """Test success logging."""
@@ -0,0 +1,62 @@
+"""
+Tests for the reward cycle memory instrumentation.
+"""
+
+import json
+import tracemalloc
+
+from bitcast.validator.utils.memory_profiler import MemoryProfiler
+
+
+def _profiler(tmp_path, **kwargs):
+    return MemoryProfiler("run_1", enabled=True, report_dir=str(tmp_path), **kwargs)
+
+
+class TestMemoryProfiler:
+
+    def test_disabled_profiler_records_nothing(self, tmp_path):
+        profiler = MemoryProfiler("run_1", enabled=False, report_dir=str(tmp_path))
+        profiler.checkpoint("start")
+        profiler.miner_evaluated(32)
+        assert profiler.finish() is None
+        assert profiler.checkpoints == []
+        assert list(tmp_path.iterdir()) == []
+
+    def test_checkpoints_written_to_run_report(self, tmp_path):
+        profiler = _profiler(tmp_path, top_n=3)
+        profiler.checkpoint("start")
+        retained = [bytearray(1024) for _ in range(2000)]
+        profiler.checkpoint("evaluate", miners=2)
+        path = profiler.finish()
+
+        assert not tracemalloc.is_tracing()
+        with open(path) as f:
+            report = json.load(f)
+        assert path.endswith("run_1.json")
+        assert report["run_id"] == "run_1"
+        assert [checkpoint["label"] for checkpoint in report["checkpoints"]] == ["start", "evaluate"]
+        evaluate = report["checkpoints"][1]
+        assert evaluate["miners"] == 2
+        assert len(evaluate["top"]) <= 3
+        assert evaluate["traced_mib"] >= 1.5
+        # The retained allocations are attributed to this test's source line
+        assert __file__ in evaluate["growth"][0]["where"]
+        assert report["peak_rss_mib"] == max(c["rss_mib"] for c in report["checkpoints"])
+        del retained
+
+    def test_checkpoint_every_n_miners(self, tmp_path):
+        profiler = _profiler(tmp_path, every_n_miners=2)
+        for miners_done in range(1, 6):
+            profiler.miner_evaluated(miners_done)
+        profiler.finish()
+        assert [checkpoint["label"] for checkpoint in profiler.checkpoints] == ["miners_2", "miners_4"]
+
+    def test_leaves_existing_tracing_running(self, tmp_path):
+        tracemalloc.start()
+        try:
+            profiler = _profiler(tmp_path)
+            profiler.checkpoint("start")
+            profiler.finish()
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
@@ -0,0 +1,169 @@
+"""
+Tests for spilling evaluation results to disk and the lazily built stats list.
+"""
+
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from bitcast.validator.reward_engine.models.evaluation_result import (
+    AccountResult,
+    EvaluationResult,
+    EvaluationResultCollection,
+)
+from bitcast.validator.reward_engine.models.stats_list import StatsList, set_stats_value
+from bitcast.validator.reward_engine.services.score_aggregation_service import ScoreAggregationService
+from bitcast.validator.reward_engine.services.weight_corrections_service import WeightCorrectionsService
+from bitcast.validator.utils.result_store import ResultStore
+
+BRIEFS = [{"id": "brief1"}, {"id": "brief2"}]
+
+
+def _collection(store=None):
+    collection = EvaluationResultCollection(store=store)
+    for uid in (0, 1, 2):
+        result = EvaluationResult(
+            uid=uid, platform="youtube",
+            aggregated_scores={"brief1": float(uid), "brief2": 0.0},
+            metagraph_info={"stake": 10.0 * uid} if uid else {},
+        )
+        if uid:
+            result.add_account_result("account_1", AccountResult(
+                account_id="account_1",
+                platform_data={"channel_id": f"channel_{uid}"},
+                videos={f"video_{uid}": {
+                    "details": {"bitcastVideoId": f"bitcast_{uid}"},
+                    "brief_metrics": {"brief1": {"weight": 1.0}},
+                }},
+                scores={"brief1": float(uid), "brief2": 0.5},
+                performance_stats={"views": 100 * uid},
+                success=True,
+            ))
+        collection.add_result(uid, result)
+    return collection
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ResultStore(str(tmp_path), "run_1")
+
+
+class TestResultStore:
+
+    def test_round_trip(self, store):
+        account_results = _collection().get_result(1).account_results
+        store.save(1, account_results)
+        assert store.load(1) == account_results
+        assert os.listdir(store.path) == ["1.pkl"]
+
+    def test_new_run_removes_previous_runs(self, tmp_path, store):
+        store.save(1, {})
+        ResultStore(str(tmp_path), "run_2")
+        assert os.listdir(tmp_path) == ["run_2"]
+
+
+class TestSpill:
+
+    def test_spill_keeps_only_scores_in_memory(self, store):
+        collection = _collection(store)
+        full = collection.get_result(1).account_results["account_1"]
+
+        assert collection.spill(1) is True
+        assert collection.spill(0) is False  # burn UID has no accounts
+        summary = collection.get_result(1).account_results["account_1"]
+        assert summary.scores == full.scores
+        assert summary.videos == {} and summary.platform_data == {}
+        assert collection.get_account_results(1) == {"account_1": full}
+
+    def test_spill_without_store_is_a_no_op(self):
+        collection = _collection()
+        assert collection.spill(1) is False
+        assert collection.is_spilled(1) is False
+
+    def test_aggregation_and_corrections_unchanged(self, store):
+        in_memory, spilled = _collection(), _collection(store)
+        for uid in (0, 1, 2):
+            spilled.spill(uid)
+
+        aggregator = ScoreAggregationService()
+        np.testing.assert_array_equal(
+            aggregator.aggregate_scores(spilled, BRIEFS).matrix,
+            aggregator.aggregate_scores(in_memory, BRIEFS).matrix,
+        )
+        weights = np.ones((3, 2))
+        corrections = WeightCorrectionsService()
+        assert corrections.calculate_corrections(spilled, weights, weights, BRIEFS) == \
+            corrections.calculate_corrections(in_memory, weights, weights, BRIEFS)
+
+
+class TestStatsList:
+
+    def _expected(self, collection, uid):
+        result = collection.get_result(uid)
+        stats = {"scores": result.aggregated_scores, "uid": uid}
+        for account_id, account in collection.get_account_results(uid).items():
+            stats[account_id] = {
+                "yt_account": account.platform_data,
+                "videos": account.videos,
+                "scores": account.scores,
+                "performance_stats": account.performance_stats,
+            }
+        if result.metagraph_info:
+            stats["metagraph"] = result.metagraph_info
+        return stats
+
+    @pytest.mark.parametrize("spill", [False, True])
+    def test_entries_match_eager_layout(self, store, spill):
+        collection = _collection(store if spill else None)
+        expected = [self._expected(collection, uid) for uid in (0, 1, 2)]
+        for uid in (0, 1, 2):
+            collection.spill(uid)
+
+        stats_list = StatsList([0, 1, 2, 99], collection, {"brief_emission_percentages": {"brief1": 1.0}})
+
+        assert len(stats_list) == 4
+        assert stats_list[0] == {**expected[0], "brief_emission_percentages": {"brief1": 1.0}}
+        assert list(stats_list)[1:3] == expected[1:]
+        assert stats_list[-1] == {"scores": {}, "uid": 99}
+
+    @pytest.mark.parametrize("spill", [False, True])
+    def test_released_accounts_are_not_retained(self, store, spill):
+        collection = _collection(store if spill else None)
+        expected = self._expected(collection, 0)
+        collection.spill(0)
+        stats_list = StatsList([0], collection)
+
+        for result in collection.results.values():
+            result.account_results = {}
+
+        if spill:
+            # Spilled details are still read back from the store
+            assert stats_list[0] == expected
+        else:
+            assert stats_list[0] == {key: expected[key] for key in ("scores", "uid", "metagraph") if key in expected}
+
+    def test_set_extra_does_not_build_entries(self):
+        stats_list = StatsList([0, 1], _collection())
+        with patch.object(StatsList, "_build", side_effect=AssertionError("entry built")):
+            for i, reward in enumerate([0.25, 0.75]):
+                set_stats_value(stats_list, i, "reward", reward)
+            set_stats_value(stats_list, -1, "llm_usage", {"requests": 3})
+
+        assert [stats["reward"] for stats in stats_list] == [0.25, 0.75]
+        assert stats_list[1]["llm_usage"] == {"requests": 3}
+
+        plain = [{"uid": 0}]
+        set_stats_value(plain, 0, "reward", 1.0)
+        assert plain == [{"uid": 0, "reward": 1.0}]
+
+    def test_assigned_keys_are_kept(self):
+        stats_list = StatsList([0, 1], _collection())
+        for i, reward in enumerate([0.25, 0.75]):
+            stats_list[i]["reward"] = reward
+        stats_list[0]["llm_usage"] = {"requests": 3}
+
+        assert [stats["reward"] for stats in stats_list] == [0.25, 0.75]
+        assert stats_list[0]["llm_usage"] == {"requests": 3}
+        assert "llm_usage" not in stats_list[1]
@@ -0,0 +1,104 @@
+"""
+Tests for in-process request coalescing.
+"""
+import threading
+
+from bitcast.validator.utils.singleflight import SingleFlight, request_digest
+
+
+def _run_concurrently(flight, key, fn, callers):
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flight.do(key, fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_identical_calls_share_one_execution():
+    flight = SingleFlight("test")
+    calls = []
+
+    def slow():
+        calls.append(1)
+        # Stay in flight until every follower has joined
+        while flight.stats()["coalesced"] < 4:
+            pass
+        return "result"
+
+    results, errors = _run_concurrently(flight, "key", slow, callers=5)
+
+    assert errors == []
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert flight.stats() == {"executed": 1, "coalesced": 4}
+
+
+def test_errors_are_shared_with_waiters():
+    flight = SingleFlight("test")
+
+    def failing():
+        while flight.stats()["coalesced"] < 2:
+            pass
+        raise ValueError("boom")
+
+    results, errors = _run_concurrently(flight, "key", failing, callers=3)
+
+    assert results == []
+    assert len(errors) == 3 and all(isinstance(e, ValueError) for e in errors)
+
+
+def test_sequential_calls_are_not_coalesced():
+    flight = SingleFlight("test")
+
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+    assert flight.stats() == {"executed": 2, "coalesced": 0}
+
+    flight.reset_stats()
+    assert flight.stats() == {"executed": 0, "coalesced": 0}
+
+
+def test_request_digest_is_stable_and_part_sensitive():
+    assert request_digest("a", "b") == request_digest("a", "b")
+    assert request_digest("a", "b") != request_digest("ab")
+    assert request_digest("a", "b") != request_digest("b", "a")
+
+
+def test_concurrent_transcript_fetches_are_coalesced(mock_external_apis):
+    from bitcast.validator.platforms.youtube.api import transcript
+
+    release = threading.Event()
+
+    def fetch(video_id, key):
+        release.wait(timeout=5)
+        return [{"text": f"transcript for {video_id}"}]
+
+    mock_external_apis['transcript'].side_effect = fetch
+    before = transcript.get_transcript_coalesced_count()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(transcript.get_video_transcript("vid1", "key")))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    while transcript.get_transcript_coalesced_count() - before < 2:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert mock_external_apis['transcript'].call_count == 1
+    assert results == [[{"text": "transcript for vid1"}]] * 3
+
+    transcript.reset_transcript_coalesced_count()
+    assert transcript.get_transcript_coalesced_count() == 0
@@ -0,0 +1,172 @@
+"""
+Tests for the cycle pricing snapshot.
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from bitcast.validator.platforms.youtube.main import _calculate_per_video_metrics
+from bitcast.validator.reward_engine.orchestrator import RewardOrchestrator
+from bitcast.validator.reward_engine.services.emission_calculation_service import EmissionCalculationService
+from bitcast.validator.utils.cycle_context import CycleContext, activate_cycle, deactivate_cycle
+from bitcast.validator.utils.token_pricing import (
+    ChainPricingProvider,
+    PricingProvider,
+    PricingSnapshotService,
+    StaticPricingProvider,
+    get_total_miner_emissions,
+)
+
+
+class FlakyPricingProvider(PricingProvider):
+    """Local fake: returns increasing prices and fails on demand."""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def get_snapshot(self):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("chain unavailable")
+        return StaticPricingProvider(float(self.calls), 1000.0).get_snapshot()
+
+
+class TestPricingSnapshotService:
+
+    def test_snapshot_taken_once_until_refreshed(self):
+        provider = FlakyPricingProvider()
+        service = PricingSnapshotService(provider, refresh_interval=3600)
+        assert service.get_snapshot().alpha_price_usd == 1.0
+        assert service.get_snapshot().alpha_price_usd == 1.0
+        assert provider.calls == 1
+
+        assert service.refresh() is True
+        assert service.get_snapshot().alpha_price_usd == 2.0
+        assert service.snapshot_age() is not None
+
+    def test_failed_refresh_keeps_last_good_snapshot(self):
+        provider = FlakyPricingProvider()
+        service = PricingSnapshotService(provider, refresh_interval=3600)
+        first = service.get_snapshot()
+        provider.fail = True
+        assert service.refresh() is False
+        assert service.get_snapshot() is first
+
+    def test_no_snapshot_when_pricing_unavailable(self):
+        provider = FlakyPricingProvider()
+        provider.fail = True
+        assert PricingSnapshotService(provider).get_snapshot() is None
+
+    def test_background_refresh(self):
+        provider = FlakyPricingProvider()
+        service = PricingSnapshotService(provider, refresh_interval=3600)
+        service.start()
+        try:
+            deadline = time.monotonic() + 2
+            while service.snapshot_age() is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert service.get_snapshot() is not None
+            assert provider.calls == 1
+        finally:
+            service.stop()
+
+    def test_snapshot_older_than_max_age_is_refreshed_synchronously(self):
+        provider = FlakyPricingProvider()
+        service = PricingSnapshotService(provider, refresh_interval=3600, max_age=60)
+        service.get_snapshot()
+        service._refreshed_at -= 120
+
+        assert service.get_snapshot().alpha_price_usd == 2.0
+        assert provider.calls == 2
+
+    def test_stale_snapshot_not_served_when_refresh_fails(self):
+        provider = FlakyPricingProvider()
+        service = PricingSnapshotService(provider, refresh_interval=3600, max_age=60)
+        service.get_snapshot()
+        provider.fail = True
+
+        assert service.get_snapshot() is not None
+        service._refreshed_at -= 120
+        assert service.get_snapshot() is None
+
+    def test_chain_provider_reuses_subtensor(self):
+        subtensor = MagicMock()
+        subtensor.subnet.return_value.alpha_out_emission = 2.0
+        subtensor.get_mechanism_emission_split.return_value = [1, 1]
+
+        with patch('bitcast.validator.utils.token_pricing.bt.Subtensor') as new_subtensor, \
+             patch('bitcast.validator.utils.token_pricing.requests.get') as price_request:
+            price_request.return_value.json.return_value = {"bitcast": {"usd": 3.0}}
+            provider = ChainPricingProvider(subtensor=subtensor)
+            first = provider.get_snapshot()
+            subtensor.subnet.return_value.alpha_out_emission = 4.0
+            second = provider.get_snapshot()
+            new_subtensor.assert_not_called()
+
+        # Every snapshot reaches the chain instead of a memoized value
+        assert first.total_daily_alpha == 7200 * 2.0 * 0.41 * 0.5
+        assert second.total_daily_alpha == 7200 * 4.0 * 0.41 * 0.5
+        assert first.alpha_price_usd == 3.0
+        assert price_request.call_count == 2
+
+    def test_chain_provider_reconnects_after_failure(self):
+        dead = MagicMock()
+        dead.subnet.side_effect = ConnectionError("websocket closed")
+        fresh = MagicMock()
+        fresh.subnet.return_value.alpha_out_emission = 2.0
+        fresh.get_mechanism_emission_split.return_value = [1, 1]
+
+        with patch('bitcast.validator.utils.token_pricing.bt.Subtensor', return_value=fresh) as new_subtensor, \
+             patch('bitcast.validator.utils.token_pricing.fetch_bitcast_alpha_price', return_value=1.0), \
+             patch('bitcast.validator.utils.token_pricing.fetch_total_miner_emissions',
+                   side_effect=lambda subtensor: float(subtensor.subnet(netuid=93).alpha_out_emission)):
+            provider = ChainPricingProvider(subtensor=dead)
+            with pytest.raises(ConnectionError):
+                provider.get_snapshot()
+            snapshot = provider.get_snapshot()
+
+        dead.close.assert_called_once()
+        new_subtensor.assert_called_once_with(network="finney")
+        assert snapshot.total_daily_alpha == 2.0
+
+
+class TestCyclePricing:
+
+    def _activate(self, alpha_price_usd, total_daily_alpha):
+        pricing = StaticPricingProvider(alpha_price_usd, total_daily_alpha).get_snapshot()
+        activate_cycle(CycleContext.create(pricing=pricing))
+
+    def test_per_video_metrics_use_cycle_snapshot(self):
+        self._activate(2.0, 500.0)
+        try:
+            with patch('bitcast.validator.platforms.youtube.main.get_bitcast_alpha_price') as price, \
+                 patch('bitcast.validator.platforms.youtube.main.get_total_miner_emissions') as emissions:
+                metrics = _calculate_per_video_metrics(1.0, 400, 1.0, 0.0, 1000.0, 0)
+                price.assert_not_called()
+                emissions.assert_not_called()
+        finally:
+            deactivate_cycle()
+        assert metrics["alpha_target"] == metrics["usd_target"] / 2.0
+        assert metrics["weight"] == metrics["usd_target"] / 1000.0
+
+    def test_emission_conversion_uses_cycle_snapshot(self):
+        self._activate(4.0, 250.0)
+        try:
+            raw_weights = EmissionCalculationService()._calculate_raw_weights(np.array([[100.0, 50.0]]))
+        finally:
+            deactivate_cycle()
+        assert raw_weights.tolist() == [[0.1, 0.05]]
+
+    def test_orchestrator_snapshots_synchronously_without_refresher(self):
+        provider = FlakyPricingProvider()
+        with patch('bitcast.validator.reward_engine.orchestrator.get_pricing_service', return_value=None), \
+             patch('bitcast.validator.reward_engine.orchestrator.ChainPricingProvider', return_value=provider):
+            orchestrator = RewardOrchestrator()
+            first = orchestrator._get_pricing_snapshot()
+            second = orchestrator._get_pricing_snapshot()
+        assert (first.alpha_price_usd, second.alpha_price_usd) == (1.0, 2.0)
+        assert provider.calls == 2